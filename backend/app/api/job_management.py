@@ -4,28 +4,47 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.db.session import get_db
 from app.db.models import Job
+from app.api.schemas import JobPage
+from app.services.skill_extraction import extract_skills
+from app.services.job_events import job_saved, job_deleted
+from app.services.match_store import bump_catalog_version
+from app.services.pagination import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX, InvalidCursor, keyset_page
 
 router = APIRouter(
     prefix="/recruiter",
     tags=["Job Management"]
 )
 
-@router.get("/jobs")
+# Columns rendered by job lists (the description is served by GET /jobs/{job_id})
+JOB_SUMMARY_COLUMNS = [
+    Job.id,
+    Job.recruiter_id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.job_type,
+    Job.job_status,
+    Job.created_at,
+]
+
+@router.get("/jobs", response_model=JobPage)
 async def get_jobs(
     db: Session = Depends(get_db),
-    # limit: int = Query(20, ge=1, le=100, description="Number of jobs to return"),
-    # offset: int = Query(0, ge=0, description="Number of jobs to skip (for pagination)")
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Number of jobs to return"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
 ):
-    
-    jobs = (
-        db.query(Job)
-        .order_by(Job.id.desc())  # or Job.created_at.desc() if you have it
-        # .limit(limit)
-        # .offset(offset)
-        .all()
-    )
+    # Newest first; keyset on (created_at, id)
+    try:
+        jobs, next_cursor = keyset_page(
+            db.query(*JOB_SUMMARY_COLUMNS), [Job.created_at, Job.id], limit, cursor
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return jobs
+    return {
+        "jobs": jobs,
+        "next_cursor": next_cursor,
+    }
 
 @router.get("/jobs/{job_id}")  
 async def get_job_by_job_id(job_id: int, db: Session = Depends(get_db)):
@@ -108,10 +127,13 @@ async def update_job(
     job.job_status = job_status
     job.location = location
     job.job_type = job_type
+    job.skills_json = extract_skills(description)
 
     db.add(job)
+    bump_catalog_version(db)
     db.commit()
     db.refresh(job)
+    job_saved(job)
 
     
     # try:
@@ -153,12 +175,15 @@ async def create_job(
         company=company,
         location = location,
         job_type = job_type,
-        job_status=job_status
+        job_status=job_status,
+        skills_json=extract_skills(description)
     )
 
     db.add(job)
+    bump_catalog_version(db)
     db.commit()
     db.refresh(job)
+    job_saved(job)
 
     return {
         "message": "Job created successfully",
@@ -182,6 +207,7 @@ async def delete_job(
 
     try:
         db.delete(job)
+        bump_catalog_version(db)
         db.commit()
     except IntegrityError:
         db.rollback()
@@ -194,5 +220,7 @@ async def delete_job(
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete job due to a database error")
 
+    job_deleted(job_id)
+
     # 204 No Content (empty body)
     return
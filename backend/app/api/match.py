@@ -1,12 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.db.models import Resume, Job, Application
+from app.api.schemas import ApplicationPage
 from app.services.matching_service import (
-    match_resume_to_job,
-    compute_semantic_score,
+    match_skill_sets,
+    compute_semantic_scores_for_jobs_async,
+    get_job_skills,
+    get_resume_skills,
+    rank_jobs_for_resume_async,
+    load_ranked_jobs,
 )
+from app.services.job_catalog import get_job_catalog
+from app.services.job_filters import ACTIVE_JOBS, JobFilters
+from app.services.match_store import get_catalog_version, read_top_matches
+from app.services.match_worker import match_worker
+from app.services.recommendation_cache import RECOMMEND_CACHE_DEPTH, recommendation_cache
+from app.services.application_stats import application_added, application_removed
+from app.services.pagination import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX, InvalidCursor, keyset_page
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -16,15 +29,21 @@ router = APIRouter(
 )
 
 # ==================================================
-# 1️⃣ RECOMMENDED JOBS (LEAN, UI-FRIENDLY)
+# 🔐 Helper: only parsed resumes can be matched
 # ==================================================
-@router.get("/recommended-jobs")
-def get_recommended_jobs(
-    user_id: int = Query(...),
-    resume_id: int = Query(...),
-    limit: int = Query(5, ge=1, le=50),
-    db: Session = Depends(get_db),
-):
+def ensure_resume_ready(resume: Resume):
+    if resume.status != "ready":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Resume is {resume.status}; matching needs a processed resume",
+        )
+
+
+# ==================================================
+# 🧵 Blocking DB work of the async endpoints
+#    (run via run_in_threadpool; only the search calls are awaited)
+# ==================================================
+def load_ready_resume(db: Session, resume_id: int, user_id: int) -> Resume:
     resume = (
         db.query(Resume)
         .filter(Resume.id == resume_id, Resume.user_id == user_id)
@@ -32,34 +51,107 @@ def get_recommended_jobs(
     )
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
+    ensure_resume_ready(resume)
+    return resume
 
-    # 🔹 Azure semantic scores
-    semantic_scores = compute_semantic_score(resume.parsed_text, top_k=50)
-    if not semantic_scores:
-        return {"recommended_jobs": []}
 
-    jobs = (
-        db.query(Job)
-        .filter(Job.id.in_(semantic_scores.keys()))
-        .all()
-    )
+def load_resume_and_job(db: Session, resume_id: int, user_id: int, job_id: int) -> tuple[Resume, Job]:
+    resume = load_ready_resume(db, resume_id, user_id)
 
-    recommendations = []
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    for job in jobs:
-        skill_result = match_resume_to_job(
-            resume_text=resume.parsed_text,
-            job_description=job.description
-        )
+    return resume, job
 
-        semantic_score = semantic_scores.get(job.id, 0.0)
 
-        fit_score = round(
-            0.6 * skill_result["skill_score"] +
-            0.4 * semantic_score,
-            2
-        )
+def excluded_by_filters(db: Session, filters: JobFilters) -> int:
+    return get_job_catalog(db).excluded_count(filters)
+
+
+def save_application(db: Session, application: Application) -> Application:
+    db.add(application)
+    db.flush()  # lock order: applications, then application_counts
+    application_added(db, application.job_id, application.application_status, application.fit_score)
+    db.commit()
+    db.refresh(application)
+    return application
+
+
+# ==================================================
+# 1️⃣ RECOMMENDED JOBS (LEAN, UI-FRIENDLY)
+# ==================================================
+@router.get("/recommended-jobs")
+async def get_recommended_jobs(
+    user_id: int = Query(...),
+    resume_id: int = Query(...),
+    limit: int = Query(5, ge=1, le=RECOMMEND_CACHE_DEPTH),
+    job_type: str | None = Query(None),
+    location: str | None = Query(None),
+    db: Session = Depends(get_db),
+):
+    filters = JobFilters(job_type=job_type, location=location)
+    catalog_version = await run_in_threadpool(get_catalog_version, db)
+
+    # 🔹 Cached ranked list for this resume, filter set and catalog version
+    cached = recommendation_cache.get(resume_id, catalog_version, filters)
+    if cached is not None and cached[0] == user_id:
+        result = cached[1]
+    else:
+        resume = await run_in_threadpool(load_ready_resume, db, resume_id, user_id)
+
+        result = await rank_recommendations(db, resume, catalog_version, filters)
+        if result["scores_catalog_version"] == catalog_version and not result["partial"]:
+            recommendation_cache.put(resume_id, catalog_version, user_id, result, filters)
+
+    return {
+        "user_id": user_id,
+        "resume_id": resume_id,
+        "scores_computed_at": result["scores_computed_at"],
+        "scores_catalog_version": result["scores_catalog_version"],
+        "catalog_version": catalog_version,
+        "partial": result["partial"],
+        "excluded_by_filters": await run_in_threadpool(excluded_by_filters, db, filters),
+        "recommended_jobs": result["recommended_jobs"][:limit],
+    }
 
+
+async def rank_recommendations(
+    db: Session,
+    resume: Resume,
+    catalog_version: int,
+    filters: JobFilters = ACTIVE_JOBS,
+) -> dict:
+    """
+    Full-depth recommendation list (RECOMMEND_CACHE_DEPTH job cards).
+    """
+    depth = RECOMMEND_CACHE_DEPTH
+
+    # 🔹 Precomputed scores: indexed read of match_scores (active jobs only,
+    #    so narrower filters are ranked live against the filtered catalog)
+    if filters == ACTIVE_JOBS:
+        matches = await run_in_threadpool(read_top_matches, db, resume.id, depth)
+    else:
+        matches = []
+
+    partial = False
+    if matches:
+        computed_at = min(score.computed_at for _, score in matches)
+        scores_version = min(score.catalog_version for _, score in matches)
+        if scores_version < catalog_version:
+            match_worker.enqueue_resume(resume.id)  # serve stale, refresh in background
+        ranked_jobs = [(job, {"fit_score": score.fit_score}) for job, score in matches]
+    else:
+        # 🔹 Not materialized (or filtered): rank live (two-stage)
+        if filters == ACTIVE_JOBS:
+            match_worker.enqueue_resume(resume.id)
+        computed_at, scores_version = None, catalog_version
+        ranked, partial = await rank_jobs_for_resume_async(db, resume, depth, filters)
+        ranked_jobs = await run_in_threadpool(load_ranked_jobs, db, ranked, filters)
+
+    recommendations = []
+
+    for job, scores in ranked_jobs:
         # ✅ ONLY what job cards need
         recommendations.append({
             "job_id": job.id,
@@ -69,15 +161,14 @@ def get_recommended_jobs(
             "location": job.location,
             "job_type": job.job_type,
             "job status": job.job_status,
-            "fit_score": fit_score,
+            "fit_score": scores["fit_score"],
         })
 
-    recommendations.sort(key=lambda x: x["fit_score"], reverse=True)
-
     return {
-        "user_id": user_id,
-        "resume_id": resume_id,
-        "recommended_jobs": recommendations[:limit]
+        "scores_computed_at": computed_at,
+        "scores_catalog_version": scores_version,
+        "partial": partial,
+        "recommended_jobs": recommendations,
     }
 
 
@@ -85,32 +176,24 @@ def get_recommended_jobs(
 # 2️⃣ SKILL ANALYSIS (FULL BREAKDOWN)
 # ==================================================
 @router.get("/jobs/{job_id}/skill-analysis")
-def get_job_skill_analysis(
+async def get_job_skill_analysis(
     job_id: int,
     user_id: int = Query(...),
     resume_id: int = Query(...),
     db: Session = Depends(get_db),
 ):
-    resume = (
-        db.query(Resume)
-        .filter(Resume.id == resume_id, Resume.user_id == user_id)
-        .first()
-    )
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    resume, job = await run_in_threadpool(load_resume_and_job, db, resume_id, user_id, job_id)
 
     # Skill-based analysis
-    skill_result = match_resume_to_job(
-        resume_text=resume.parsed_text,
-        job_description=job.description
+    skill_result = match_skill_sets(
+        get_resume_skills(resume),
+        get_job_skills(job)
     )
 
-    # Semantic score ONLY for this job
-    semantic_scores = compute_semantic_score(resume.parsed_text, top_k=20)
+    # Exact semantic score for this job (whatever its rank)
+    semantic_scores, _ = await compute_semantic_scores_for_jobs_async(
+        resume.parsed_text, [job_id]
+    )
     semantic_score = semantic_scores.get(job_id, 0.0)
 
     fit_score = round(
@@ -135,30 +218,22 @@ def get_job_skill_analysis(
 # 3️⃣ APPLY FOR JOB (SNAPSHOT STORED)
 # ==================================================
 @router.post("/jobs/{job_id}/apply")
-def apply_for_job(
+async def apply_for_job(
     job_id: int,
     user_id: int = Query(...),
     resume_id: int = Query(...),
     db: Session = Depends(get_db),
 ):
-    resume = (
-        db.query(Resume)
-        .filter(Resume.id == resume_id, Resume.user_id == user_id)
-        .first()
-    )
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    resume, job = await run_in_threadpool(load_resume_and_job, db, resume_id, user_id, job_id)
 
-    skill_result = match_resume_to_job(
-        resume_text=resume.parsed_text,
-        job_description=job.description
+    skill_result = match_skill_sets(
+        get_resume_skills(resume),
+        get_job_skills(job)
     )
 
-    semantic_scores = compute_semantic_score(resume.parsed_text, top_k=20)
+    semantic_scores, _ = await compute_semantic_scores_for_jobs_async(
+        resume.parsed_text, [job_id]
+    )
     semantic_score = semantic_scores.get(job_id, 0.0)
 
     fit_score = round(
@@ -178,30 +253,51 @@ def apply_for_job(
         application_status="applied"
     )
 
-    db.add(application)
-    db.commit()
-    db.refresh(application)
+    application = await run_in_threadpool(save_application, db, application)
 
     return {
         "message": "Application submitted successfully",
         "application_id": application.id,
     }
 
-@router.get("/applications")
-async def show_applied_jobs(user_id: int, db: Session = Depends(get_db)):
-    apps = (
-            db.query(Application)
-            .filter(Application.user_id == user_id)
-            .all()
+@router.get("/applications", response_model=ApplicationPage)
+def show_applied_jobs(
+    user_id: int,
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
+    # Most recent first; keyset on (applied_at, id)
+    try:
+        apps, next_cursor = keyset_page(
+            db.query(
+                Application.id,
+                Application.user_id,
+                Application.job_id,
+                Application.fit_score,
+                Application.skill_score,
+                Application.semantic_score,
+                Application.application_status,
+                Application.applied_at,
+            ).filter(Application.user_id == user_id),
+            [Application.applied_at, Application.id],
+            limit,
+            cursor,
         )
-    return apps
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return {
+        "applications": apps,
+        "next_cursor": next_cursor,
+    }
 
 @router.delete(
     "/{application_id}/hard",
     summary="Hard delete an application",
     status_code=status.HTTP_200_OK
 )
-async def delete_application_hard(
+def delete_application_hard(
     application_id: int = Path(..., gt=0),
     db: Session = Depends(get_db),
     # current_user = Depends(get_current_user),
@@ -218,6 +314,8 @@ async def delete_application_hard(
 
     try:
         db.delete(application)
+        db.flush()  # lock order: applications, then application_counts
+        application_removed(db, application.job_id, application.application_status, application.fit_score)
         db.commit()
     except IntegrityError:
         db.rollback()
@@ -1,11 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from app.db.session import get_db
-from app.db.models import Application, User
+from app.db.models import Application, Job, User
+from app.api.schemas import ApplicantPage
 from app.auth.deps import get_current_user
 from app.auth.security import TokenData
+from app.services.matching_service import rank_candidates_for_job_async
+from app.services.match_worker import match_worker
+from app.services.application_stats import (
+    HISTOGRAM_DEFAULT_EDGES,
+    application_status_changed,
+    read_status_counts,
+    fit_score_bands,
+    fit_score_histogram,
+)
+from app.services.pagination import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX, InvalidCursor, keyset_page
 
 
 router = APIRouter(
@@ -24,6 +35,25 @@ def ensure_recruiter(current_user: TokenData):
         )
 
 
+# ==================================================
+# 🧵 Blocking DB work of the async endpoints
+# ==================================================
+def load_job(db: Session, job_id: int) -> Job:
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def load_users(db: Session, user_ids: list[int]) -> dict:
+    return {
+        user.id: user
+        for user in db.query(User.id, User.first_name, User.last_name)
+        .filter(User.id.in_(user_ids))
+        .all()
+    }
+
+
 # ==================================================
 # 1️⃣ OVERALL APPLICATION SUMMARY
 # ==================================================
@@ -34,13 +64,8 @@ def dashboard_summary(
 ):
     ensure_recruiter(current_user)
 
-    total = db.query(Application).count()
-
-    status_counts = (
-        db.query(Application.application_status, func.count(Application.id))
-        .group_by(Application.application_status)
-        .all()
-    )
+    # Rollup rows, maintained on every application write
+    total, status_counts = read_status_counts(db)
 
     response = {
         "total_applications": total,
@@ -51,7 +76,7 @@ def dashboard_summary(
         "rejected": 0,
     }
 
-    for status_name, count in status_counts:
+    for status_name, count in status_counts.items():
         if status_name in response:
             response[status_name] = count
 
@@ -69,18 +94,7 @@ def get_particular_job_application_summary(
 ):
     ensure_recruiter(current_user)
 
-    total = (
-        db.query(Application)
-        .filter(Application.job_id == job_id)
-        .count()
-    )
-
-    status_counts = (
-        db.query(Application.application_status, func.count(Application.id))
-        .filter(Application.job_id == job_id)
-        .group_by(Application.application_status)
-        .all()
-    )
+    total, status_counts = read_status_counts(db, job_id)
 
     response = {
         "job_id": job_id,
@@ -92,7 +106,7 @@ def get_particular_job_application_summary(
         "rejected": 0,
     }
 
-    for status_name, count in status_counts:
+    for status_name, count in status_counts.items():
         if status_name in response:
             response[status_name] = count
 
@@ -109,26 +123,14 @@ def overall_fit_score_distribution(
 ):
     ensure_recruiter(current_user)
 
-    applications = db.query(Application).all()
-
-    strong = 0
-    good = 0
-    average = 0
-
-    for app in applications:
-        if app.fit_score >= 80:
-            strong += 1
-        elif app.fit_score >= 60:
-            good += 1
-        else:
-            average += 1
+    total, bands = fit_score_bands(db)
 
     return {
-        "total_applications": len(applications),
+        "total_applications": total,
         "fit_score_distribution": {
-            "strong": strong,
-            "good": good,
-            "average": average,
+            "strong": bands["strong"],
+            "good": bands["good"],
+            "average": bands["average"],
         },
     }
 
@@ -144,36 +146,50 @@ def job_fit_score_distribution(
 ):
     ensure_recruiter(current_user)
 
-    applications = (
-        db.query(Application)
-        .filter(Application.job_id == job_id)
-        .all()
-    )
+    total, bands = fit_score_bands(db, job_id)
 
-    if not applications:
+    if not total:
         raise HTTPException(
             status_code=404,
             detail="No applications found for this job",
         )
 
-    strong = 0
-    good = 0
-
-    for app in applications:
-        if app.fit_score >= 80:
-            strong += 1
-        elif app.fit_score >= 60:
-            good += 1
-
     return {
         "job_id": job_id,
         "fit_score_distribution": {
-            "strong": strong,
-            "good": good,
+            "strong": bands["strong"],
+            "good": bands["good"],
         },
     }
 
 
+# ==================================================
+# 4️⃣b FIT SCORE HISTOGRAM (CONFIGURABLE BUCKETS)
+# ==================================================
+@router.get("/fit-score-histogram")
+def get_fit_score_histogram(
+    edges: list[float] = Query(
+        HISTOGRAM_DEFAULT_EDGES,
+        description="Bucket edges, strictly increasing (repeat the parameter)",
+    ),
+    job_id: int | None = Query(None, gt=0, description="Restrict to one job"),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    ensure_recruiter(current_user)
+
+    try:
+        total, buckets = fit_score_histogram(db, edges, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return {
+        "job_id": job_id,
+        "total_applications": total,
+        "buckets": buckets,
+    }
+
+
 # ==================================================
 # 5️⃣ UPDATE APPLICATION STATUS
 # ==================================================
@@ -200,9 +216,11 @@ def update_application_status(
             detail=f"Invalid status. Allowed values: {allowed_statuses}",
         )
 
+    # Row lock: the rollup adjustment depends on the status being replaced
     application = (
         db.query(Application)
         .filter(Application.id == application_id)
+        .with_for_update()
         .first()
     )
 
@@ -214,6 +232,8 @@ def update_application_status(
 
     old_status = application.application_status
     application.application_status = status
+    db.flush()  # lock order: applications, then application_counts
+    application_status_changed(db, application.job_id, old_status, status)
 
     db.commit()
     db.refresh(application)
@@ -229,22 +249,43 @@ def update_application_status(
 # ==================================================
 # 6️⃣ GET ALL APPLICATIONS FOR A JOB (WITH USER DETAILS)
 # ==================================================
-@router.get("/{job_id}/applications")
+@router.get("/{job_id}/applications", response_model=ApplicantPage)
 def get_applications_for_job(
     job_id: int = Path(..., gt=0),
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
 ):
     ensure_recruiter(current_user)
 
-    results = (
-        db.query(Application, User)
-        .join(User, Application.user_id == User.id)
-        .filter(Application.job_id == job_id)
-        .all()
-    )
+    # Best fit first; keyset on (fit_score, id)
+    try:
+        results, next_cursor = keyset_page(
+            db.query(
+                Application.id,
+                Application.job_id,
+                Application.fit_score,
+                Application.skill_score,
+                Application.semantic_score,
+                Application.matched_skills,
+                Application.missing_skills,
+                Application.application_status,
+                Application.applied_at,
+                User.id.label("user_id"),
+                User.first_name,
+                User.last_name,
+            )
+            .join(User, Application.user_id == User.id)
+            .filter(Application.job_id == job_id),
+            [Application.fit_score, Application.id],
+            limit,
+            cursor,
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    if not results:
+    if not results and cursor is None:
         raise HTTPException(
             status_code=404,
             detail="No applications found for this job",
@@ -252,23 +293,69 @@ def get_applications_for_job(
 
     applications = []
 
-    for app, user in results:
+    for row in results:
         applications.append({
+            "user_id": row.user_id,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "job_id": row.job_id,
+            "fit_score": row.fit_score,
+            "skill_score": row.skill_score,
+            "semantic_score": row.semantic_score,
+            "matched_skills": row.matched_skills or [],
+            "missing_skills": row.missing_skills or [],
+            "application_status": row.application_status,
+            "applied_at": row.applied_at,
+        })
+
+    total, _ = read_status_counts(db, job_id)
+
+    return {
+        "job_id": job_id,
+        "total_applications": total,
+        "applications": applications,
+        "next_cursor": next_cursor,
+    }
+
+
+# ==================================================
+# 7️⃣ TOP CANDIDATES FOR A JOB (ALL STORED RESUMES)
+# ==================================================
+@router.get("/{job_id}/top-candidates")
+async def get_top_candidates_for_job(
+    job_id: int = Path(..., gt=0),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    ensure_recruiter(current_user)
+
+    job = await run_in_threadpool(load_job, db, job_id)
+
+    ranked, unscored = await rank_candidates_for_job_async(db, job, limit)
+    if unscored:
+        # Materialize this job's scores so the next load reads them
+        match_worker.enqueue_job(job_id)
+
+    users = await run_in_threadpool(load_users, db, [r["user_id"] for r in ranked])
+
+    candidates = []
+
+    for candidate in ranked:
+        user = users.get(candidate["user_id"])
+        if user is None:
+            continue
+
+        candidates.append({
             "user_id": user.id,
             "first_name": user.first_name,
             "last_name": user.last_name,
-            "job_id": app.job_id,
-            "fit_score": app.fit_score,
-            "skill_score": app.skill_score,
-            "semantic_score": app.semantic_score,
-            "matched_skills": app.matched_skills,
-            "missing_skills": app.missing_skills,
-            "application_status": app.application_status,
-            "applied_at": app.applied_at,
+            **candidate,
         })
 
     return {
         "job_id": job_id,
-        "total_applications": len(applications),
-        "applications": applications,
+        "total_candidates": len(candidates),
+        "unscored_candidates": unscored,
+        "candidates": candidates,
     }
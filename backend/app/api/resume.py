@@ -1,11 +1,10 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Depends, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, defer
 from fastapi.responses import StreamingResponse
 import io
 
-from app.services.text_extraction import extract_text
-from app.services.skill_extraction import extract_skills
-from app.services.azure_document_intelligence import extract_text_from_image
+from app.services.parse_cache import parse_resume
 from app.services.blob_storage import (
     upload_resume_to_blob,
     delete_blob,
@@ -14,6 +13,10 @@ from app.services.blob_storage import (
 
 from app.db.session import get_db
 from app.db.models import Resume
+from app.api.schemas import ResumeList, ResumeStatus
+from app.services.resume_events import resume_deleted
+from app.services.resume_ingestion import create_pending_resume
+from app.services.ingestion_worker import ingestion_worker
 
 router = APIRouter(tags=["Resume"])
 
@@ -22,19 +25,19 @@ router = APIRouter(tags=["Resume"])
 # ------------------------------------------------------------------
 
 @router.post("/resume/upload")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+):
     """
     Basic resume upload (text preview only).
-    Stateless endpoint.
+    Stateless endpoint (parse results are cached by content hash).
     """
 
-    content_type = file.content_type.lower()
-
-    if content_type.startswith("image/"):
-        file_bytes = await file.read()
-        text = extract_text_from_image(file_bytes)
-    else:
-        text = extract_text(file)
+    file_bytes = await file.read()
+    # Cache lookup, extraction / OCR and Document Intelligence: off the event loop
+    parsed = await run_in_threadpool(parse_resume, db, file_bytes, file.filename, file.content_type)
+    text = parsed.text
 
     return {
         "filename": file.filename,
@@ -44,20 +47,17 @@ async def upload_resume(file: UploadFile = File(...)):
 
 
 @router.post("/resume/extract-skills")
-async def extract_resume_skills(file: UploadFile = File(...)):
+async def extract_resume_skills(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+):
     """
-    Extract skills from resume (stateless).
+    Extract skills from resume (stateless; cached by content hash).
     """
 
-    content_type = file.content_type.lower()
-
-    if content_type.startswith("image/"):
-        file_bytes = await file.read()
-        text = extract_text_from_image(file_bytes)
-    else:
-        text = extract_text(file)
-
-    skills = extract_skills(text)
+    file_bytes = await file.read()
+    parsed = await run_in_threadpool(parse_resume, db, file_bytes, file.filename, file.content_type)
+    skills = parsed.skills
 
     return {
         "filename": file.filename,
@@ -70,60 +70,25 @@ async def extract_resume_skills(file: UploadFile = File(...)):
 # Candidate Resume Management APIs (Azure Blob + PostgreSQL)
 # ------------------------------------------------------------------
 
-@router.post("/candidate/upload-resume")
+@router.post("/candidate/upload-resume", status_code=status.HTTP_202_ACCEPTED)
 async def candidate_upload_resume(
     resume: UploadFile = File(...),
     user_id: int = Form(...),
     db: Session = Depends(get_db),
 ):
     """
-    Upload resume to Azure Blob, parse it, extract skills,
-    and store metadata in DB.
+    Upload resume to Azure Blob and queue it for parsing (text, skills).
+    Poll GET /candidate/resume/{resume_id}/status until it is ready.
     """
 
     try:
-        # ✅ READ FILE ONCE
-        file_bytes = await resume.read()
-
-        # ✅ Rewind stream for blob upload
-        resume.file = io.BytesIO(file_bytes)
-
-        # 1. Upload to Azure Blob
-        blob_url = upload_resume_to_blob(resume)
-
-        # 2. Extract text based on file type
-        content_type = resume.content_type.lower()
-
-        if content_type.startswith("image/"):
-            resume_text = extract_text_from_image(file_bytes)
-        else:
-            # For PDF/DOCX, recreate UploadFile stream
-            resume.file = io.BytesIO(file_bytes)
-            resume_text = extract_text(resume)
-
-        skills = extract_skills(resume_text)
-
-        # 3. Store in DB
-        new_resume = Resume(
-            user_id=user_id,
-            filename=resume.filename,
-            file_path=blob_url,
-            parsed_text=resume_text,
-            skills_json=skills
-        )
+        # 1. Upload to Azure Blob (blocking client: off the event loop)
+        blob_url = await run_in_threadpool(upload_resume_to_blob, resume)
 
-        db.add(new_resume)
-        db.commit()
-        db.refresh(new_resume)
-
-        return {
-            "message": "Resume uploaded and stored successfully",
-            "resume_id": new_resume.id,
-            "filename": resume.filename,
-            "file_url": blob_url,
-            "total_skills_found": len(skills),
-            "skills": skills
-        }
+        # 2. Queue for the ingestion workers (blocking insert: off the event loop)
+        new_resume = await run_in_threadpool(
+            create_pending_resume, db, user_id, resume.filename, blob_url, resume.content_type
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -131,14 +96,78 @@ async def candidate_upload_resume(
             detail=f"Resume upload failed: {str(e)}"
         )
 
+    ingestion_worker.notify()
 
-@router.get("/candidate/resumes")
+    return {
+        "message": "Resume uploaded, processing",
+        "resume_id": new_resume.id,
+        "filename": resume.filename,
+        "file_url": blob_url,
+        "status": new_resume.status,
+        "status_url": f"/candidate/resume/{new_resume.id}/status",
+    }
+
+
+@router.get("/candidate/resume/{resume_id}/status", response_model=ResumeStatus)
+def get_resume_status(
+    resume_id: int,
+    user_id: int,
+    db: Session = Depends(get_db)
+):
+    resume = (
+        db.query(
+            Resume.id,
+            Resume.status,
+            Resume.stage,
+            Resume.error,
+            Resume.attempts,
+            Resume.skills_json,
+            Resume.created_at,
+            Resume.processed_at,
+        )
+        .filter(
+            Resume.id == resume_id,
+            Resume.user_id == user_id
+        )
+        .first()
+    )
+
+    if not resume:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume not found for this user"
+        )
+
+    skills = resume.skills_json or []
+
+    return {
+        "resume_id": resume.id,
+        "status": resume.status,
+        "stage": resume.stage,
+        "error": resume.error,
+        "attempts": resume.attempts,
+        "uploaded_at": resume.created_at,
+        "processed_at": resume.processed_at,
+        "total_skills_found": len(skills),
+        "skills": skills,
+    }
+
+
+@router.get("/candidate/resumes", response_model=ResumeList)
 def get_all_resumes_for_user(
     user_id: int,
     db: Session = Depends(get_db)
 ):
+    # Metadata only: parsed_text and skills_json stay in the database
     resumes = (
-        db.query(Resume)
+        db.query(
+            Resume.id,
+            Resume.filename,
+            Resume.file_path,
+            Resume.skills_count,
+            Resume.status,
+            Resume.created_at,
+        )
         .filter(Resume.user_id == user_id)
         .order_by(Resume.created_at.desc())
         .all()
@@ -158,7 +187,8 @@ def get_all_resumes_for_user(
                 "resume_id": r.id,
                 "filename": r.filename,
                 "file_url": r.file_path,
-                "total_skills_found": len(r.skills_json) if r.skills_json else 0,
+                "total_skills_found": r.skills_count or 0,
+                "status": r.status,
                 "uploaded_at": r.created_at
             }
             for r in resumes
@@ -174,6 +204,7 @@ def delete_candidate_resume(
 ):
     resume = (
         db.query(Resume)
+        .options(defer(Resume.parsed_text), defer(Resume.skills_json))
         .filter(
             Resume.id == resume_id,
             Resume.user_id == user_id
@@ -197,6 +228,7 @@ def delete_candidate_resume(
 
     db.delete(resume)
     db.commit()
+    resume_deleted(resume_id)
 
     return {
         "message": "Resume deleted successfully",
@@ -212,6 +244,7 @@ def download_candidate_resume(
 ):
     resume = (
         db.query(Resume)
+        .options(defer(Resume.parsed_text), defer(Resume.skills_json))
         .filter(
             Resume.id == resume_id,
             Resume.user_id == user_id
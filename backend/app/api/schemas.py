@@ -0,0 +1,103 @@
+# app/api/schemas.py
+"""
+Response models of the list endpoints. They carry only the fields the
+list views render (no descriptions, resume text or password hashes);
+full records come from the detail endpoints.
+"""
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# --------------------------------------------------
+# Jobs
+# --------------------------------------------------
+class JobSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    recruiter_id: int
+    title: str
+    company: Optional[str] = None
+    location: Optional[str] = None
+    job_type: Optional[str] = None
+    job_status: str
+    created_at: datetime
+
+
+class JobPage(BaseModel):
+    jobs: list[JobSummary]
+    next_cursor: Optional[str] = None
+
+
+# --------------------------------------------------
+# Resumes
+# --------------------------------------------------
+class ResumeSummary(BaseModel):
+    resume_id: int
+    filename: str
+    file_url: str
+    total_skills_found: int
+    status: str
+    uploaded_at: Optional[datetime] = None
+
+
+class ResumeList(BaseModel):
+    user_id: int
+    total_resumes: int
+    resumes: list[ResumeSummary]
+
+
+class ResumeStatus(BaseModel):
+    resume_id: int
+    status: str  # processing | ready | failed
+    stage: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int
+    uploaded_at: Optional[datetime] = None
+    processed_at: Optional[datetime] = None
+    total_skills_found: int
+    skills: list[str]
+
+
+# --------------------------------------------------
+# Applications
+# --------------------------------------------------
+class ApplicationSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    job_id: int
+    fit_score: float
+    skill_score: float
+    semantic_score: float
+    application_status: Optional[str] = None
+    applied_at: datetime
+
+
+class ApplicationPage(BaseModel):
+    applications: list[ApplicationSummary]
+    next_cursor: Optional[str] = None
+
+
+class Applicant(BaseModel):
+    user_id: int
+    first_name: str
+    last_name: str
+    job_id: int
+    fit_score: float
+    skill_score: float
+    semantic_score: float
+    matched_skills: list[str] = Field(default_factory=list)
+    missing_skills: list[str] = Field(default_factory=list)
+    application_status: Optional[str] = None
+    applied_at: datetime
+
+
+class ApplicantPage(BaseModel):
+    job_id: int
+    total_applications: int
+    applications: list[Applicant]
+    next_cursor: Optional[str] = None
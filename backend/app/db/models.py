@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     JSON,
     Float,
+    Index,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declarative_base
@@ -39,6 +40,9 @@ class User(Base):
 # --------------------------------------------------
 # RESUMES
 # --------------------------------------------------
+# Uploads are parsed in the background: processing -> ready | failed
+RESUME_STATUSES = ("processing", "ready", "failed")
+
 class Resume(Base):
     __tablename__ = "resumes"
 
@@ -50,9 +54,25 @@ class Resume(Base):
 
     parsed_text = Column(Text)
     skills_json = Column(JSON)
+    skills_count = Column(Integer)  # len(skills_json), for list views
+    content_hash = Column(String(64))  # SHA-256 of the file (parse cache key)
+
+    # Ingestion (the resumes table doubles as the ingestion queue)
+    content_type = Column(String(100))
+    status = Column(String(20), nullable=False, default="ready", server_default="ready")
+    stage = Column(String(20))  # queued | extracting | skills | done
+    error = Column(Text)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    claimed_at = Column(DateTime)
+    processed_at = Column(DateTime)
 
     created_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_resumes_status", "status", "id"),
+        Index("ix_resumes_user_hash", "user_id", "content_hash"),
+    )
+
 
 # --------------------------------------------------
 # JOBS
@@ -72,7 +92,15 @@ class Job(Base):
     location = Column(String(255))
     job_type = Column(String(50))
 
-    created_at = Column(DateTime, server_default=func.now())
+    # Canonical skills extracted from description at write time
+    skills_json = Column(JSON)
+
+    created_at = Column(DateTime, nullable=False, server_default=func.now())  # keyset pagination key
+
+    __table_args__ = (
+        # Keyset pagination of GET /recruiter/jobs
+        Index("ix_jobs_created_id", "created_at", "id"),
+    )
 
 
 # --------------------------------------------------
@@ -95,4 +123,72 @@ class Application(Base):
     missing_skills = Column(JSON)
 
     application_status = Column(String(50), default="applied")
-    applied_at = Column(DateTime, server_default=func.now())
+    applied_at = Column(DateTime, nullable=False, server_default=func.now())  # keyset pagination key
+
+    __table_args__ = (
+        # Keyset pagination: a candidate's applications, a job's applicants
+        Index("ix_applications_user_applied", "user_id", "applied_at", "id"),
+        Index("ix_applications_job_fit", "job_id", "fit_score", "id"),
+    )
+
+
+# --------------------------------------------------
+# APPLICATION COUNTS (dashboard rollup, maintained on write)
+# --------------------------------------------------
+APPLICATION_COUNTS_TOTAL = 0  # job_id of the all-jobs rows
+
+class ApplicationCount(Base):
+    __tablename__ = "application_counts"
+
+    job_id = Column(Integer, primary_key=True)  # no FK: 0 = all jobs
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# --------------------------------------------------
+# PARSED DOCUMENTS (content-addressed resume parse cache)
+# --------------------------------------------------
+class ParsedDocument(Base):
+    __tablename__ = "parsed_documents"
+
+    content_hash = Column(String(64), primary_key=True)  # SHA-256 of the file bytes
+    extractor_version = Column(String(255), primary_key=True)
+
+    parsed_text = Column(Text, nullable=False)
+    skills_json = Column(JSON, nullable=False)
+
+    created_at = Column(DateTime, server_default=func.now())
+
+
+# --------------------------------------------------
+# MATCH SCORES (materialized resume × job top-N)
+# --------------------------------------------------
+class MatchScore(Base):
+    __tablename__ = "match_scores"
+
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+
+    fit_score = Column(Float, nullable=False)
+    skill_score = Column(Float, nullable=False)
+    semantic_score = Column(Float, nullable=False)
+
+    # Staleness: when the row was computed, against which job catalog
+    computed_at = Column(DateTime, server_default=func.now(), nullable=False)
+    catalog_version = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_match_scores_resume_fit", "resume_id", "fit_score"),
+        Index("ix_match_scores_job", "job_id"),
+    )
+
+
+# --------------------------------------------------
+# CATALOG STATE (single row, bumped on every job change)
+# --------------------------------------------------
+class CatalogState(Base):
+    __tablename__ = "catalog_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
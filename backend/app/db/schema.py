@@ -0,0 +1,114 @@
+# app/db/schema.py
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.db.models import (
+    Application,
+    ApplicationCount,
+    Base,
+    CatalogState,
+    Job,
+    MatchScore,
+    ParsedDocument,
+    Resume,
+)
+from app.services.application_stats import (
+    FIT_KEY_PREFIX,
+    REBUILD_APPLICATION_COUNTS,
+    REBUILD_FIT_COUNTS,
+)
+
+# Idempotent DDL for columns added after the initial schema.
+# (table, column, type)
+ADDED_COLUMNS = [
+    ("jobs", "skills_json", "JSON"),
+    ("resumes", "skills_count", "INTEGER"),
+    ("resumes", "content_type", "VARCHAR(100)"),
+    ("resumes", "status", "VARCHAR(20) NOT NULL DEFAULT 'ready'"),
+    ("resumes", "stage", "VARCHAR(20)"),
+    ("resumes", "error", "TEXT"),
+    ("resumes", "attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("resumes", "claimed_at", "TIMESTAMP"),
+    ("resumes", "processed_at", "TIMESTAMP"),
+    ("resumes", "content_hash", "VARCHAR(64)"),
+]
+
+# Columns made NOT NULL after the initial schema: (table, column,
+# value for existing NULL rows). Keyset pagination keys must not be NULL,
+# or the rows could never be paged to.
+NOT_NULL_COLUMNS = [
+    ("jobs", "created_at", "CURRENT_TIMESTAMP"),
+    ("applications", "applied_at", "CURRENT_TIMESTAMP"),
+]
+
+# Backfills for added columns (only touch rows not filled yet)
+BACKFILLS = [
+    "UPDATE resumes SET skills_count = json_array_length(skills_json) "
+    "WHERE skills_count IS NULL AND skills_json IS NOT NULL",
+]
+
+# Tables added after the initial schema (created if missing)
+ADDED_TABLES = [
+    CatalogState.__table__,
+    MatchScore.__table__,
+    ApplicationCount.__table__,
+    ParsedDocument.__table__,
+]
+
+# Indexes added to tables of the initial schema (created if missing)
+ADDED_INDEXES = [
+    index
+    for table in (Job.__table__, Application.__table__, Resume.__table__)
+    for index in table.indexes
+]
+
+
+def ensure_schema(engine: Engine):
+    """
+    Bring an existing database up to date with the models.
+    Safe to run on every startup.
+    """
+    Base.metadata.create_all(engine, tables=ADDED_TABLES)
+
+    with engine.begin() as conn:
+        for table, column, column_type in ADDED_COLUMNS:
+            conn.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {column_type}"
+            ))
+
+    # After the columns: some indexes cover added columns
+    for index in ADDED_INDEXES:
+        index.create(engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        for statement in BACKFILLS:
+            conn.execute(text(statement))
+
+        for table, column, value in NOT_NULL_COLUMNS:
+            nullable = conn.execute(
+                text(
+                    "SELECT is_nullable FROM information_schema.columns "
+                    "WHERE table_name = :table AND column_name = :column"
+                ),
+                {"table": table, "column": column},
+            ).scalar()
+            if nullable == "YES":
+                conn.execute(text(f"UPDATE {table} SET {column} = {value} WHERE {column} IS NULL"))
+                conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL"))
+
+        conn.execute(text(
+            "INSERT INTO catalog_state (id, version) VALUES (1, 0) "
+            "ON CONFLICT (id) DO NOTHING"
+        ))
+
+        # Populate the dashboard rollup the first time it exists
+        if conn.execute(text("SELECT 1 FROM application_counts LIMIT 1")).first() is None:
+            for statement in REBUILD_APPLICATION_COUNTS:
+                conn.execute(text(statement))
+
+        # Fit-score counts were added to an existing rollup later
+        elif conn.execute(text(
+            f"SELECT 1 FROM application_counts WHERE status LIKE '{FIT_KEY_PREFIX}%' LIMIT 1"
+        )).first() is None:
+            for statement in REBUILD_FIT_COUNTS:
+                conn.execute(text(statement))
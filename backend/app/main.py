@@ -1,4 +1,6 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -14,7 +16,33 @@ from app.api.preparation import router as preparation_router
 from app.api.job_management import router as job_router
 from app.api.recruiter_dashboard import router as recruiter_dashboard
 
-app = FastAPI(title="Smart Resume Screening API")
+from app.db.session import engine
+from app.db.schema import ensure_schema
+from app.services.semantic_search import open_semantic_backends, close_semantic_backends
+from app.services.chunked_search import close_chunk_executor
+from app.services.text_extraction import close_ocr_pool
+from app.services.match_worker import match_worker
+from app.services.ingestion_worker import ingestion_worker
+from app.services.recommendation_cache import recommendation_cache
+from app.services.matching_service import single_flight
+from app.services.parse_cache import parse_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    ensure_schema(engine)
+    await open_semantic_backends()
+    match_worker.start()
+    ingestion_worker.start()
+    yield
+    ingestion_worker.stop()
+    match_worker.stop()
+    await close_semantic_backends()
+    close_chunk_executor()
+    close_ocr_pool()
+
+
+app = FastAPI(title="Smart Resume Screening API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -72,3 +100,11 @@ def root():
 @app.get("/health", tags=["Default"])
 def health():
     return {"status": "OK"}
+
+@app.get("/metrics", tags=["Default"])
+def metrics():
+    return {
+        "recommendation_cache": recommendation_cache.stats(),
+        "single_flight": {"shared_calls": single_flight.shared},
+        "parse_cache": parse_cache.stats(),
+    }
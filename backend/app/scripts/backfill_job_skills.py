@@ -0,0 +1,53 @@
+"""
+Backfill Job.skills_json for existing rows.
+
+    python -m app.scripts.backfill_job_skills          # only rows without skills
+    python -m app.scripts.backfill_job_skills --all    # recompute every job
+                                                       # (e.g. after an ontology change)
+"""
+import argparse
+
+from app.db.session import SessionLocal, engine
+from app.db.schema import ensure_schema
+from app.db.models import Job
+from app.services.skill_extraction import extract_skills
+
+
+def backfill_job_skills(recompute_all: bool = False, batch_size: int = 500):
+    ensure_schema(engine)
+
+    db = SessionLocal()
+    updated = 0
+    last_id = 0
+
+    try:
+        while True:
+            query = db.query(Job).filter(Job.id > last_id)
+            if not recompute_all:
+                query = query.filter(Job.skills_json.is_(None))
+
+            jobs = query.order_by(Job.id).limit(batch_size).all()
+            if not jobs:
+                break
+
+            for job in jobs:
+                job.skills_json = extract_skills(job.description)
+
+            db.commit()
+            updated += len(jobs)
+            last_id = jobs[-1].id
+            print(f"… {updated} jobs updated (last id {last_id})")
+
+    finally:
+        db.close()
+
+    print(f"✅ Backfilled skills for {updated} jobs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--all", action="store_true", help="Recompute skills for every job")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    backfill_job_skills(recompute_all=args.all, batch_size=args.batch_size)
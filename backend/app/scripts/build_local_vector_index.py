@@ -0,0 +1,29 @@
+"""
+(Re)build the local semantic index used when SEMANTIC_BACKEND=local.
+
+    python -m app.scripts.build_local_vector_index
+"""
+import time
+
+from app.db.session import SessionLocal
+from app.services.local_vector_index import LocalVectorIndex
+
+
+def build_local_vector_index():
+    db = SessionLocal()
+    start = time.perf_counter()
+
+    try:
+        index = LocalVectorIndex()
+        index.build(db)
+    finally:
+        db.close()
+
+    print(
+        f"✅ Indexed {index.size} jobs into {index.index_dir} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    build_local_vector_index()
@@ -0,0 +1,384 @@
+"""
+Bulk-ingest historical resumes (PDFs / images) from a directory or zip.
+
+    python -m app.scripts.bulk_ingest_resumes resumes/ --manifest owners.csv
+    python -m app.scripts.bulk_ingest_resumes export.zip --manifest owners.csv --workers 8
+
+The manifest is a CSV with a header row and the columns `file` (path
+relative to the directory, or zip member name) and `user_id` (owner of
+the resume). Files without a manifest entry are skipped.
+
+Files are parsed (through the parse cache) and skill-extracted across a
+process pool; each worker loads the extraction models once and runs OCR
+in-process. Files whose owner already has a resume with the same content
+hash (stored, or earlier in this run) are skipped before they are
+uploaded, so a re-run leaves no orphaned blobs; only new content is then
+uploaded to blob storage. Resume rows are inserted in batches.
+Files in committed batches are appended to a checkpoint file (default:
+<source>.checkpoint), so re-running after a crash continues with the
+remaining files (a crash between the commit and the checkpoint write
+re-parses the batch, but does not duplicate it).
+
+Afterwards, run `python -m app.scripts.rebuild_match_scores --stale` to
+materialize match scores for the new resumes.
+"""
+import argparse
+import csv
+import datetime
+import io
+import mimetypes
+import multiprocessing
+import os
+import time
+import zipfile
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from types import SimpleNamespace
+
+from sqlalchemy import insert, tuple_
+
+from app.db.models import Resume, User
+from app.db.schema import ensure_schema
+from app.db.session import SessionLocal, engine
+
+RESUME_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"}
+
+STAGES = ("read", "extract", "skills", "upload", "insert")
+
+
+# --------------------------------------------------
+# Sources
+# --------------------------------------------------
+def list_files(source: str) -> list[str]:
+    """
+    Resume files under a directory (relative paths) or in a zip (member names).
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+    else:
+        names = [
+            os.path.relpath(os.path.join(root, name), source)
+            for root, _, files in os.walk(source)
+            for name in files
+        ]
+
+    return sorted(n for n in names if os.path.splitext(n)[1].lower() in RESUME_EXTENSIONS)
+
+
+def load_manifest(path: str) -> dict[str, int]:
+    """
+    {file: user_id} from the manifest CSV.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if not {"file", "user_id"} <= set(reader.fieldnames or ()):
+            raise SystemExit(f"{path}: expected the columns 'file' and 'user_id'")
+        return {row["file"].strip(): int(row["user_id"]) for row in reader}
+
+
+def read_file(source: str, name: str) -> bytes:
+    if _archive is not None:
+        return _archive.read(name)
+    with open(os.path.join(source, name), "rb") as f:
+        return f.read()
+
+
+# --------------------------------------------------
+# Checkpoint
+# --------------------------------------------------
+def load_checkpoint(path: str) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def append_checkpoint(path: str, names: list[str]):
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(name + "\n" for name in names)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# --------------------------------------------------
+# Worker processes
+# --------------------------------------------------
+# Zip source, opened once per worker process
+_archive: zipfile.ZipFile | None = None
+
+
+def _init_worker(source: str):
+    global _archive
+    if zipfile.is_zipfile(source):
+        _archive = zipfile.ZipFile(source)
+
+    from app.services import text_extraction
+    from app.services.skill_extraction import extract_skills
+
+    # Parallelism comes from this pool: OCR runs inside each worker
+    # (no nested OCR process pool)
+    text_extraction.OCR_WORKERS = 1
+
+    # Load the skill extraction model once per worker
+    extract_skills("python")
+
+
+def _parse_file(source: str, name: str) -> dict:
+    """
+    Read and parse one file. Returns the Resume column values (or an
+    error) with per-stage timings in seconds.
+    """
+    from app.services.parse_cache import parse_resume
+
+    timings = {}
+    filename = os.path.basename(name)
+    content_type = mimetypes.guess_type(filename)[0]
+
+    try:
+        start = time.perf_counter()
+        file_bytes = read_file(source, name)
+        timings["read"] = time.perf_counter() - start
+
+        db = SessionLocal()
+        try:
+            parsed = parse_resume(db, file_bytes, filename, content_type, timings)
+        finally:
+            db.close()
+
+    except Exception as e:
+        return {"name": name, "error": f"{type(e).__name__}: {e}", "timings": timings}
+
+    return {
+        "name": name,
+        "timings": timings,
+        "cached": parsed.cached,
+        "row": {
+            "content_hash": parsed.content_hash,
+            "filename": filename,
+            "content_type": content_type,
+            "parsed_text": parsed.text,
+            "skills_json": parsed.skills,
+            "skills_count": len(parsed.skills),
+        },
+    }
+
+
+def _upload_file(source: str, result: dict) -> dict:
+    """
+    Upload a parsed file to blob storage, adding its URL to the row.
+    """
+    from app.services.blob_storage import upload_resume_to_blob
+
+    timings = {}
+    row = result["row"]
+
+    try:
+        start = time.perf_counter()
+        file_bytes = read_file(source, result["name"])
+        row["file_path"] = upload_resume_to_blob(
+            SimpleNamespace(filename=row["filename"], file=io.BytesIO(file_bytes))
+        )
+        timings["upload"] = time.perf_counter() - start
+
+    except Exception as e:
+        return {"name": result["name"], "error": f"{type(e).__name__}: {e}", "timings": timings}
+
+    return {**result, "timings": timings}
+
+
+# --------------------------------------------------
+# Driver
+# --------------------------------------------------
+def existing_hashes(db, rows: list[dict]) -> set[tuple[int, str]]:
+    """
+    (user_id, content_hash) pairs of `rows` that are already stored.
+    """
+    keys = {(row["user_id"], row["content_hash"]) for row in rows}
+    return set(
+        db.query(Resume.user_id, Resume.content_hash)
+        .filter(tuple_(Resume.user_id, Resume.content_hash).in_(keys))
+        .all()
+    )
+
+
+def bulk_ingest_resumes(
+    source: str,
+    owners: dict[str, int],
+    workers: int,
+    batch_size: int = 200,
+    checkpoint: str | None = None,
+):
+    ensure_schema(engine)
+
+    checkpoint = checkpoint or source.rstrip("/\\") + ".checkpoint"
+    done = load_checkpoint(checkpoint)
+    files = [n for n in list_files(source) if n not in done]
+    names = [n for n in files if n in owners]
+    unowned = len(files) - len(names)
+    print(f"… {len(names)} files to ingest ({len(done)} already in {checkpoint})")
+    if unowned:
+        print(f"… {unowned} files have no manifest entry and are skipped")
+
+    db = SessionLocal()
+
+    unknown_users = set(owners.values()) - {
+        user_id for (user_id,) in db.query(User.id).filter(User.id.in_(set(owners.values())))
+    }
+    if unknown_users:
+        db.close()
+        raise SystemExit(f"Manifest refers to unknown users: {sorted(unknown_users)[:20]}")
+
+    stage_seconds = defaultdict(float)
+    stage_counts = defaultdict(int)
+    failures: list[tuple[str, str]] = []
+    parsed: list[dict] = []  # parsed, not yet checked for duplicates
+    batch: list[dict] = []  # uploaded, not yet inserted
+    uploading: set[tuple[int, str]] = set()  # (user_id, content_hash) sent for upload
+    inserted = 0
+    duplicates = 0
+    cached = 0
+
+    def dedupe() -> list[dict]:
+        """
+        The parsed files with new content; duplicates are checkpointed.
+        """
+        nonlocal duplicates
+        for result in parsed:
+            result["row"]["user_id"] = owners[result["name"]]
+        seen = existing_hashes(db, [result["row"] for result in parsed]) | uploading
+
+        new, skipped = [], []
+        for result in parsed:
+            key = (result["row"]["user_id"], result["row"]["content_hash"])
+            if key in seen:
+                skipped.append(result["name"])
+            else:
+                seen.add(key)
+                uploading.add(key)
+                new.append(result)
+
+        if skipped:
+            append_checkpoint(checkpoint, skipped)
+        duplicates += len(skipped)
+        parsed.clear()
+        return new
+
+    def flush():
+        nonlocal inserted
+        if not batch:
+            return
+        start = time.perf_counter()
+        now = datetime.datetime.utcnow()
+
+        db.execute(insert(Resume), [
+            {
+                **result["row"],
+                "status": "ready",
+                "stage": "done",
+                "attempts": 1,
+                "processed_at": now,
+            }
+            for result in batch
+        ])
+        db.commit()
+        append_checkpoint(checkpoint, [result["name"] for result in batch])
+        stage_seconds["insert"] += time.perf_counter() - start
+        stage_counts["insert"] += len(batch)
+        inserted += len(batch)
+        batch.clear()
+        print(f"… {inserted} resumes inserted")
+
+    started = time.perf_counter()
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(source,),
+    )
+
+    try:
+        # Bounded number of files in flight (parsing or uploading)
+        queue = iter(names)
+        in_flight = set()
+        while True:
+            while len(in_flight) < workers * 4:
+                name = next(queue, None)
+                if name is None:
+                    break
+                in_flight.add(pool.submit(_parse_file, source, name))
+            if not in_flight:
+                if not parsed:
+                    break
+                # Queue drained: check and upload the last parsed files
+                in_flight = {pool.submit(_upload_file, source, result) for result in dedupe()}
+                continue
+
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                for stage, seconds in result["timings"].items():
+                    stage_seconds[stage] += seconds
+                    stage_counts[stage] += 1
+
+                if "error" in result:
+                    failures.append((result["name"], result["error"]))
+                elif "file_path" not in result["row"]:
+                    cached += result["cached"]
+                    parsed.append(result)
+                    if len(parsed) >= batch_size:
+                        in_flight |= {pool.submit(_upload_file, source, r) for r in dedupe()}
+                else:
+                    batch.append(result)
+                    if len(batch) >= batch_size:
+                        flush()
+
+        flush()
+
+    finally:
+        pool.shutdown(cancel_futures=True)
+        db.close()
+
+    elapsed = time.perf_counter() - started
+
+    # --------------------------------------------------
+    # Throughput report
+    # --------------------------------------------------
+    processed = inserted + duplicates + len(failures)
+    print()
+    print(
+        f"files: {processed} processed, {inserted} inserted, {duplicates} already stored, "
+        f"{len(failures)} failed, {len(done)} skipped, {cached} parse cache hits"
+    )
+    print(f"wall:  {elapsed:.1f}s, {processed / elapsed if elapsed else 0.0:.2f} files/s with {workers} workers")
+    print(f"{'stage':>8} {'files':>7} {'total s':>9} {'avg ms':>9}")
+    for stage in STAGES:
+        count = stage_counts[stage]
+        seconds = stage_seconds[stage]
+        avg_ms = seconds / count * 1000 if count else 0.0
+        print(f"{stage:>8} {count:>7} {seconds:>9.1f} {avg_ms:>9.1f}")
+
+    for name, error in failures[:20]:
+        print(f"  ✗ {name}: {error}")
+    if len(failures) > 20:
+        print(f"  … {len(failures) - 20} more failures")
+
+    print(f"✅ Ingested {inserted} resumes (re-run to retry failures)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="Directory or .zip of PDF / image resumes")
+    parser.add_argument("--manifest", required=True, help="CSV with columns file,user_id (resume owners)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <source>.checkpoint)")
+    args = parser.parse_args()
+
+    bulk_ingest_resumes(
+        args.source,
+        load_manifest(args.manifest),
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint=args.checkpoint,
+    )
@@ -0,0 +1,26 @@
+"""
+Rebuild the dashboard rollup (application_counts) from the
+applications table, e.g. after manual edits or bulk imports.
+
+    python -m app.scripts.rebuild_application_counts
+"""
+from app.db.session import SessionLocal, engine
+from app.db.schema import ensure_schema
+from app.services.application_stats import read_status_counts, rebuild_application_counts
+
+
+def main():
+    ensure_schema(engine)
+
+    db = SessionLocal()
+    try:
+        rebuild_application_counts(db)
+        total, counts = read_status_counts(db)
+    finally:
+        db.close()
+
+    print(f"✅ Rebuilt application counts: {total} applications {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Recompute materialized match scores (match_scores) resume by resume.
+
+    python -m app.scripts.rebuild_match_scores            # every resume
+    python -m app.scripts.rebuild_match_scores --stale    # only resumes without rows
+                                                          # or computed for an older catalog
+"""
+import argparse
+
+from sqlalchemy import func
+
+from app.db.session import SessionLocal, engine
+from app.db.schema import ensure_schema
+from app.db.models import MatchScore, Resume
+from app.services.match_store import get_catalog_version, refresh_resume_scores
+
+
+def rebuild_match_scores(stale_only: bool = False, batch_size: int = 500):
+    ensure_schema(engine)
+
+    db = SessionLocal()
+    refreshed = 0
+    last_id = 0
+
+    try:
+        current_version = get_catalog_version(db)
+
+        while True:
+            query = db.query(Resume.id).filter(Resume.id > last_id, Resume.status == "ready")
+            if stale_only:
+                versions = (
+                    db.query(func.min(MatchScore.catalog_version))
+                    .filter(MatchScore.resume_id == Resume.id)
+                    .scalar_subquery()
+                )
+                query = query.filter(
+                    (versions.is_(None)) | (versions < current_version)
+                )
+
+            resume_ids = [r.id for r in query.order_by(Resume.id).limit(batch_size)]
+            if not resume_ids:
+                break
+
+            for resume_id in resume_ids:
+                refresh_resume_scores(db, resume_id)
+
+            refreshed += len(resume_ids)
+            last_id = resume_ids[-1]
+            print(f"… {refreshed} resumes refreshed (last id {last_id})")
+
+    finally:
+        db.close()
+
+    print(f"✅ Refreshed match scores for {refreshed} resumes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stale", action="store_true", help="Only refresh stale or missing resumes")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    rebuild_match_scores(stale_only=args.stale, batch_size=args.batch_size)
@@ -1,4 +1,10 @@
-from app.db.database import SessionLocal
+"""
+Upload every job to the Azure AI Search index.
+
+job_status, job_type and location must be filterable fields in the
+index: recommendations push their filters into the search query.
+"""
+from app.db.session import SessionLocal
 from app.db.models import Job
 from app.services.azure_search_client import search_client
 
@@ -15,6 +21,7 @@ def sync_jobs():
         "description": job.description,
         "location": job.location,
         "job_type": job.job_type,
+        "job_status": job.job_status,
     })
 
     if documents:
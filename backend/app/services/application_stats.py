@@ -0,0 +1,276 @@
+# app/services/application_stats.py
+"""
+Application aggregates for the recruiter dashboard.
+
+Status counts and fit-score counts come from the application_counts
+rollup, kept up to date in the same transaction as every application
+write. Fit scores are counted per whole point ("fit:<floor(score)>"
+rows), which answers the dashboard bands and any histogram with whole
+edges up to FIT_SCORE_MAX by reading at most ~100 rows per job. Other
+histograms are computed in the database: one scan (of the
+(job_id, fit_score) index when filtered by job) returning a handful
+of counts, instead of loading every application row into Python.
+"""
+import math
+
+from sqlalchemy import and_, case, func, text
+from sqlalchemy.orm import Session
+
+from app.db.models import APPLICATION_COUNTS_TOTAL, Application, ApplicationCount
+
+# Default dashboard bands: average < 60 <= good < 80 <= strong
+FIT_SCORE_BANDS = {"average": (None, 60), "good": (60, 80), "strong": (80, None)}
+
+HISTOGRAM_DEFAULT_EDGES = [0, 20, 40, 60, 80, 100]
+HISTOGRAM_MAX_BUCKETS = 50
+
+# Highest possible fit score (0.6 * skill + 0.4 * semantic, both 0-100)
+FIT_SCORE_MAX = 100
+
+# Rollup keys of the per-point fit-score counts (status column)
+FIT_KEY_PREFIX = "fit:"
+
+# Applications without a status count as "applied" (the column default)
+_STATUS = "COALESCE(application_status, 'applied')"
+_FIT_KEY = f"'{FIT_KEY_PREFIX}' || CAST(CAST(FLOOR(fit_score) AS INTEGER) AS TEXT)"
+
+# Rollup rows recomputed from the applications table
+REBUILD_STATUS_COUNTS = [
+    f"""
+    INSERT INTO application_counts (job_id, status, count)
+    SELECT job_id, {_STATUS}, COUNT(*) FROM applications GROUP BY job_id, {_STATUS}
+    ON CONFLICT (job_id, status) DO NOTHING
+    """,
+    f"""
+    INSERT INTO application_counts (job_id, status, count)
+    SELECT {APPLICATION_COUNTS_TOTAL}, {_STATUS}, COUNT(*) FROM applications GROUP BY {_STATUS}
+    ON CONFLICT (job_id, status) DO NOTHING
+    """,
+]
+
+REBUILD_FIT_COUNTS = [
+    f"""
+    INSERT INTO application_counts (job_id, status, count)
+    SELECT job_id, {_FIT_KEY}, COUNT(*) FROM applications GROUP BY job_id, {_FIT_KEY}
+    ON CONFLICT (job_id, status) DO NOTHING
+    """,
+    f"""
+    INSERT INTO application_counts (job_id, status, count)
+    SELECT {APPLICATION_COUNTS_TOTAL}, {_FIT_KEY}, COUNT(*) FROM applications GROUP BY {_FIT_KEY}
+    ON CONFLICT (job_id, status) DO NOTHING
+    """,
+]
+
+REBUILD_APPLICATION_COUNTS = REBUILD_STATUS_COUNTS + REBUILD_FIT_COUNTS
+
+_UPSERT_COUNT = text("""
+    INSERT INTO application_counts (job_id, status, count)
+    VALUES (:job_id, :status, :delta)
+    ON CONFLICT (job_id, status)
+    DO UPDATE SET count = application_counts.count + EXCLUDED.count
+""")
+
+
+# --------------------------------------------------
+# Status and fit-score counts (rollup)
+# --------------------------------------------------
+def _status_key(status: str | None) -> str:
+    return status or "applied"
+
+
+def _fit_key(fit_score: float) -> str:
+    return f"{FIT_KEY_PREFIX}{math.floor(fit_score)}"
+
+
+def _adjust_counts(db: Session, changes: list[tuple[int, str, int]]):
+    """
+    Apply (job_id, rollup key, delta) changes to the per-job and
+    all-jobs rows. Call after flushing the application change and
+    before committing it: writers then lock applications before
+    application_counts, the same order as rebuild_application_counts
+    (the session does not autoflush).
+    """
+    deltas: dict[tuple[int, str], int] = {}
+    for job_id, key, delta in changes:
+        for row in ((job_id, key), (APPLICATION_COUNTS_TOTAL, key)):
+            deltas[row] = deltas.get(row, 0) + delta
+
+    # Fixed row order, so concurrent writers cannot deadlock on the
+    # shared all-jobs rows
+    params = [
+        {"job_id": job_id, "status": status, "delta": delta}
+        for (job_id, status), delta in sorted(deltas.items())
+        if delta
+    ]
+    if params:
+        db.execute(_UPSERT_COUNT, params)
+
+
+def application_added(db: Session, job_id: int, status: str | None, fit_score: float):
+    _adjust_counts(db, [(job_id, _status_key(status), 1), (job_id, _fit_key(fit_score), 1)])
+
+
+def application_removed(db: Session, job_id: int, status: str | None, fit_score: float):
+    _adjust_counts(db, [(job_id, _status_key(status), -1), (job_id, _fit_key(fit_score), -1)])
+
+
+def application_status_changed(
+    db: Session,
+    job_id: int,
+    old_status: str | None,
+    new_status: str | None,
+):
+    _adjust_counts(db, [(job_id, _status_key(old_status), -1), (job_id, _status_key(new_status), 1)])
+
+
+def read_status_counts(
+    db: Session,
+    job_id: int = APPLICATION_COUNTS_TOTAL,
+) -> tuple[int, dict[str, int]]:
+    """
+    (total applications, {status: count}) for one job, or all jobs:
+    a primary-key range read of a few rollup rows.
+    """
+    counts = dict(
+        db.query(ApplicationCount.status, ApplicationCount.count)
+        .filter(
+            ApplicationCount.job_id == job_id,
+            ApplicationCount.status.notlike(f"{FIT_KEY_PREFIX}%"),
+        )
+        .all()
+    )
+    return sum(counts.values()), counts
+
+
+def read_fit_counts(
+    db: Session,
+    job_id: int = APPLICATION_COUNTS_TOTAL,
+) -> dict[int, int]:
+    """
+    {floor(fit score): applications} for one job, or all jobs.
+    """
+    rows = (
+        db.query(ApplicationCount.status, ApplicationCount.count)
+        .filter(
+            ApplicationCount.job_id == job_id,
+            ApplicationCount.status.like(f"{FIT_KEY_PREFIX}%"),
+        )
+        .all()
+    )
+    return {int(key[len(FIT_KEY_PREFIX):]): count for key, count in rows if count}
+
+
+def rebuild_application_counts(db: Session):
+    """
+    Recompute the rollup from scratch (reconciliation). Blocks
+    application writes on Postgres while it runs.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("LOCK TABLE applications IN SHARE MODE"))
+
+    db.query(ApplicationCount).delete(synchronize_session=False)
+    for statement in REBUILD_APPLICATION_COUNTS:
+        db.execute(text(statement))
+    db.commit()
+
+
+# --------------------------------------------------
+# Fit-score distributions (aggregate queries)
+# --------------------------------------------------
+def _count_in(lower, upper, include_upper: bool = False):
+    conditions = []
+    if lower is not None:
+        conditions.append(Application.fit_score >= lower)
+    if upper is not None:
+        conditions.append(
+            Application.fit_score <= upper if include_upper else Application.fit_score < upper
+        )
+    return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+
+def _aggregate(db: Session, columns: list, job_id: int | None) -> list:
+    query = db.query(func.count(Application.id), *columns)
+    if job_id is not None:
+        query = query.filter(Application.job_id == job_id)
+    return list(query.one())
+
+
+def _sum_points(fit_counts: dict[int, int], lower, upper, include_upper: bool = False) -> int:
+    """
+    Applications with lower <= score < upper (or <= upper), for whole
+    edges: floor(score) < k exactly when score < k.
+    """
+    return sum(
+        count
+        for point, count in fit_counts.items()
+        if (lower is None or point >= lower)
+        and (upper is None or point < upper or (include_upper and point == upper))
+    )
+
+
+def fit_score_bands(db: Session, job_id: int | None = None) -> tuple[int, dict]:
+    """
+    (total applications, {band: count}) over FIT_SCORE_BANDS, from the
+    rollup.
+    """
+    fit_counts = read_fit_counts(db, APPLICATION_COUNTS_TOTAL if job_id is None else job_id)
+    return sum(fit_counts.values()), {
+        band: _sum_points(fit_counts, lower, upper)
+        for band, (lower, upper) in FIT_SCORE_BANDS.items()
+    }
+
+
+def validate_edges(edges: list[float]) -> list[float]:
+    """
+    Raises ValueError unless edges are strictly increasing and give
+    1..HISTOGRAM_MAX_BUCKETS buckets.
+    """
+    if len(edges) < 2:
+        raise ValueError("At least two bucket edges are required")
+    if len(edges) - 1 > HISTOGRAM_MAX_BUCKETS:
+        raise ValueError(f"At most {HISTOGRAM_MAX_BUCKETS} buckets are allowed")
+    if any(a >= b for a, b in zip(edges, edges[1:])):
+        raise ValueError("Bucket edges must be strictly increasing")
+    return edges
+
+
+def fit_score_histogram(
+    db: Session,
+    edges: list[float],
+    job_id: int | None = None,
+) -> tuple[int, list[dict]]:
+    """
+    (total applications, buckets) with numpy.histogram semantics:
+    bucket i is [edges[i], edges[i + 1]), the last one also includes
+    its upper edge; scores outside the edges fall in no bucket.
+    """
+    edges = validate_edges(edges)
+    last = len(edges) - 2
+
+    # Whole edges reaching the maximum score: bucket counts are sums of
+    # per-point rollup counts (the last bucket's upper edge can only be
+    # hit by a score of exactly FIT_SCORE_MAX, counted at that point)
+    if all(float(edge).is_integer() for edge in edges) and edges[-1] >= FIT_SCORE_MAX:
+        fit_counts = read_fit_counts(db, APPLICATION_COUNTS_TOTAL if job_id is None else job_id)
+        return sum(fit_counts.values()), [
+            {
+                "lower": lower,
+                "upper": upper,
+                "count": _sum_points(fit_counts, lower, upper, include_upper=(i == last)),
+            }
+            for i, (lower, upper) in enumerate(zip(edges, edges[1:]))
+        ]
+
+    total, *counts = _aggregate(
+        db,
+        [
+            _count_in(lower, upper, include_upper=(i == last))
+            for i, (lower, upper) in enumerate(zip(edges, edges[1:]))
+        ],
+        job_id,
+    )
+
+    return total, [
+        {"lower": lower, "upper": upper, "count": int(count)}
+        for lower, upper, count in zip(edges, edges[1:], counts)
+    ]
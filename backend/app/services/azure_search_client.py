@@ -1,11 +1,18 @@
 import os
+import aiohttp
 from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient as AsyncSearchClient
+from azure.search.documents.indexes import SearchIndexClient
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import AioHttpTransport
 
 AZURE_SEARCH_ENDPOINT = os.getenv("AZURE_SEARCH_ENDPOINT")
 AZURE_SEARCH_API_KEY = os.getenv("AZURE_SEARCH_API_KEY")
 AZURE_SEARCH_INDEX = os.getenv("AZURE_SEARCH_INDEX")
 
+# Connection pool size of the shared async transport
+AZURE_SEARCH_MAX_CONNECTIONS = int(os.getenv("AZURE_SEARCH_MAX_CONNECTIONS", "100"))
+
 if not AZURE_SEARCH_ENDPOINT or not AZURE_SEARCH_API_KEY:
     raise RuntimeError("Azure Search credentials not configured")
 
@@ -14,3 +21,54 @@ search_client = SearchClient(
     index_name=AZURE_SEARCH_INDEX,
     credential=AzureKeyCredential(AZURE_SEARCH_API_KEY)
 )
+
+
+def filterable_fields() -> set[str]:
+    """
+    Names of the filterable fields of the jobs index (reads the index
+    definition).
+    """
+    index_client = SearchIndexClient(
+        endpoint=AZURE_SEARCH_ENDPOINT,
+        credential=AzureKeyCredential(AZURE_SEARCH_API_KEY),
+    )
+    try:
+        index = index_client.get_index(AZURE_SEARCH_INDEX)
+    finally:
+        index_client.close()
+
+    return {field.name for field in index.fields if field.filterable}
+
+
+class AsyncSearchConnection:
+    """
+    Async SearchClient on a shared, connection-pooled aiohttp session.
+    Open once at app startup, close at shutdown.
+    """
+
+    def __init__(self):
+        self.session: aiohttp.ClientSession | None = None
+        self.client: AsyncSearchClient | None = None
+
+    async def open(self) -> AsyncSearchClient:
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=AZURE_SEARCH_MAX_CONNECTIONS)
+        )
+        self.client = AsyncSearchClient(
+            endpoint=AZURE_SEARCH_ENDPOINT,
+            index_name=AZURE_SEARCH_INDEX,
+            credential=AzureKeyCredential(AZURE_SEARCH_API_KEY),
+            transport=AioHttpTransport(session=self.session, session_owner=False),
+        )
+        return self.client
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+async_search_connection = AsyncSearchConnection()
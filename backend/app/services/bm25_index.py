@@ -0,0 +1,219 @@
+# app/services/bm25_index.py
+import math
+import re
+import threading
+from array import array
+from collections import Counter
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db.models import Job
+
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our
+that the their this to we will with you your
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token for token in TOKEN_RE.findall((text or "").lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class BM25Index:
+    """
+    In-process BM25 inverted index over job title + description.
+
+    Postings are compact typed arrays per term (doc slot int32, term
+    frequency uint16). Deleting a job leaves a tombstone slot; postings
+    are compacted once tombstones outnumber live documents.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._terms: dict[str, int] = {}
+        self._doc_postings: list[array] = []
+        self._tf_postings: list[array] = []
+
+        self._slot_job_ids = array("q")   # -1 marks a deleted slot
+        self._slot_lengths = array("I")
+        self._slots: dict[int, int] = {}
+
+        self._total_length = 0
+        self._deleted = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    # --------------------------------------------------
+    # Build / incremental updates
+    # --------------------------------------------------
+    def build(self, db: Session, batch_size: int = 1000):
+        rows = db.query(Job.id, Job.title, Job.description).yield_per(batch_size)
+
+        with self._lock:
+            self._reset()
+            for job_id, title, description in rows:
+                self._add(job_id, f"{title or ''}\n{description or ''}")
+
+    def add(self, job_id: int, text: str):
+        with self._lock:
+            self._remove(job_id)
+            self._add(job_id, text)
+            if self._deleted > len(self._slots):
+                self._compact()
+
+    def remove(self, job_id: int):
+        with self._lock:
+            self._remove(job_id)
+            if self._deleted > len(self._slots):
+                self._compact()
+
+    def _add(self, job_id: int, text: str):
+        tokens = tokenize(text)
+        slot = len(self._slot_job_ids)
+
+        self._slot_job_ids.append(job_id)
+        self._slot_lengths.append(len(tokens))
+        self._slots[job_id] = slot
+        self._total_length += len(tokens)
+
+        for term, tf in Counter(tokens).items():
+            term_id = self._terms.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                self._terms[term] = term_id
+                self._doc_postings.append(array("i"))
+                self._tf_postings.append(array("H"))
+            self._doc_postings[term_id].append(slot)
+            self._tf_postings[term_id].append(min(tf, 65535))
+
+    def _remove(self, job_id: int):
+        slot = self._slots.pop(job_id, None)
+        if slot is None:
+            return
+        self._slot_job_ids[slot] = -1
+        self._total_length -= self._slot_lengths[slot]
+        self._deleted += 1
+
+    def _compact(self):
+        live = np.frombuffer(self._slot_job_ids, dtype=np.int64) >= 0
+        new_slot = np.cumsum(live, dtype=np.int64) - 1
+
+        for term_id in range(len(self._doc_postings)):
+            docs = np.frombuffer(self._doc_postings[term_id], dtype=np.int32)
+            tfs = np.frombuffer(self._tf_postings[term_id], dtype=np.uint16)
+            keep = live[docs]
+            self._doc_postings[term_id] = array("i", new_slot[docs[keep]].astype(np.int32).tobytes())
+            self._tf_postings[term_id] = array("H", tfs[keep].tobytes())
+
+        job_ids = np.frombuffer(self._slot_job_ids, dtype=np.int64)[live]
+        lengths = np.frombuffer(self._slot_lengths, dtype=np.uint32)[live]
+        self._slot_job_ids = array("q", job_ids.tobytes())
+        self._slot_lengths = array("I", lengths.tobytes())
+        self._slots = {int(job_id): i for i, job_id in enumerate(job_ids)}
+        self._deleted = 0
+
+    # --------------------------------------------------
+    # Query
+    # --------------------------------------------------
+    def search(self, text: str, top_k: int = 10, within=None) -> dict[int, float]:
+        """
+        Top-k jobs as {job_id: score}, normalized against the best match
+        (0-100), same shape as the other semantic backends.
+        `within` restricts the search to those job ids.
+        """
+        query_terms = set(tokenize(text))
+
+        with self._lock:
+            if not self._slots:
+                return {}
+            # NumPy views over the postings must not outlive the lock,
+            # or a concurrent append could not resize the arrays.
+            slot_job_ids, scores = self._score(query_terms)
+
+        if within is not None:
+            scores[~np.isin(slot_job_ids, within)] = 0.0
+
+        if len(scores) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(scores))
+
+        top = top[scores[top] > 0]
+        if not len(top):
+            return {}
+
+        best = scores[top].max()
+        return {
+            int(slot_job_ids[slot]): round(float(scores[slot] / best * 100), 2)
+            for slot in top
+        }
+
+    def score_jobs(
+        self,
+        text: str,
+        job_ids: list[int],
+        within=None,
+    ) -> tuple[dict[int, float], float]:
+        """
+        Scores for specific jobs, normalized against the best match over
+        the whole index (or the `within` job ids), plus that best raw
+        BM25 score.
+        """
+        query_terms = set(tokenize(text))
+
+        with self._lock:
+            if not self._slots:
+                return {}, 0.0
+            slot_job_ids, scores = self._score(query_terms)
+
+        reference_scores = scores if within is None else scores[np.isin(slot_job_ids, within)]
+        reference = float(reference_scores.max()) if len(reference_scores) else 0.0
+        if reference <= 0:
+            return {}, 0.0
+
+        slots = np.flatnonzero(np.isin(slot_job_ids, job_ids))
+        return {
+            int(slot_job_ids[slot]): round(float(min(scores[slot] / reference, 1.0) * 100), 2)
+            for slot in slots
+        }, reference
+
+    def _score(self, query_terms: set[str]) -> tuple[np.ndarray, np.ndarray]:
+        n_docs = len(self._slots)
+        slot_job_ids = np.frombuffer(self._slot_job_ids, dtype=np.int64)
+        lengths = np.frombuffer(self._slot_lengths, dtype=np.uint32)
+        avg_length = self._total_length / n_docs or 1.0
+
+        # float32 throughout: the gathers over long postings are memory bound
+        length_norm = (self.k1 * (1 - self.b + self.b * lengths / avg_length)).astype(np.float32)
+        k1_plus_1 = np.float32(self.k1 + 1)
+
+        scores = np.zeros(len(slot_job_ids), dtype=np.float32)
+
+        for term in query_terms:
+            term_id = self._terms.get(term)
+            if term_id is None:
+                continue
+
+            docs = np.frombuffer(self._doc_postings[term_id], dtype=np.int32)
+            tfs = np.frombuffer(self._tf_postings[term_id], dtype=np.uint16).astype(np.float32)
+
+            df = len(docs)
+            idf = np.float32(math.log(1 + (n_docs - df + 0.5) / (df + 0.5)))
+            # Slots are unique within a posting list, so fancy-index += is safe
+            scores[docs] += idf * k1_plus_1 * tfs / (tfs + length_norm[docs])
+
+        scores[slot_job_ids < 0] = 0.0
+        return slot_job_ids.copy(), scores
@@ -0,0 +1,195 @@
+# app/services/chunked_search.py
+"""
+Multi-query semantic search over a whole resume.
+
+The resume is split into overlapping chunks, each chunk is searched
+concurrently (bounded fan-out) and the per-chunk results are fused,
+so later sections of a long resume count too.
+
+Fusion keeps each job's best chunk score. Every chunk is normalized
+against its own best match, the same way in search and score_jobs, so
+both give a job the same fused score and can be mixed in one ranking.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.job_filters import JobFilters
+from app.services.semantic_search import (
+    search_with_fallback,
+    search_with_fallback_async,
+    score_jobs_with_fallback,
+    score_jobs_with_fallback_async,
+)
+
+# "prefix":  one query with the first SEMANTIC_QUERY_CHARS characters (default)
+# "chunked": one query per chunk, fused
+SEMANTIC_QUERY_MODE = os.getenv("SEMANTIC_QUERY_MODE", "prefix")
+
+SEMANTIC_CHUNK_CHARS = int(os.getenv("SEMANTIC_CHUNK_CHARS", "1500"))
+SEMANTIC_CHUNK_OVERLAP = int(os.getenv("SEMANTIC_CHUNK_OVERLAP", "200"))
+SEMANTIC_MAX_CHUNKS = int(os.getenv("SEMANTIC_MAX_CHUNKS", "8"))
+
+# Chunk queries in flight at once: per request on the async path,
+# shared worker pool size on the sync path
+SEMANTIC_CHUNK_CONCURRENCY = int(os.getenv("SEMANTIC_CHUNK_CONCURRENCY", "8"))
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def chunk_text(
+    text: str,
+    size: int = SEMANTIC_CHUNK_CHARS,
+    overlap: int = SEMANTIC_CHUNK_OVERLAP,
+    max_chunks: int = SEMANTIC_MAX_CHUNKS,
+) -> list[str]:
+    """
+    Overlapping chunks of at most `size` characters, cut on whitespace
+    where possible.
+    """
+    text = " ".join((text or "").split())
+    if len(text) <= size:
+        return [text] if text else []
+
+    step = max(1, size - overlap)
+    chunks, start = [], 0
+
+    while start < len(text) and len(chunks) < max_chunks:
+        end = min(start + size, len(text))
+        if end < len(text):
+            cut = text.rfind(" ", start + step, end)
+            if cut > start:
+                end = cut
+        chunks.append(text[start:end])
+        if end >= len(text):
+            break
+
+        start = max(end - overlap, start + 1)
+        # Start on a word, not inside one
+        if text[start - 1] != " ":
+            space = text.find(" ", start, end)
+            if space != -1:
+                start = space + 1
+
+    return chunks
+
+
+# --------------------------------------------------
+# Fusion
+# --------------------------------------------------
+def fuse_max(results: list[dict[int, float]]) -> dict[int, float]:
+    fused: dict[int, float] = {}
+    for scores in results:
+        for job_id, score in scores.items():
+            if score > fused.get(job_id, 0.0):
+                fused[job_id] = score
+    return fused
+
+
+def fuse(results: list[dict[int, float]], top_k: int) -> dict[int, float]:
+    """
+    Merge per-chunk {job_id: 0-100} results and keep the best top_k.
+    """
+    fused = fuse_max(results)
+    best = sorted(fused, key=fused.get, reverse=True)[:top_k]
+    return {job_id: fused[job_id] for job_id in best}
+
+
+def fuse_exact(results: list[tuple[dict[int, float], float]]) -> tuple[dict[int, float], float]:
+    """
+    Exact per-job scores across chunks, fused like search results. The
+    reference is the largest per-chunk raw reference.
+    """
+    scores = fuse_max([r[0] for r in results])
+    reference = max((r[1] for r in results), default=0.0)
+    return scores, reference
+
+
+# --------------------------------------------------
+# Fan-out
+# --------------------------------------------------
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=SEMANTIC_CHUNK_CONCURRENCY,
+                    thread_name_prefix="semantic-chunk",
+                )
+    return _executor
+
+
+def chunked_search(
+    resume_text: str,
+    top_k: int = 10,
+    filters: JobFilters | None = None,
+) -> dict[int, float]:
+    chunks = chunk_text(resume_text)
+    if len(chunks) <= 1:
+        return search_with_fallback(chunks[0] if chunks else "", top_k, filters)
+
+    results = list(_get_executor().map(lambda c: search_with_fallback(c, top_k, filters), chunks))
+    return fuse(results, top_k)
+
+
+async def chunked_search_async(
+    resume_text: str,
+    top_k: int = 10,
+    filters: JobFilters | None = None,
+) -> dict[int, float]:
+    chunks = chunk_text(resume_text)
+    if len(chunks) <= 1:
+        return await search_with_fallback_async(chunks[0] if chunks else "", top_k, filters)
+
+    limiter = asyncio.Semaphore(SEMANTIC_CHUNK_CONCURRENCY)
+
+    async def one(chunk: str):
+        async with limiter:
+            return await search_with_fallback_async(chunk, top_k, filters)
+
+    results = await asyncio.gather(*(one(chunk) for chunk in chunks))
+    return fuse(list(results), top_k)
+
+
+def chunked_score_jobs(
+    resume_text: str,
+    job_ids: list[int],
+    filters: JobFilters | None = None,
+) -> tuple[dict[int, float], float]:
+    chunks = chunk_text(resume_text)
+    if len(chunks) <= 1:
+        return score_jobs_with_fallback(chunks[0] if chunks else "", job_ids, filters)
+
+    results = list(_get_executor().map(
+        lambda c: score_jobs_with_fallback(c, job_ids, filters), chunks
+    ))
+    return fuse_exact(results)
+
+
+async def chunked_score_jobs_async(
+    resume_text: str,
+    job_ids: list[int],
+    filters: JobFilters | None = None,
+) -> tuple[dict[int, float], float]:
+    chunks = chunk_text(resume_text)
+    if len(chunks) <= 1:
+        return await score_jobs_with_fallback_async(chunks[0] if chunks else "", job_ids, filters)
+
+    limiter = asyncio.Semaphore(SEMANTIC_CHUNK_CONCURRENCY)
+
+    async def one(chunk: str):
+        async with limiter:
+            return await score_jobs_with_fallback_async(chunk, job_ids, filters)
+
+    return fuse_exact(list(await asyncio.gather(*(one(chunk) for chunk in chunks))))
+
+
+def close_chunk_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
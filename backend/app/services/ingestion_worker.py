@@ -0,0 +1,83 @@
+# app/services/ingestion_worker.py
+"""
+Pool of background threads draining the resume ingestion queue.
+
+Uploads in this process wake the workers immediately; the queue is also
+polled every RESUME_INGEST_POLL_SECONDS, which picks up rows queued by
+other processes or left over from a restart. Heavy lifting happens
+elsewhere (OCR process pool, Document Intelligence), so threads suffice.
+"""
+import logging
+import os
+import threading
+
+from app.db.session import SessionLocal
+from app.services.resume_ingestion import (
+    claim_resume,
+    fail_exhausted_resumes,
+    ingest_resume,
+    pending_resume_ids,
+)
+
+logger = logging.getLogger(__name__)
+
+RESUME_INGEST_WORKERS = int(os.getenv("RESUME_INGEST_WORKERS", "2"))
+RESUME_INGEST_POLL_SECONDS = float(os.getenv("RESUME_INGEST_POLL_SECONDS", "5"))
+
+
+class IngestionWorker:
+    def __init__(self, workers: int = RESUME_INGEST_WORKERS):
+        self.workers = workers
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self):
+        if self._threads:
+            return
+        self._stopping.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"resume-ingest-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0):
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            # Cleared before looking, so an upload arriving meanwhile is not missed
+            self._wake.clear()
+            try:
+                worked = self._drain()
+            except Exception:
+                logger.exception("Resume ingestion loop failed")
+                worked = False
+
+            if not worked:
+                self._wake.wait(RESUME_INGEST_POLL_SECONDS)
+
+    def _drain(self) -> bool:
+        """
+        Claim and ingest one pending resume. False if none was claimed.
+        """
+        db = SessionLocal()
+        try:
+            fail_exhausted_resumes(db)
+            for resume_id in pending_resume_ids(db, self.workers + 1):
+                if claim_resume(db, resume_id):
+                    ingest_resume(db, resume_id)
+                    return True
+            return False
+        finally:
+            db.close()
+
+
+ingestion_worker = IngestionWorker()
@@ -0,0 +1,421 @@
+# app/services/job_catalog.py
+import os
+import threading
+import time
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.skill_ontology import SKILL_ONTOLOGY
+from app.db.models import Job
+from app.services.job_filters import ACTIVE_JOBS, JobFilters
+from app.services.skill_extraction import extract_skills
+
+# Full reload interval, to pick up changes made by other workers.
+# Changes made in this process are applied incrementally right away.
+JOB_CATALOG_REFRESH_SECONDS = int(os.getenv("JOB_CATALOG_REFRESH_SECONDS", "300"))
+
+# Bit position of every canonical skill
+SKILL_INDEX = {skill: i for i, skill in enumerate(SKILL_ONTOLOGY)}
+SKILL_NAMES = list(SKILL_ONTOLOGY)
+MASK_WORDS = max(1, (len(SKILL_INDEX) + 63) // 64)
+
+_POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+# --------------------------------------------------
+# Bitmask helpers
+# --------------------------------------------------
+def skills_to_mask(skills) -> np.ndarray:
+    """
+    Pack canonical skills into a uint64 bitmask (unknown skills ignored).
+    """
+    mask = np.zeros(MASK_WORDS, dtype=np.uint64)
+    for skill in skills or ():
+        bit = SKILL_INDEX.get(skill)
+        if bit is not None:
+            mask[bit // 64] |= np.uint64(1 << (bit % 64))
+    return mask
+
+
+def mask_to_skills(mask: np.ndarray) -> set[str]:
+    return {SKILL_NAMES[i] for i in mask_bits(mask)}
+
+
+def mask_bits(mask: np.ndarray) -> np.ndarray:
+    """
+    Skill bit positions set in a mask.
+    """
+    bits = np.unpackbits(mask.astype("<u8").view(np.uint8), bitorder="little")
+    return np.flatnonzero(bits[:len(SKILL_NAMES)])
+
+
+def popcount_rows(words: np.ndarray) -> np.ndarray:
+    """
+    Number of set bits per row of a 2-D uint64 array.
+    """
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int32)
+
+    as_bytes = np.ascontiguousarray(words).view(np.uint8)
+    return _POPCOUNT_8[as_bytes].sum(axis=1, dtype=np.int32)
+
+
+class CodeTable:
+    """
+    Interns short strings (status, type, location) as small int codes.
+    """
+
+    MISSING = -1
+
+    def __init__(self):
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str | None) -> int:
+        if value is None:
+            return self.MISSING
+        if value not in self._codes:
+            self._codes[value] = len(self._codes)
+        return self._codes[value]
+
+    def lookup(self, value: str | None) -> int:
+        if value is None:
+            return self.MISSING
+        return self._codes.get(value, self.MISSING)
+
+
+# --------------------------------------------------
+# Job catalog snapshot
+# --------------------------------------------------
+class JobCatalogSnapshot:
+    """
+    Compact in-memory view of the jobs table for batch scoring.
+
+    Row i of every array describes the same job. Rows are kept dense:
+    removing a job moves the last row into its slot.
+
+    An inverted index (skill bit -> rows having it) drives candidate
+    generation; its sorted posting arrays are rebuilt lazily per skill
+    after changes.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.RLock()
+        self._rows: dict[int, int] = {}
+        self.size = 0
+        self.loaded_at = 0.0
+
+        self.statuses = CodeTable()
+        self.job_types = CodeTable()
+        self.locations = CodeTable()
+
+        self._allocate(capacity)
+        self.embeddings: np.ndarray | None = None
+
+        self._postings: list[set[int]] = [set() for _ in SKILL_NAMES]
+        self._posting_arrays: list[np.ndarray | None] = [None] * len(SKILL_NAMES)
+
+    def _allocate(self, capacity: int):
+        self.job_ids = np.zeros(capacity, dtype=np.int64)
+        self.masks = np.zeros((capacity, MASK_WORDS), dtype=np.uint64)
+        self.skill_counts = np.zeros(capacity, dtype=np.int32)
+        self.status_codes = np.full(capacity, CodeTable.MISSING, dtype=np.int32)
+        self.type_codes = np.full(capacity, CodeTable.MISSING, dtype=np.int32)
+        self.location_codes = np.full(capacity, CodeTable.MISSING, dtype=np.int32)
+
+    def _grow(self):
+        capacity = max(1024, len(self.job_ids) * 2)
+
+        def grown(arr, fill=0):
+            out = np.full((capacity,) + arr.shape[1:], fill, dtype=arr.dtype)
+            out[:self.size] = arr[:self.size]
+            return out
+
+        self.job_ids = grown(self.job_ids)
+        self.masks = grown(self.masks)
+        self.skill_counts = grown(self.skill_counts)
+        self.status_codes = grown(self.status_codes, CodeTable.MISSING)
+        self.type_codes = grown(self.type_codes, CodeTable.MISSING)
+        self.location_codes = grown(self.location_codes, CodeTable.MISSING)
+        if self.embeddings is not None:
+            self.embeddings = grown(self.embeddings)
+
+    # --------------------------------------------------
+    # Loading / incremental updates
+    # --------------------------------------------------
+    def load(self, db: Session):
+        """
+        Full rebuild from the jobs table (only the columns needed).
+        """
+        rows = db.query(
+            Job.id,
+            Job.skills_json,
+            Job.description,
+            Job.job_status,
+            Job.job_type,
+            Job.location,
+        ).yield_per(1000)
+
+        fresh = JobCatalogSnapshot(capacity=1024)
+        for job_id, skills, description, job_status, job_type, location in rows:
+            if skills is None:
+                skills = extract_skills(description)
+            fresh.upsert(job_id, skills, job_status, job_type, location)
+
+        with self._lock:
+            self.__dict__.update({
+                k: v for k, v in fresh.__dict__.items() if k != "_lock"
+            })
+            self.loaded_at = time.monotonic()
+
+    def upsert(
+        self,
+        job_id: int,
+        skills,
+        job_status: str | None,
+        job_type: str | None,
+        location: str | None,
+    ):
+        mask = skills_to_mask(skills)
+
+        with self._lock:
+            row = self._rows.get(job_id)
+            if row is None:
+                if self.size == len(self.job_ids):
+                    self._grow()
+                row = self.size
+                self.size += 1
+                self._rows[job_id] = row
+            else:
+                self._unindex(row, self.masks[row])
+
+            self._index(row, mask)
+            self.job_ids[row] = job_id
+            self.masks[row] = mask
+            self.skill_counts[row] = popcount_rows(mask[None, :])[0]
+            self.status_codes[row] = self.statuses.code(job_status)
+            self.type_codes[row] = self.job_types.code(job_type)
+            self.location_codes[row] = self.locations.code(location)
+
+    def upsert_job(self, job: Job):
+        skills = job.skills_json
+        if skills is None:
+            skills = extract_skills(job.description)
+        self.upsert(job.id, skills, job.job_status, job.job_type, job.location)
+
+    def remove(self, job_id: int):
+        with self._lock:
+            row = self._rows.pop(job_id, None)
+            if row is None:
+                return
+
+            self._unindex(row, self.masks[row])
+
+            last = self.size - 1
+            if row != last:
+                moved_id = int(self.job_ids[last])
+                self._unindex(last, self.masks[last])
+                for arr in self._row_arrays():
+                    arr[row] = arr[last]
+                self._index(row, self.masks[row])
+                self._rows[moved_id] = row
+
+            self.size = last
+
+    def _index(self, row: int, mask: np.ndarray):
+        for bit in mask_bits(mask):
+            self._postings[bit].add(row)
+            self._posting_arrays[bit] = None
+
+    def _unindex(self, row: int, mask: np.ndarray):
+        for bit in mask_bits(mask):
+            self._postings[bit].discard(row)
+            self._posting_arrays[bit] = None
+
+    def _posting_rows(self, bit: int) -> np.ndarray:
+        rows = self._posting_arrays[bit]
+        if rows is None:
+            rows = np.array(sorted(self._postings[bit]), dtype=np.int64)
+            self._posting_arrays[bit] = rows
+        return rows
+
+    def set_embedding(self, job_id: int, vector: np.ndarray):
+        """
+        Attach an optional embedding to a job (enables semantic batch scoring).
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+
+        with self._lock:
+            row = self._rows.get(job_id)
+            if row is None:
+                return
+            if self.embeddings is None or self.embeddings.shape[1] != vector.shape[0]:
+                self.embeddings = np.zeros((len(self.job_ids), vector.shape[0]), dtype=np.float32)
+            self.embeddings[row] = vector / norm if norm else vector
+
+    def _row_arrays(self):
+        arrays = [
+            self.job_ids,
+            self.masks,
+            self.skill_counts,
+            self.status_codes,
+            self.type_codes,
+            self.location_codes,
+        ]
+        if self.embeddings is not None:
+            arrays.append(self.embeddings)
+        return arrays
+
+    # --------------------------------------------------
+    # Scoring
+    # --------------------------------------------------
+    def eligible(self, filters: JobFilters | None = ACTIVE_JOBS, rows=None) -> np.ndarray:
+        """
+        Boolean mask of jobs passing the filters (over all rows, or `rows`).
+        """
+        if rows is None:
+            rows = slice(0, self.size)
+        keep = np.ones_like(self.status_codes[rows], dtype=bool)
+        if filters is None:
+            return keep
+
+        columns = {
+            "job_status": (self.status_codes, self.statuses),
+            "job_type": (self.type_codes, self.job_types),
+            "location": (self.location_codes, self.locations),
+        }
+        for field, value in filters.conditions():
+            codes, table = columns[field]
+            code = table.lookup(value)
+            if code == CodeTable.MISSING:
+                # Value never seen: no job can match
+                return np.zeros_like(keep)
+            keep &= codes[rows] == code
+        return keep
+
+    def eligible_job_ids(self, filters: JobFilters | None = ACTIVE_JOBS) -> np.ndarray:
+        with self._lock:
+            return self.job_ids[:self.size][self.eligible(filters)]
+
+    def excluded_count(self, filters: JobFilters | None = ACTIVE_JOBS) -> int:
+        """
+        Jobs in the catalog that the filters rule out.
+        """
+        with self._lock:
+            return int(self.size - self.eligible(filters).sum())
+
+    def candidates(
+        self,
+        resume_skills,
+        limit: int,
+        filters: JobFilters | None = ACTIVE_JOBS,
+    ) -> np.ndarray:
+        """
+        Job ids of the `limit` eligible jobs with the best skill coverage,
+        from the inverted index: only jobs sharing a skill are touched.
+        """
+        bits = [SKILL_INDEX[s] for s in resume_skills or () if s in SKILL_INDEX]
+
+        with self._lock:
+            if not bits or not self.size or limit <= 0:
+                return np.zeros(0, dtype=np.int64)
+
+            overlap = np.bincount(
+                np.concatenate([self._posting_rows(bit) for bit in bits]),
+                minlength=self.size,
+            )
+            rows = np.flatnonzero(overlap)
+            matched = overlap[rows]
+            keep = self.eligible(filters, rows)
+            rows, matched = rows[keep], matched[keep]
+
+            coverage = matched / self.skill_counts[rows]
+            if len(rows) > limit:
+                top = np.argpartition(-coverage, limit - 1)[:limit]
+                rows = rows[top]
+
+            return self.job_ids[rows].copy()
+
+    def score(
+        self,
+        resume_skills,
+        semantic_scores: dict[int, float] | None = None,
+        resume_embedding: np.ndarray | None = None,
+        job_ids=None,
+        filters: JobFilters | None = ACTIVE_JOBS,
+    ) -> dict:
+        """
+        Skill coverage of one resume against every job (or only `job_ids`),
+        in one call.
+
+        Semantic scores come either from `semantic_scores` ({job_id: 0-100},
+        e.g. Azure AI Search results; missing jobs get 0) or, if embeddings
+        are attached, from cosine similarity to `resume_embedding`
+        (normalized to the best match over all jobs, 0-100).
+
+        Returns aligned arrays: job_ids, skill_scores (0-100),
+        matched_counts, semantic_scores, eligible (passing `filters`).
+        """
+        resume_mask = skills_to_mask(resume_skills)
+
+        with self._lock:
+            n = self.size
+            if job_ids is None:
+                rows = np.arange(n)
+            else:
+                rows = np.array(
+                    [self._rows[j] for j in job_ids if j in self._rows],
+                    dtype=np.int64,
+                )
+
+            matched = popcount_rows(self.masks[rows] & resume_mask)
+            counts = self.skill_counts[rows]
+
+            skill_scores = np.zeros(len(rows), dtype=np.float64)
+            has_skills = counts > 0
+            skill_scores[has_skills] = matched[has_skills] / counts[has_skills] * 100
+
+            semantic = np.zeros(len(rows), dtype=np.float64)
+            if semantic_scores:
+                positions = np.full(n, -1, dtype=np.int64)
+                positions[rows] = np.arange(len(rows))
+                for job_id, score in semantic_scores.items():
+                    row = self._rows.get(job_id)
+                    if row is not None and positions[row] >= 0:
+                        semantic[positions[row]] = score
+            elif resume_embedding is not None and self.embeddings is not None and n:
+                query = np.asarray(resume_embedding, dtype=np.float32)
+                norm = np.linalg.norm(query)
+                sims = self.embeddings[:n] @ (query / norm if norm else query)
+                best = sims.max()
+                if best > 0:
+                    semantic = (np.clip(sims, 0, None) / best * 100)[rows]
+
+            job_ids = self.job_ids[rows]
+            eligible = self.eligible(filters, rows)
+
+        return {
+            "job_ids": job_ids,
+            "skill_scores": skill_scores,
+            "matched_counts": matched,
+            "semantic_scores": semantic,
+            "eligible": eligible,
+        }
+
+
+job_catalog = JobCatalogSnapshot()
+_load_lock = threading.Lock()
+
+
+def get_job_catalog(db: Session) -> JobCatalogSnapshot:
+    """
+    Shared snapshot, loaded on first use and reloaded periodically.
+    """
+    stale = time.monotonic() - job_catalog.loaded_at > JOB_CATALOG_REFRESH_SECONDS
+    if not job_catalog.loaded_at or stale:
+        with _load_lock:
+            stale = time.monotonic() - job_catalog.loaded_at > JOB_CATALOG_REFRESH_SECONDS
+            if not job_catalog.loaded_at or stale:
+                job_catalog.load(db)
+    return job_catalog
@@ -0,0 +1,25 @@
+# app/services/job_events.py
+"""
+Keeps in-process job indexes in step with writes to the jobs table.
+Call after the job change is committed.
+"""
+from app.db.models import Job
+from app.services.job_catalog import job_catalog
+from app.services.match_worker import match_worker
+from app.services.recommendation_cache import recommendation_cache
+from app.services.semantic_search import started_backends
+
+
+def job_saved(job: Job):
+    job_catalog.upsert_job(job)
+    for backend in started_backends():
+        backend.job_saved(job)
+    match_worker.enqueue_job(job.id)
+    recommendation_cache.clear()
+
+
+def job_deleted(job_id: int):
+    job_catalog.remove(job_id)
+    for backend in started_backends():
+        backend.job_deleted(job_id)
+    recommendation_cache.clear()
@@ -0,0 +1,39 @@
+# app/services/job_filters.py
+from typing import NamedTuple
+
+from sqlalchemy.orm import Query
+
+from app.db.models import Job
+
+
+class JobFilters(NamedTuple):
+    """
+    Job eligibility filters, pushed down into retrieval: the Azure AI
+    Search OData filter, the in-memory job catalog and SQL fetches.
+    Values match exactly; None means "any".
+    """
+
+    job_status: str | None = "active"
+    job_type: str | None = None
+    location: str | None = None
+
+    def conditions(self) -> list[tuple[str, str]]:
+        return [(field, value) for field, value in self._asdict().items() if value is not None]
+
+    def odata(self) -> str:
+        """
+        OData filter for the search index (fields must be filterable).
+        """
+        return " and ".join(
+            "{} eq '{}'".format(field, value.replace("'", "''"))
+            for field, value in self.conditions()
+        )
+
+    def apply(self, query: Query) -> Query:
+        for field, value in self.conditions():
+            query = query.filter(getattr(Job, field) == value)
+        return query
+
+
+# Default for recommendations: never recommend closed jobs
+ACTIVE_JOBS = JobFilters()
@@ -0,0 +1,213 @@
+# app/services/local_vector_index.py
+import os
+import threading
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db.models import Job
+from app.services.skill_extraction import get_nlp
+
+LOCAL_VECTOR_INDEX_DIR = os.getenv("LOCAL_VECTOR_INDEX_DIR", "data/vector_index")
+
+
+def embed_text(text: str) -> np.ndarray:
+    """
+    Mean of the spaCy model's word vectors (no pipes are run).
+    """
+    nlp = get_nlp(())
+    return nlp.make_doc(text or "").vector.astype(np.float32)
+
+
+def job_text(title: str | None, description: str | None) -> str:
+    return f"{title or ''}\n{description or ''}"
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+class LocalVectorIndex:
+    """
+    In-process cosine index over job embeddings.
+
+    Vectors are stored L2-normalized in `vectors.npy` (float32, n × dim)
+    next to `job_ids.npy`, and memory-mapped on load. Updates are made
+    copy-on-write in memory and written back by save().
+    """
+
+    def __init__(self, index_dir: str = LOCAL_VECTOR_INDEX_DIR):
+        self.index_dir = index_dir
+        self._lock = threading.Lock()
+        self.job_ids = np.zeros(0, dtype=np.int64)
+        self.vectors: np.ndarray | None = None
+        self._rows: dict[int, int] = {}
+        self.dirty = False
+
+    @property
+    def size(self) -> int:
+        return len(self.job_ids)
+
+    # --------------------------------------------------
+    # Persistence
+    # --------------------------------------------------
+    def _paths(self):
+        return (
+            os.path.join(self.index_dir, "job_ids.npy"),
+            os.path.join(self.index_dir, "vectors.npy"),
+        )
+
+    def exists(self) -> bool:
+        return all(os.path.exists(p) for p in self._paths())
+
+    def load(self):
+        ids_path, vectors_path = self._paths()
+        job_ids = np.load(ids_path)
+        vectors = np.load(vectors_path, mmap_mode="c")
+
+        with self._lock:
+            self.job_ids = job_ids
+            self.vectors = vectors
+            self._rows = {int(job_id): i for i, job_id in enumerate(job_ids)}
+            self.dirty = False
+
+    def save(self):
+        if self.vectors is None:
+            return
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        ids_path, vectors_path = self._paths()
+
+        with self._lock:
+            job_ids, vectors = self.job_ids, np.asarray(self.vectors)
+            self.dirty = False
+
+        # Write to temp files first so a crash never leaves half an index
+        for path, arr in ((ids_path, job_ids), (vectors_path, vectors)):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp_path, path)
+
+    def build(self, db: Session, batch_size: int = 1000):
+        """
+        Embed every job from the jobs table and persist the index.
+        """
+        ids, vectors = [], []
+        rows = db.query(Job.id, Job.title, Job.description).yield_per(batch_size)
+
+        for job_id, title, description in rows:
+            ids.append(job_id)
+            vectors.append(embed_text(job_text(title, description)))
+
+        with self._lock:
+            self.job_ids = np.array(ids, dtype=np.int64)
+            self.vectors = (
+                _normalize_rows(np.vstack(vectors)) if vectors
+                else np.zeros((0, get_nlp(()).vocab.vectors_length), dtype=np.float32)
+            )
+            self._rows = {job_id: i for i, job_id in enumerate(ids)}
+
+        self.save()
+
+    # --------------------------------------------------
+    # Incremental updates
+    # --------------------------------------------------
+    def upsert(self, job_id: int, text: str):
+        vector = _normalize_rows(embed_text(text)[None, :])
+
+        with self._lock:
+            row = self._rows.get(job_id)
+            if row is not None:
+                self.vectors[row] = vector[0]
+            else:
+                self._rows[job_id] = len(self.job_ids)
+                self.job_ids = np.append(self.job_ids, np.int64(job_id))
+                self.vectors = (
+                    vector if self.vectors is None
+                    else np.vstack([self.vectors, vector])
+                )
+            self.dirty = True
+
+    def remove(self, job_id: int):
+        with self._lock:
+            row = self._rows.pop(job_id, None)
+            if row is None:
+                return
+            self.job_ids = np.delete(self.job_ids, row)
+            self.vectors = np.delete(self.vectors, row, axis=0)
+            self._rows = {int(j): i for i, j in enumerate(self.job_ids)}
+            self.dirty = True
+
+    # --------------------------------------------------
+    # Query
+    # --------------------------------------------------
+    def similarities(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine similarity of `text` to every indexed job: (job_ids, sims).
+        """
+        query = embed_text(text)
+        norm = np.linalg.norm(query)
+
+        with self._lock:
+            job_ids, vectors = self.job_ids, self.vectors
+
+        if vectors is None or not len(job_ids) or not norm:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        return job_ids, vectors @ (query / norm)
+
+    def search(self, text: str, top_k: int = 10, within=None) -> dict[int, float]:
+        """
+        Top-k jobs as {job_id: score}, normalized against the best match
+        (0-100), same scale as the Azure AI Search scores.
+        `within` restricts the search to those job ids.
+        """
+        job_ids, sims = self.similarities(text)
+        if within is not None:
+            keep = np.isin(job_ids, within)
+            job_ids, sims = job_ids[keep], sims[keep]
+        if not len(sims):
+            return {}
+
+        if len(sims) > top_k:
+            top = np.argpartition(-sims, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(sims))
+
+        best = sims[top].max()
+        if best <= 0:
+            return {}
+
+        return {
+            int(job_ids[i]): round(float(max(sims[i], 0.0) / best * 100), 2)
+            for i in top
+        }
+
+    def score_jobs(
+        self,
+        text: str,
+        job_ids: list[int],
+        within=None,
+    ) -> tuple[dict[int, float], float]:
+        """
+        Scores for specific jobs, normalized against the best match over
+        the whole index (or the `within` job ids), plus that best raw
+        similarity.
+        """
+        all_ids, sims = self.similarities(text)
+        reference_sims = sims if within is None else sims[np.isin(all_ids, within)]
+        if not len(reference_sims):
+            return {}, 0.0
+
+        reference = float(reference_sims.max())
+        if reference <= 0:
+            return {}, 0.0
+
+        rows = np.flatnonzero(np.isin(all_ids, job_ids))
+        return {
+            int(all_ids[i]): round(float(min(max(sims[i], 0.0) / reference, 1.0) * 100), 2)
+            for i in rows
+        }, reference
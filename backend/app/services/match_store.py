@@ -0,0 +1,174 @@
+# app/services/match_store.py
+"""
+Materialized match scores: the best MATCH_SCORES_PER_RESUME jobs of
+every resume, kept in the match_scores table.
+
+Rows record the catalog version they were computed against; the
+version is bumped in the same transaction as every job change.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from app.db.models import CatalogState, Job, MatchScore, Resume
+from app.services.matching_service import (
+    compute_semantic_scores_for_jobs,
+    get_job_skills,
+    rank_jobs_for_resume,
+)
+from app.services.resume_catalog import get_resume_catalog
+
+MATCH_SCORES_PER_RESUME = int(os.getenv("MATCH_SCORES_PER_RESUME", "100"))
+
+# Resumes (by skill coverage) re-scored when a job is created or updated
+MATCH_JOB_RESUME_POOL = int(os.getenv("MATCH_JOB_RESUME_POOL", "200"))
+MATCH_JOB_SEMANTIC_CONCURRENCY = int(os.getenv("MATCH_JOB_SEMANTIC_CONCURRENCY", "8"))
+
+
+# --------------------------------------------------
+# Catalog version
+# --------------------------------------------------
+def get_catalog_version(db: Session) -> int:
+    version = db.query(CatalogState.version).filter(CatalogState.id == 1).scalar()
+    return version or 0
+
+
+def bump_catalog_version(db: Session):
+    """
+    Mark the job catalog as changed. Call before committing a job change.
+    """
+    db.query(CatalogState).filter(CatalogState.id == 1).update(
+        {CatalogState.version: CatalogState.version + 1},
+        synchronize_session=False,
+    )
+
+
+# --------------------------------------------------
+# Reads
+# --------------------------------------------------
+def read_top_matches(db: Session, resume_id: int, limit: int) -> list[tuple[Job, MatchScore]]:
+    """
+    Best stored matches of a resume among active jobs
+    (index range scan on resume_id, fit_score).
+    """
+    return (
+        db.query(Job, MatchScore)
+        .join(MatchScore, MatchScore.job_id == Job.id)
+        .filter(MatchScore.resume_id == resume_id, Job.job_status == "active")
+        .order_by(MatchScore.fit_score.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+# --------------------------------------------------
+# Writes (run by the match worker)
+# --------------------------------------------------
+def refresh_resume_scores(db: Session, resume_id: int):
+    """
+    Recompute one row of the matrix: a resume against the job catalog.
+    """
+    resume = db.get(Resume, resume_id)
+    db.query(MatchScore).filter(MatchScore.resume_id == resume_id).delete(
+        synchronize_session=False
+    )
+
+    if resume is not None and resume.status == "ready":
+        version = get_catalog_version(db)
+        ranked, partial = rank_jobs_for_resume(db, resume, MATCH_SCORES_PER_RESUME)
+        if partial:
+            # Stored as stale, so readers re-enqueue it and --stale retries it
+            version -= 1
+        if ranked:
+            db.execute(insert(MatchScore), [
+                {"resume_id": resume_id, "catalog_version": version, **scores}
+                for scores in ranked
+            ])
+
+    db.commit()
+
+
+def refresh_job_scores(db: Session, job_id: int):
+    """
+    Recompute one column of the matrix: a job against the resumes that
+    cover its skills best. Each touched resume keeps its top
+    MATCH_SCORES_PER_RESUME rows.
+    """
+    job = db.get(Job, job_id)
+    db.query(MatchScore).filter(MatchScore.job_id == job_id).delete(
+        synchronize_session=False
+    )
+
+    if job is None or job.job_status != "active":
+        db.commit()
+        return
+
+    version = get_catalog_version(db)
+    pool = get_resume_catalog(db).top_for_job(
+        get_job_skills(job), MATCH_JOB_RESUME_POOL, one_per_user=False
+    )
+    resume_ids = pool["resume_ids"].tolist()
+    texts = dict(
+        db.query(Resume.id, Resume.parsed_text).filter(Resume.id.in_(resume_ids)).all()
+    )
+
+    def semantic_score(resume_id: int) -> float | None:
+        try:
+            scores, _ = compute_semantic_scores_for_jobs(texts[resume_id] or "", [job_id])
+        except Exception:
+            return None  # not stored: a failed search is not a score of 0
+        return scores.get(job_id, 0.0)
+
+    resume_ids = [r for r in resume_ids if r in texts]
+    with ThreadPoolExecutor(max_workers=MATCH_JOB_SEMANTIC_CONCURRENCY) as executor:
+        semantic_scores = {
+            resume_id: score
+            for resume_id, score in zip(resume_ids, executor.map(semantic_score, resume_ids))
+            if score is not None
+        }
+
+    rows = []
+    for resume_id, skill_score in zip(pool["resume_ids"].tolist(), pool["skill_scores"].tolist()):
+        if resume_id not in semantic_scores:
+            continue
+        skill_score = round(skill_score, 2)
+        semantic = semantic_scores[resume_id]
+        rows.append({
+            "resume_id": resume_id,
+            "job_id": job_id,
+            "fit_score": round(0.6 * skill_score + 0.4 * semantic, 2),
+            "skill_score": skill_score,
+            "semantic_score": semantic,
+            "catalog_version": version,
+        })
+
+    if rows:
+        db.execute(insert(MatchScore), rows)
+        trim_resume_scores(db, [r["resume_id"] for r in rows])
+
+    db.commit()
+
+
+def trim_resume_scores(db: Session, resume_ids: list[int]):
+    """
+    Keep only the top MATCH_SCORES_PER_RESUME rows of each resume.
+    """
+    db.execute(
+        text("""
+            DELETE FROM match_scores m
+            USING (
+                SELECT resume_id, job_id,
+                       row_number() OVER (
+                           PARTITION BY resume_id ORDER BY fit_score DESC
+                       ) AS rank
+                FROM match_scores
+                WHERE resume_id = ANY(:resume_ids)
+            ) ranked
+            WHERE m.resume_id = ranked.resume_id
+              AND m.job_id = ranked.job_id
+              AND ranked.rank > :keep
+        """),
+        {"resume_ids": resume_ids, "keep": MATCH_SCORES_PER_RESUME},
+    )
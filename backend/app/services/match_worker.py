@@ -0,0 +1,80 @@
+# app/services/match_worker.py
+"""
+Background thread keeping match_scores up to date.
+
+Writes enqueue the affected row (resume uploaded) or column (job
+created / updated) of the resume × job matrix; repeated requests for
+the same row or column are coalesced while queued.
+"""
+import logging
+import queue
+import threading
+
+from app.db.session import SessionLocal
+from app.services.match_store import refresh_job_scores, refresh_resume_scores
+from app.services.recommendation_cache import recommendation_cache
+
+logger = logging.getLogger(__name__)
+
+_STOP = ("stop", 0)
+
+
+class MatchWorker:
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: set[tuple[str, int]] = set()
+        self._pending_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="match-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def enqueue_resume(self, resume_id: int):
+        self._enqueue(("resume", resume_id))
+
+    def enqueue_job(self, job_id: int):
+        self._enqueue(("job", job_id))
+
+    def _enqueue(self, task: tuple[str, int]):
+        with self._pending_lock:
+            if task in self._pending:
+                return
+            self._pending.add(task)
+        self._queue.put(task)
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            if task == _STOP:
+                return
+
+            with self._pending_lock:
+                self._pending.discard(task)
+
+            kind, key = task
+            db = SessionLocal()
+            try:
+                if kind == "resume":
+                    refresh_resume_scores(db, key)
+                    recommendation_cache.invalidate_resume(key)
+                else:
+                    refresh_job_scores(db, key)
+                    recommendation_cache.clear()
+            except Exception:
+                db.rollback()
+                logger.exception("Failed to refresh match scores for %s %s", kind, key)
+            finally:
+                db.close()
+
+
+match_worker = MatchWorker()
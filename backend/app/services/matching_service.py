@@ -1,50 +1,253 @@
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future
+
+import numpy as np
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.db.models import Resume, Job
+from app.db.models import MatchScore, Resume, Job
 from app.services.skill_extraction import extract_skills
-from app.services.azure_search_client import search_client
+from app.services.semantic_search import (
+    search_with_fallback,
+    search_with_fallback_async,
+    score_jobs_with_fallback,
+    score_jobs_with_fallback_async,
+    SEMANTIC_QUERY_CHARS,
+)
+from app.services.chunked_search import (
+    SEMANTIC_QUERY_MODE,
+    chunked_search,
+    chunked_search_async,
+    chunked_score_jobs,
+    chunked_score_jobs_async,
+)
+from app.services.job_catalog import JobCatalogSnapshot, get_job_catalog
+from app.services.job_filters import ACTIVE_JOBS, JobFilters
+from app.services.resume_catalog import get_resume_catalog
+
+logger = logging.getLogger(__name__)
+
+# Two-stage recommendation retrieval: candidates are the semantic top-k
+# plus the best skill-overlap jobs from the catalog's inverted index.
+# Skill candidates outside the semantic top-k get an exact semantic score
+# (bounded by a time budget on the async path) before re-ranking.
+RECOMMEND_SEMANTIC_TOP_K = int(os.getenv("RECOMMEND_SEMANTIC_TOP_K", "50"))
+RECOMMEND_SKILL_CANDIDATES = int(os.getenv("RECOMMEND_SKILL_CANDIDATES", "200"))
+RECOMMEND_RESCORE_TIMEOUT_SECONDS = float(os.getenv("RECOMMEND_RESCORE_TIMEOUT_SECONDS", "2"))
+
+# Recruiter-side ranking: resumes are preselected by skill coverage over
+# the resume catalog snapshot; semantic scores of the pool come from the
+# materialized match_scores in one query, and only resumes without a
+# stored score are scored live, with bounded concurrency (same time
+# budget as above). Resumes left unscored are not ranked.
+RECRUITER_CANDIDATE_POOL = int(os.getenv("RECRUITER_CANDIDATE_POOL", "50"))
+RECRUITER_SEMANTIC_CONCURRENCY = int(os.getenv("RECRUITER_SEMANTIC_CONCURRENCY", "10"))
 
 
 # --------------------------------------------------
-# Azure AI Search semantic similarity
+# Single-flight: share identical in-flight computations
 # --------------------------------------------------
-def compute_semantic_score(resume_text: str, top_k: int = 10) -> dict:
-    safe_resume_text = resume_text[:1500]
+class SingleFlight:
+    """
+    Concurrent callers with the same key share one in-flight call:
+    the first runs it, the others wait for its result (or exception).
+    Sync and async callers are tracked separately. Results are shared
+    between callers and must not be mutated.
+    """
 
-    results = list(search_client.search(
-        search_text=safe_resume_text,
-        top=top_k,
-        include_total_count=False
-    ))
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+        self._async_calls: dict = {}
+        self.shared = 0
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(self, key, fn, *args):
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
 
-    if not results:
-        return {}
+        with self._lock:
+            task = self._async_calls.get(key)
+            if task is None:
+                task = loop.create_task(fn(*args))
+                self._async_calls[key] = task
+                task.add_done_callback(lambda _: self._forget_async(key, task))
+            else:
+                self.shared += 1
 
-    # 🔑 Normalize against the best match
-    max_raw_score = max(r["@search.score"] for r in results)
+        # A cancelled caller must not cancel the call for the others
+        return await asyncio.shield(task)
 
-    semantic_scores = {}
+    def _forget_async(self, key, task):
+        with self._lock:
+            if self._async_calls.get(key) is task:
+                del self._async_calls[key]
 
-    for r in results:
-        job_id = int(r["job_id"])
-        raw_score = r["@search.score"]
 
-        normalized_score = (raw_score / max_raw_score) * 100
-        semantic_scores[job_id] = round(normalized_score, 2)
+single_flight = SingleFlight()
 
-    return semantic_scores
 
 # --------------------------------------------------
-# Skill-only Resume ↔ Job Matching
+# Semantic similarity (Azure AI Search or local index)
 # --------------------------------------------------
-def match_resume_to_job(resume_text: str, job_description: str) -> dict:
+def compute_semantic_score(
+    resume_text: str,
+    top_k: int = 10,
+    filters: JobFilters = ACTIVE_JOBS,
+) -> dict:
     """
-    Skill-based matching only.
-    Semantic relevance comes from Azure AI Search.
+    {job_id: 0-100} for the top_k jobs passing `filters`, from the
+    configured SEMANTIC_BACKEND (or SEMANTIC_FALLBACK if it fails).
+    Normalized against the best match.
+
+    SEMANTIC_QUERY_MODE=chunked queries the whole resume in chunks
+    and fuses the results; otherwise only its prefix is used.
+    """
+    key = ("search", resume_text, top_k, filters)
+    return single_flight.do(key, _semantic_search, resume_text, top_k, filters)
+
+
+def _semantic_search(resume_text: str, top_k: int, filters: JobFilters) -> dict:
+    if SEMANTIC_QUERY_MODE == "chunked":
+        return chunked_search(resume_text, top_k, filters)
+
+    safe_resume_text = resume_text[:SEMANTIC_QUERY_CHARS]
+
+    return search_with_fallback(safe_resume_text, top_k, filters)
+
+
+async def compute_semantic_score_async(
+    resume_text: str,
+    top_k: int = 10,
+    filters: JobFilters = ACTIVE_JOBS,
+) -> dict:
+    """
+    Non-blocking compute_semantic_score for async endpoints.
+    """
+    key = ("search", resume_text, top_k, filters)
+    return await single_flight.do_async(key, _semantic_search_async, resume_text, top_k, filters)
+
+
+async def _semantic_search_async(resume_text: str, top_k: int, filters: JobFilters) -> dict:
+    if SEMANTIC_QUERY_MODE == "chunked":
+        return await chunked_search_async(resume_text, top_k, filters)
+
+    safe_resume_text = resume_text[:SEMANTIC_QUERY_CHARS]
+
+    return await search_with_fallback_async(safe_resume_text, top_k, filters)
+
+
+def compute_semantic_scores_for_jobs(
+    resume_text: str,
+    job_ids: list[int],
+    filters: JobFilters = ACTIVE_JOBS,
+) -> tuple[dict, float]:
+    """
+    Exact semantic scores for the given jobs (not limited to the top-k),
+    normalized like compute_semantic_score (best match passing
+    `filters`), plus the raw reference they were normalized against.
     """
+    key = ("score_jobs", resume_text, tuple(sorted(job_ids)), filters)
+    return single_flight.do(key, _semantic_score_jobs, resume_text, job_ids, filters)
+
+
+def _semantic_score_jobs(
+    resume_text: str,
+    job_ids: list[int],
+    filters: JobFilters,
+) -> tuple[dict, float]:
+    if SEMANTIC_QUERY_MODE == "chunked":
+        return chunked_score_jobs(resume_text, job_ids, filters)
+
+    safe_resume_text = resume_text[:SEMANTIC_QUERY_CHARS]
+
+    return score_jobs_with_fallback(safe_resume_text, job_ids, filters)
+
+
+async def compute_semantic_scores_for_jobs_async(
+    resume_text: str,
+    job_ids: list[int],
+    filters: JobFilters = ACTIVE_JOBS,
+) -> tuple[dict, float]:
+    key = ("score_jobs", resume_text, tuple(sorted(job_ids)), filters)
+    return await single_flight.do_async(
+        key, _semantic_score_jobs_async, resume_text, job_ids, filters
+    )
+
+
+async def _semantic_score_jobs_async(
+    resume_text: str,
+    job_ids: list[int],
+    filters: JobFilters,
+) -> tuple[dict, float]:
+    if SEMANTIC_QUERY_MODE == "chunked":
+        return await chunked_score_jobs_async(resume_text, job_ids, filters)
+
+    safe_resume_text = resume_text[:SEMANTIC_QUERY_CHARS]
 
-    resume_skills = set(extract_skills(resume_text))
-    job_skills = set(extract_skills(job_description))
+    return await score_jobs_with_fallback_async(safe_resume_text, job_ids, filters)
+
+
+# --------------------------------------------------
+# Stored job skills (computed on create / update)
+# --------------------------------------------------
+def get_job_skills(job: Job) -> set[str]:
+    """
+    Canonical skills stored on the job row.
+    Falls back to extraction for rows not backfilled yet.
+    """
+    if job.skills_json is not None:
+        return set(job.skills_json)
+    return set(extract_skills(job.description))
+
+
+# --------------------------------------------------
+# Stored resume skills (computed on upload)
+# --------------------------------------------------
+def get_resume_skills(resume: Resume) -> set[str]:
+    """
+    Canonical skills stored on the resume row.
+    Falls back to extraction for rows without them.
+    """
+    if resume.skills_json is not None:
+        return set(resume.skills_json)
+    return set(extract_skills(resume.parsed_text))
+
+
+# --------------------------------------------------
+# Skill-only Resume ↔ Job Matching
+# --------------------------------------------------
+def match_skill_sets(resume_skills: set[str], job_skills: set[str]) -> dict:
+    """
+    Skill-based matching on precomputed canonical skill sets.
+    No text processing: this is what the request hot path uses.
+    """
 
     matched_skills = resume_skills & job_skills
     missing_skills = job_skills - resume_skills
@@ -61,6 +264,299 @@ def match_resume_to_job(resume_text: str, job_description: str) -> dict:
     }
 
 
+def match_resume_to_job(resume_text: str, job_description: str) -> dict:
+    """
+    Skill-based matching only.
+    Semantic relevance comes from Azure AI Search.
+    Text-based wrapper kept for compatibility; prefer match_skill_sets.
+    """
+    return match_skill_sets(
+        set(extract_skills(resume_text)),
+        set(extract_skills(job_description)),
+    )
+
+
+# --------------------------------------------------
+# Two-stage ranking over the job catalog
+# --------------------------------------------------
+def top_k_rows(values: np.ndarray, rows: np.ndarray, k: int) -> np.ndarray:
+    """
+    Rows with the k highest values, best first.
+    """
+    if len(rows) > k:
+        rows = rows[np.argpartition(-values[rows], k - 1)[:k]]
+    return rows[np.argsort(-values[rows], kind="stable")]
+
+
+def unscored_candidates(candidate_ids: np.ndarray, semantic_scores: dict) -> list[int]:
+    return [int(j) for j in candidate_ids if int(j) not in semantic_scores]
+
+
+def rerank_candidates(
+    catalog: JobCatalogSnapshot,
+    resume_skills: set[str],
+    semantic_scores: dict,
+    candidate_ids: np.ndarray,
+    limit: int,
+    filters: JobFilters = ACTIVE_JOBS,
+) -> list[dict]:
+    """
+    Fit-score the union of skill candidates and semantic results and
+    return the best `limit` jobs passing `filters` as {job_id,
+    fit_score, skill_score, semantic_score}, best first.
+    """
+    union = np.union1d(
+        candidate_ids,
+        np.fromiter(semantic_scores.keys(), dtype=np.int64, count=len(semantic_scores)),
+    )
+
+    scored = catalog.score(
+        resume_skills,
+        semantic_scores=semantic_scores,
+        job_ids=union.tolist(),
+        filters=filters,
+    )
+
+    skill_scores = np.round(scored["skill_scores"], 2)
+    semantic = scored["semantic_scores"]
+    fit_scores = np.round(0.6 * skill_scores + 0.4 * semantic, 2)
+
+    rows = top_k_rows(fit_scores, np.flatnonzero(scored["eligible"]), limit)
+
+    return [
+        {
+            "job_id": int(scored["job_ids"][row]),
+            "fit_score": float(fit_scores[row]),
+            "skill_score": float(skill_scores[row]),
+            "semantic_score": float(semantic[row]),
+        }
+        for row in rows
+    ]
+
+
+def rank_jobs_for_resume(
+    db: Session,
+    resume: Resume,
+    limit: int,
+    semantic_scores: dict | None = None,
+    filters: JobFilters = ACTIVE_JOBS,
+) -> tuple[list[dict], bool]:
+    """
+    Two-stage ranking of the jobs passing `filters` for one resume:
+    1. candidates = semantic top-k ∪ best skill-overlap jobs
+    2. exact semantic scores for skill candidates outside the top-k
+    3. re-rank the union with the fit formula
+
+    Returns (ranked, partial). If the exact re-scoring fails, those
+    candidates are left out (not scored 0) and partial is True.
+    """
+    if semantic_scores is None:
+        semantic_scores = compute_semantic_score(
+            resume.parsed_text, top_k=RECOMMEND_SEMANTIC_TOP_K, filters=filters
+        )
+
+    catalog = get_job_catalog(db)
+    resume_skills = get_resume_skills(resume)
+    candidate_ids = catalog.candidates(resume_skills, RECOMMEND_SKILL_CANDIDATES, filters)
+
+    partial = False
+    missing = unscored_candidates(candidate_ids, semantic_scores)
+    if missing:
+        try:
+            exact, _ = compute_semantic_scores_for_jobs(resume.parsed_text, missing, filters)
+            semantic_scores = {**semantic_scores, **exact}
+        except Exception:
+            logger.warning("Exact re-scoring failed for resume %s", resume.id, exc_info=True)
+            candidate_ids = np.setdiff1d(candidate_ids, missing)
+            partial = True
+
+    ranked = rerank_candidates(
+        catalog, resume_skills, semantic_scores, candidate_ids, limit, filters
+    )
+    return ranked, partial
+
+
+async def rank_jobs_for_resume_async(
+    db: Session,
+    resume: Resume,
+    limit: int,
+    filters: JobFilters = ACTIVE_JOBS,
+) -> tuple[list[dict], bool]:
+    """
+    rank_jobs_for_resume for async endpoints. Exact re-scoring that
+    does not finish within RECOMMEND_RESCORE_TIMEOUT_SECONDS counts as
+    failed (partial ranking).
+    """
+    semantic_scores = await compute_semantic_score_async(
+        resume.parsed_text, top_k=RECOMMEND_SEMANTIC_TOP_K, filters=filters
+    )
+
+    # May reload the catalog from the database: off the event loop
+    catalog = await run_in_threadpool(get_job_catalog, db)
+    resume_skills = get_resume_skills(resume)
+    candidate_ids = catalog.candidates(resume_skills, RECOMMEND_SKILL_CANDIDATES, filters)
+
+    partial = False
+    missing = unscored_candidates(candidate_ids, semantic_scores)
+    if missing:
+        try:
+            exact, _ = await asyncio.wait_for(
+                compute_semantic_scores_for_jobs_async(resume.parsed_text, missing, filters),
+                RECOMMEND_RESCORE_TIMEOUT_SECONDS,
+            )
+            semantic_scores = {**semantic_scores, **exact}
+        except Exception:
+            logger.warning("Exact re-scoring failed for resume %s", resume.id, exc_info=True)
+            candidate_ids = np.setdiff1d(candidate_ids, missing)
+            partial = True
+
+    ranked = rerank_candidates(
+        catalog, resume_skills, semantic_scores, candidate_ids, limit, filters
+    )
+    return ranked, partial
+
+
+def load_ranked_jobs(
+    db: Session,
+    ranked: list[dict],
+    filters: JobFilters | None = None,
+) -> list[tuple[Job, dict]]:
+    """
+    Fetch the Job rows for a ranked list, keeping the rank order.
+    With `filters`, jobs that no longer pass them (e.g. closed since
+    the list was ranked) are dropped.
+    """
+    if not ranked:
+        return []
+
+    query = db.query(Job).filter(Job.id.in_([r["job_id"] for r in ranked]))
+    if filters is not None:
+        query = filters.apply(query)
+    jobs = query.all()
+    jobs_by_id = {job.id: job for job in jobs}
+
+    return [
+        (jobs_by_id[r["job_id"]], r)
+        for r in ranked
+        if r["job_id"] in jobs_by_id
+    ]
+
+
+# --------------------------------------------------
+# Rank stored resumes for a job (recruiter side)
+# --------------------------------------------------
+def load_candidate_pool(db: Session, job: Job, limit: int) -> tuple[list[tuple], dict, dict[int, float]]:
+    """
+    Skill-preselected resumes for a job (one per user), as
+    ([(resume_id, user_id, skill_score)], {resume_id: resume row},
+    {resume_id: stored semantic score}). Blocking: run in the threadpool
+    from async code.
+    """
+    pool = get_resume_catalog(db).top_for_job(
+        get_job_skills(job), max(limit, RECRUITER_CANDIDATE_POOL)
+    )
+    entries = list(zip(
+        pool["resume_ids"].tolist(), pool["user_ids"].tolist(), pool["skill_scores"].tolist()
+    ))
+    if not entries:
+        return [], {}, {}
+
+    resume_ids = [resume_id for resume_id, _, _ in entries]
+    resumes = {
+        r.id: r
+        for r in db.query(Resume.id, Resume.parsed_text, Resume.skills_json)
+        .filter(Resume.id.in_(resume_ids))
+        .all()
+    }
+    stored = dict(
+        db.query(MatchScore.resume_id, MatchScore.semantic_score)
+        .filter(MatchScore.job_id == job.id, MatchScore.resume_id.in_(resume_ids))
+        .all()
+    )
+    return entries, resumes, stored
+
+
+async def score_resumes_for_job_async(job_id: int, texts: dict[int, str]) -> dict[int, float]:
+    """
+    Live semantic scores of resumes for one job, with the same per-resume
+    normalization as apply_for_job. Resumes not scored within
+    RECOMMEND_RESCORE_TIMEOUT_SECONDS (or whose search fails) are left out.
+    """
+    scores: dict[int, float] = {}
+    limiter = asyncio.Semaphore(RECRUITER_SEMANTIC_CONCURRENCY)
+
+    async def score_one(resume_id: int, resume_text: str):
+        async with limiter:
+            result, _ = await compute_semantic_scores_for_jobs_async(resume_text, [job_id])
+        scores[resume_id] = result.get(job_id, 0.0)
+
+    tasks = [
+        asyncio.ensure_future(score_one(resume_id, text))
+        for resume_id, text in texts.items()
+    ]
+    if not tasks:
+        return scores
+
+    done, pending = await asyncio.wait(tasks, timeout=RECOMMEND_RESCORE_TIMEOUT_SECONDS)
+    for task in pending:
+        task.cancel()
+    for task in done:
+        task.exception()  # failed resumes stay unscored
+
+    return scores
+
+
+async def rank_candidates_for_job_async(db: Session, job: Job, limit: int) -> tuple[list[dict], int]:
+    """
+    Best `limit` candidates (one resume per user) for a job, as
+    {resume_id, user_id, fit_score, skill_score, semantic_score,
+    matched_skills, missing_skills}, best first, and the number of
+    pool resumes left out because they could not be scored in time.
+
+    Skill scoring covers every stored resume in one vectorized pass;
+    only the top pool needs semantic scores, read from match_scores in
+    one query and computed live only for resumes without a stored score,
+    so latency does not grow with the resume table.
+    """
+    entries, resumes, semantic_scores = await run_in_threadpool(load_candidate_pool, db, job, limit)
+
+    missing = {
+        resume_id: resumes[resume_id].parsed_text or ""
+        for resume_id, _, _ in entries
+        if resume_id in resumes and resume_id not in semantic_scores
+    }
+    if missing:
+        semantic_scores.update(await score_resumes_for_job_async(job.id, missing))
+
+    job_skills = get_job_skills(job)
+    ranked = []
+    unscored = 0
+    for resume_id, user_id, skill_score in entries:
+        resume = resumes.get(resume_id)
+        if resume is None:
+            continue
+        if resume_id not in semantic_scores:
+            unscored += 1
+            continue
+
+        skill_result = match_skill_sets(set(resume.skills_json or ()), job_skills)
+        skill_score = round(skill_score, 2)
+        semantic_score = semantic_scores[resume_id]
+
+        ranked.append({
+            "resume_id": resume_id,
+            "user_id": user_id,
+            "fit_score": round(0.6 * skill_score + 0.4 * semantic_score, 2),
+            "skill_score": skill_score,
+            "semantic_score": semantic_score,
+            "matched_skills": skill_result["matched_skills"],
+            "missing_skills": skill_result["missing_skills"],
+        })
+
+    ranked.sort(key=lambda r: r["fit_score"], reverse=True)
+    return ranked[:limit], unscored
+
+
 # --------------------------------------------------
 # Recommend jobs for a selected resume (DB + Azure)
 # --------------------------------------------------
@@ -68,12 +564,13 @@ def recommend_jobs_for_resume(
     db: Session,
     user_id: int,
     resume_id: int,
-    limit: int = 5
+    limit: int = 5,
+    filters: JobFilters = ACTIVE_JOBS,
 ):
     """
     1. Fetch resume from DB
     2. Query Azure AI Search for semantic ranking
-    3. Merge with skill-based scoring
+    3. Add skill-overlap candidates and re-rank the union
     """
 
     resume = (
@@ -87,36 +584,16 @@ def recommend_jobs_for_resume(
 
     if not resume:
         raise ValueError("Resume not found for user")
+    if resume.status != "ready":
+        raise ValueError(f"Resume is {resume.status}")
 
-    semantic_scores = compute_semantic_score(
-        resume.parsed_text,
-        top_k=50
-    )
-
-    if not semantic_scores:
-        return []
-
-    jobs = (
-        db.query(Job)
-        .filter(Job.id.in_(semantic_scores.keys()))
-        .all()
-    )
+    ranked, _ = rank_jobs_for_resume(db, resume, limit, filters=filters)
 
+    resume_skills = get_resume_skills(resume)
     recommendations = []
 
-    for job in jobs:
-        skill_result = match_resume_to_job(
-            resume_text=resume.parsed_text,
-            job_description=job.description
-        )
-
-        semantic_score = semantic_scores.get(job.id, 0.0)
-
-        fit_score = round(
-            0.6 * skill_result["skill_score"] +
-            0.4 * semantic_score,
-            2
-        )
+    for job, scores in load_ranked_jobs(db, ranked, filters):
+        skill_result = match_skill_sets(resume_skills, get_job_skills(job))
 
         recommendations.append({
             "job_id": job.id,
@@ -124,16 +601,11 @@ def recommend_jobs_for_resume(
             "description": job.description,
             "location": job.location,
             "job_type": job.job_type,
-            "fit_score": fit_score,
-            "skill_score": skill_result["skill_score"],
-            "semantic_score": semantic_score,
+            "fit_score": scores["fit_score"],
+            "skill_score": scores["skill_score"],
+            "semantic_score": scores["semantic_score"],
             "matched_skills": skill_result["matched_skills"],
             "missing_skills": skill_result["missing_skills"],
         })
 
-    recommendations.sort(
-        key=lambda x: x["fit_score"],
-        reverse=True
-    )
-
-    return recommendations[:limit]
+    return recommendations
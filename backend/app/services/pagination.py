@@ -0,0 +1,100 @@
+# app/services/pagination.py
+"""
+Keyset (cursor) pagination for listing endpoints.
+
+Pages are ordered by a composite key, newest / best first, e.g.
+(created_at, id). The cursor is the key of the last row served,
+base64-encoded; the next page is the rows strictly after it, which an
+index on the key columns serves as a range scan whatever the page
+depth (unlike OFFSET).
+"""
+import base64
+import datetime
+import json
+import os
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "20"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "100"))
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(values: tuple) -> str:
+    payload = [
+        value.isoformat() if isinstance(value, datetime.datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> tuple:
+    """
+    Key values from a cursor, typed after `columns`.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise InvalidCursor(cursor)
+
+        values = []
+        for value, column in zip(payload, columns):
+            if column.type.python_type is datetime.datetime:
+                value = datetime.datetime.fromisoformat(value)
+            values.append(value)
+        return tuple(values)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
+
+
+def after_key(columns: list, values: tuple):
+    """
+    Rows strictly after `values` in descending (columns) order:
+    (a < x) OR (a = x AND b < y) OR ...
+    """
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal = [c == v for c, v in zip(columns[:i], values[:i])]
+        clauses.append(and_(*equal, column < value))
+    return or_(*clauses)
+
+
+def keyset_page(
+    query: Query,
+    columns: list,
+    limit: int,
+    cursor: str | None = None,
+    key=None,
+) -> tuple[list, str | None]:
+    """
+    One page of `query` ordered by `columns` (descending, non-null, the
+    last one unique) and the cursor of the next page (None on the last
+    page). `key(row)` returns the row's key values; by default the
+    row's attributes named after the columns.
+
+    Raises InvalidCursor for a malformed cursor.
+    """
+    if cursor:
+        query = query.filter(after_key(columns, decode_cursor(cursor, columns)))
+
+    rows = (
+        query
+        .order_by(*[column.desc() for column in columns])
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    if key is None:
+        key = lambda row: tuple(getattr(row, column.key) for column in columns)
+
+    return rows, encode_cursor(key(rows[-1]))
@@ -0,0 +1,188 @@
+# app/services/parse_cache.py
+"""
+Content-addressed cache of parsed resumes.
+
+Keyed by the SHA-256 of the uploaded bytes and the extractor version
+(parser revision, PDF engine / OCR settings or image model, skill
+extraction mode and ontology), so re-uploads of the same file skip
+OCR / Document Intelligence and skill extraction, and any change to
+the extraction pipeline starts a fresh key space.
+
+Two levels: a bounded in-process LRU in front of the parsed_documents
+table (shared by every API process).
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from sqlalchemy import JSON, bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.skill_ontology import SKILL_ONTOLOGY
+from app.db.models import ParsedDocument
+from app.services.azure_document_intelligence import extract_text_from_image
+from app.services.skill_extraction import SKILL_EXTRACTION_MODE, extract_skills
+from app.services.text_extraction import OCR_DPI, PDF_TEXT_ENGINE, extract_text_from_bytes
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_MAX_ENTRIES = int(os.getenv("PARSE_CACHE_MAX_ENTRIES", "256"))
+
+# Bump when extraction code changes in a way that alters its output
+PARSER_VERSION = 1
+
+_ONTOLOGY_DIGEST = hashlib.sha256(
+    json.dumps(SKILL_ONTOLOGY, sort_keys=True).encode()
+).hexdigest()[:12]
+
+_SKILLS_VERSION = f"skills={SKILL_EXTRACTION_MODE}:{_ONTOLOGY_DIGEST}"
+
+EXTRACTOR_VERSIONS = {
+    "image": f"v{PARSER_VERSION}|image=prebuilt-read|{_SKILLS_VERSION}",
+    "pdf": f"v{PARSER_VERSION}|pdf={PDF_TEXT_ENGINE}@{OCR_DPI}dpi|{_SKILLS_VERSION}",
+}
+
+_INSERT_PARSED = text("""
+    INSERT INTO parsed_documents (content_hash, extractor_version, parsed_text, skills_json)
+    VALUES (:content_hash, :extractor_version, :parsed_text, :skills_json)
+    ON CONFLICT (content_hash, extractor_version) DO NOTHING
+""").bindparams(bindparam("skills_json", type_=JSON))
+
+
+class ParsedResume(NamedTuple):
+    text: str
+    skills: list[str]
+    content_hash: str
+    cached: bool
+
+
+class ParseCache:
+    def __init__(self, max_entries: int = PARSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[str, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get(self, db: Session, content_hash: str, version: str) -> tuple[str, list] | None:
+        """
+        (parsed text, skills) from memory, else from the database.
+        """
+        key = (content_hash, version)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry
+
+        try:
+            row = db.get(ParsedDocument, key)
+        except SQLAlchemyError:
+            db.rollback()
+            logger.exception("Parse cache lookup failed")
+            row = None
+
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        entry = (row.parsed_text, list(row.skills_json or ()))
+        self._remember(key, entry)
+        with self._lock:
+            self.db_hits += 1
+        return entry
+
+    def put(self, db: Session, content_hash: str, version: str, parsed_text: str, skills: list):
+        """
+        Store a parse result (commits; call before other pending work).
+        """
+        key = (content_hash, version)
+        self._remember(key, (parsed_text, skills))
+
+        try:
+            db.execute(_INSERT_PARSED, {
+                "content_hash": content_hash,
+                "extractor_version": version,
+                "parsed_text": parsed_text,
+                "skills_json": skills,
+            })
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            logger.exception("Parse cache write failed")
+
+    def _remember(self, key: tuple[str, str], entry: tuple[str, list]):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.db_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+parse_cache = ParseCache()
+
+
+def parse_resume(
+    db: Session,
+    file_bytes: bytes,
+    filename: str,
+    content_type: str | None,
+    timings: dict | None = None,
+) -> ParsedResume:
+    """
+    Parsed text and skills of an uploaded resume (image or PDF),
+    extracted only if this exact file was never parsed before.
+    Raises ValueError if no text can be extracted.
+
+    `timings`, if given, receives the seconds spent per stage
+    (extract, skills) on a cache miss.
+    """
+    kind = "image" if (content_type or "").lower().startswith("image/") else "pdf"
+    version = EXTRACTOR_VERSIONS[kind]
+    content_hash = hashlib.sha256(file_bytes).hexdigest()
+
+    cached = parse_cache.get(db, content_hash, version)
+    if cached is not None:
+        return ParsedResume(cached[0], cached[1], content_hash, True)
+
+    start = time.perf_counter()
+    if kind == "image":
+        parsed_text = extract_text_from_image(file_bytes)
+    else:
+        parsed_text = extract_text_from_bytes(file_bytes, filename)
+    extracted = time.perf_counter()
+
+    skills = extract_skills(parsed_text)
+
+    if timings is not None:
+        timings["extract"] = extracted - start
+        timings["skills"] = time.perf_counter() - extracted
+
+    parse_cache.put(db, content_hash, version, parsed_text, skills)
+
+    return ParsedResume(parsed_text, skills, content_hash, False)
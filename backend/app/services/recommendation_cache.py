@@ -0,0 +1,117 @@
+# app/services/recommendation_cache.py
+"""
+In-process LRU + TTL cache of ranked recommendation lists.
+
+Keyed by (resume_id, catalog_version, filters): any job change bumps the
+catalog version, so entries computed against an older catalog are never
+served.
+Lists are cached at full depth and sliced per request.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from app.services.job_filters import ACTIVE_JOBS, JobFilters
+
+RECOMMEND_CACHE_MAX_ENTRIES = int(os.getenv("RECOMMEND_CACHE_MAX_ENTRIES", "10000"))
+RECOMMEND_CACHE_TTL_SECONDS = float(os.getenv("RECOMMEND_CACHE_TTL_SECONDS", "300"))
+
+# Cached list length (the endpoint's max `limit`)
+RECOMMEND_CACHE_DEPTH = 50
+
+
+class RecommendationCache:
+    def __init__(
+        self,
+        max_entries: int = RECOMMEND_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RECOMMEND_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[int, int, JobFilters], tuple[float, int, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(
+        self,
+        resume_id: int,
+        catalog_version: int,
+        filters: JobFilters = ACTIVE_JOBS,
+    ) -> tuple[int, list] | None:
+        """
+        (user_id, ranked list) or None.
+        """
+        key = (resume_id, catalog_version, filters)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, user_id, ranked = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return user_id, ranked
+
+    def put(
+        self,
+        resume_id: int,
+        catalog_version: int,
+        user_id: int,
+        ranked: list,
+        filters: JobFilters = ACTIVE_JOBS,
+    ):
+        if self.max_entries <= 0:
+            return
+
+        key = (resume_id, catalog_version, filters)
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (expires_at, user_id, ranked)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_resume(self, resume_id: int):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == resume_id]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+recommendation_cache = RecommendationCache()
@@ -0,0 +1,176 @@
+# app/services/resume_catalog.py
+import os
+import threading
+import time
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db.models import Resume
+from app.services.job_catalog import MASK_WORDS, popcount_rows, skills_to_mask
+from app.services.skill_extraction import extract_skills
+
+# Full reload interval, to pick up uploads handled by other workers.
+RESUME_CATALOG_REFRESH_SECONDS = int(os.getenv("RESUME_CATALOG_REFRESH_SECONDS", "300"))
+
+
+class ResumeCatalogSnapshot:
+    """
+    Compact in-memory view of resume skill sets, for ranking every
+    stored resume against one job in a single vectorized pass.
+
+    Same layout as JobCatalogSnapshot: dense rows, one uint64 skill
+    bitmask per resume, swap-with-last on removal.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.RLock()
+        self._rows: dict[int, int] = {}
+        self.size = 0
+        self.loaded_at = 0.0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.resume_ids = np.zeros(capacity, dtype=np.int64)
+        self.user_ids = np.zeros(capacity, dtype=np.int64)
+        self.masks = np.zeros((capacity, MASK_WORDS), dtype=np.uint64)
+
+    def _grow(self):
+        capacity = max(1024, len(self.resume_ids) * 2)
+
+        def grown(arr):
+            out = np.zeros((capacity,) + arr.shape[1:], dtype=arr.dtype)
+            out[:self.size] = arr[:self.size]
+            return out
+
+        self.resume_ids = grown(self.resume_ids)
+        self.user_ids = grown(self.user_ids)
+        self.masks = grown(self.masks)
+
+    # --------------------------------------------------
+    # Loading / incremental updates
+    # --------------------------------------------------
+    def load(self, db: Session):
+        """
+        Full rebuild from the resumes table (ids and skills only).
+        Resumes still being ingested are added when they become ready.
+        """
+        rows = (
+            db.query(
+                Resume.id,
+                Resume.user_id,
+                Resume.skills_json,
+                Resume.parsed_text,
+            )
+            .filter(Resume.status == "ready")
+            .yield_per(1000)
+        )
+
+        fresh = ResumeCatalogSnapshot(capacity=1024)
+        for resume_id, user_id, skills, parsed_text in rows:
+            if skills is None:
+                skills = extract_skills(parsed_text)
+            fresh.upsert(resume_id, user_id, skills)
+
+        with self._lock:
+            self.__dict__.update({
+                k: v for k, v in fresh.__dict__.items() if k != "_lock"
+            })
+            self.loaded_at = time.monotonic()
+
+    def upsert(self, resume_id: int, user_id: int, skills):
+        mask = skills_to_mask(skills)
+
+        with self._lock:
+            row = self._rows.get(resume_id)
+            if row is None:
+                if self.size == len(self.resume_ids):
+                    self._grow()
+                row = self.size
+                self.size += 1
+                self._rows[resume_id] = row
+
+            self.resume_ids[row] = resume_id
+            self.user_ids[row] = user_id
+            self.masks[row] = mask
+
+    def upsert_resume(self, resume: Resume):
+        skills = resume.skills_json
+        if skills is None:
+            skills = extract_skills(resume.parsed_text)
+        self.upsert(resume.id, resume.user_id, skills)
+
+    def remove(self, resume_id: int):
+        with self._lock:
+            row = self._rows.pop(resume_id, None)
+            if row is None:
+                return
+
+            last = self.size - 1
+            if row != last:
+                moved_id = int(self.resume_ids[last])
+                for arr in (self.resume_ids, self.user_ids, self.masks):
+                    arr[row] = arr[last]
+                self._rows[moved_id] = row
+
+            self.size = last
+
+    # --------------------------------------------------
+    # Scoring
+    # --------------------------------------------------
+    def top_for_job(self, job_skills, limit: int, one_per_user: bool = True) -> dict:
+        """
+        Skill coverage of the job by every resume; keeps the best
+        `limit` resumes (by default at most one, the best, per user),
+        best first.
+
+        Returns aligned arrays: resume_ids, user_ids, skill_scores (0-100).
+        """
+        job_mask = skills_to_mask(job_skills)
+        job_skill_count = int(popcount_rows(job_mask[None, :])[0])
+
+        with self._lock:
+            n = self.size
+            if not n or not job_skill_count or limit <= 0:
+                empty = np.zeros(0, dtype=np.int64)
+                return {"resume_ids": empty, "user_ids": empty, "skill_scores": np.zeros(0)}
+
+            matched = popcount_rows(self.masks[:n] & job_mask)
+
+            # Over-fetch so dropping duplicate users still leaves `limit`
+            pool = min(n, limit * 4 if one_per_user else limit)
+            rows = np.argpartition(-matched, pool - 1)[:pool] if n > pool else np.arange(n)
+            rows = rows[np.argsort(-matched[rows], kind="stable")]
+
+            resume_ids = self.resume_ids[rows]
+            user_ids = self.user_ids[rows]
+            matched = matched[rows]
+
+        if one_per_user:
+            _, first = np.unique(user_ids, return_index=True)
+            keep = np.sort(first)[:limit]
+        else:
+            keep = np.arange(len(rows))
+
+        return {
+            "resume_ids": resume_ids[keep],
+            "user_ids": user_ids[keep],
+            "skill_scores": matched[keep] / job_skill_count * 100,
+        }
+
+
+resume_catalog = ResumeCatalogSnapshot()
+_load_lock = threading.Lock()
+
+
+def get_resume_catalog(db: Session) -> ResumeCatalogSnapshot:
+    """
+    Shared snapshot, loaded on first use and reloaded periodically.
+    """
+    stale = time.monotonic() - resume_catalog.loaded_at > RESUME_CATALOG_REFRESH_SECONDS
+    if not resume_catalog.loaded_at or stale:
+        with _load_lock:
+            stale = time.monotonic() - resume_catalog.loaded_at > RESUME_CATALOG_REFRESH_SECONDS
+            if not resume_catalog.loaded_at or stale:
+                resume_catalog.load(db)
+    return resume_catalog
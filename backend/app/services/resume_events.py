@@ -0,0 +1,19 @@
+# app/services/resume_events.py
+"""
+Keeps in-process resume indexes in step with writes to the resumes table.
+Call after the resume change is committed.
+"""
+from app.db.models import Resume
+from app.services.match_worker import match_worker
+from app.services.recommendation_cache import recommendation_cache
+from app.services.resume_catalog import resume_catalog
+
+
+def resume_saved(resume: Resume):
+    resume_catalog.upsert_resume(resume)
+    match_worker.enqueue_resume(resume.id)
+
+
+def resume_deleted(resume_id: int):
+    resume_catalog.remove(resume_id)
+    recommendation_cache.invalidate_resume(resume_id)
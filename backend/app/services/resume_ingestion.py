@@ -0,0 +1,195 @@
+# app/services/resume_ingestion.py
+"""
+Background resume ingestion, with the resumes table as the queue.
+
+Uploads store the file and insert a resume row with status
+"processing" (stage "queued"). Ingestion workers claim rows with a
+conditional UPDATE (only one claimer can match it), download the file,
+parse it through the parse cache and mark the row "ready" or "failed".
+
+Claims older than RESUME_INGEST_CLAIM_TIMEOUT_SECONDS are taken over,
+so rows left behind by a crashed process are retried, up to
+RESUME_INGEST_MAX_ATTEMPTS times. Rows that used up their attempts
+without finishing (e.g. a file that keeps killing the worker process)
+are marked "failed" once their last claim goes stale.
+"""
+import datetime
+import logging
+import os
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.db.models import Resume
+from app.services.blob_storage import download_resume_from_blob
+from app.services.parse_cache import parse_resume
+from app.services.resume_events import resume_saved
+
+logger = logging.getLogger(__name__)
+
+RESUME_INGEST_MAX_ATTEMPTS = int(os.getenv("RESUME_INGEST_MAX_ATTEMPTS", "3"))
+RESUME_INGEST_CLAIM_TIMEOUT_SECONDS = float(os.getenv("RESUME_INGEST_CLAIM_TIMEOUT_SECONDS", "600"))
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.utcnow()
+
+
+def _unclaimed(now: datetime.datetime):
+    stale_before = now - datetime.timedelta(seconds=RESUME_INGEST_CLAIM_TIMEOUT_SECONDS)
+    return (
+        (Resume.status == "processing")
+        & or_(Resume.claimed_at.is_(None), Resume.claimed_at < stale_before)
+    )
+
+
+def _claimable(now: datetime.datetime):
+    return _unclaimed(now) & (Resume.attempts < RESUME_INGEST_MAX_ATTEMPTS)
+
+
+# --------------------------------------------------
+# Enqueue (upload endpoint)
+# --------------------------------------------------
+def create_pending_resume(
+    db: Session,
+    user_id: int,
+    filename: str,
+    file_url: str,
+    content_type: str | None,
+) -> Resume:
+    resume = Resume(
+        user_id=user_id,
+        filename=filename,
+        file_path=file_url,
+        content_type=content_type,
+        status="processing",
+        stage="queued",
+        attempts=0,
+    )
+    db.add(resume)
+    db.commit()
+    db.refresh(resume)
+    return resume
+
+
+# --------------------------------------------------
+# Claim / process (ingestion workers)
+# --------------------------------------------------
+def pending_resume_ids(db: Session, limit: int) -> list[int]:
+    """
+    Oldest claimable resumes (index range scan on status, id).
+    """
+    return [
+        r.id
+        for r in db.query(Resume.id)
+        .filter(_claimable(_now()))
+        .order_by(Resume.id)
+        .limit(limit)
+    ]
+
+
+def fail_exhausted_resumes(db: Session) -> int:
+    """
+    Mark unfinished resumes that used up their attempts as failed.
+    """
+    now = _now()
+    failed = (
+        db.query(Resume)
+        .filter(_unclaimed(now), Resume.attempts >= RESUME_INGEST_MAX_ATTEMPTS)
+        .update(
+            {
+                Resume.status: "failed",
+                Resume.stage: "done",
+                Resume.processed_at: now,
+                Resume.error: "Resume processing failed: the file could not be processed "
+                f"in {RESUME_INGEST_MAX_ATTEMPTS} attempts",
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if failed:
+        logger.warning("Marked %s resumes failed after %s ingestion attempts", failed, RESUME_INGEST_MAX_ATTEMPTS)
+    return failed
+
+
+def claim_resume(db: Session, resume_id: int) -> bool:
+    """
+    Compare-and-set claim: True for exactly one concurrent caller.
+    """
+    now = _now()
+    claimed = (
+        db.query(Resume)
+        .filter(Resume.id == resume_id, _claimable(now))
+        .update(
+            {
+                Resume.claimed_at: now,
+                Resume.stage: "extracting",
+                Resume.attempts: Resume.attempts + 1,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return claimed == 1
+
+
+def _finish(db: Session, resume_id: int, values: dict):
+    db.query(Resume).filter(Resume.id == resume_id, Resume.status == "processing").update(
+        {Resume.processed_at: _now(), **values},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def ingest_resume(db: Session, resume_id: int):
+    """
+    Parse a claimed resume and record the outcome. Unreadable files
+    fail at once; other errors are retried by a later claim until
+    RESUME_INGEST_MAX_ATTEMPTS.
+    """
+    resume = db.get(Resume, resume_id)
+    if resume is None or resume.status != "processing":
+        return  # deleted meanwhile
+
+    try:
+        file_bytes = download_resume_from_blob(resume.file_path)
+        parsed = parse_resume(db, file_bytes, resume.filename, resume.content_type)
+
+    except ValueError as e:
+        db.rollback()
+        _finish(db, resume_id, {Resume.status: "failed", Resume.stage: "done", Resume.error: str(e)})
+        return
+
+    except Exception as e:
+        db.rollback()
+        logger.exception("Resume %s ingestion attempt failed", resume_id)
+        if resume.attempts >= RESUME_INGEST_MAX_ATTEMPTS:
+            _finish(db, resume_id, {
+                Resume.status: "failed",
+                Resume.stage: "done",
+                Resume.error: f"Resume processing failed: {e}",
+            })
+        else:
+            # Release the claim for a retry
+            db.query(Resume).filter(Resume.id == resume_id).update(
+                {Resume.claimed_at: None, Resume.stage: "queued", Resume.error: str(e)},
+                synchronize_session=False,
+            )
+            db.commit()
+        return
+
+    _finish(db, resume_id, {
+        Resume.parsed_text: parsed.text,
+        Resume.skills_json: parsed.skills,
+        Resume.skills_count: len(parsed.skills),
+        Resume.content_hash: parsed.content_hash,
+        Resume.status: "ready",
+        Resume.stage: "done",
+        Resume.error: None,
+    })
+
+    db.expire_all()
+    resume = db.get(Resume, resume_id)
+    if resume is not None and resume.status == "ready":
+        resume_saved(resume)
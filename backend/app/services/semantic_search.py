@@ -0,0 +1,643 @@
+# app/services/semantic_search.py
+import asyncio
+import logging
+import os
+import threading
+
+from starlette.concurrency import run_in_threadpool
+
+from app.db.session import SessionLocal
+from app.services.job_filters import JobFilters
+
+logger = logging.getLogger(__name__)
+
+# "azure": Azure AI Search (default)
+# "local": in-process vector index over spaCy word vectors
+# "bm25":  in-process BM25 inverted index over title + description
+SEMANTIC_BACKEND = os.getenv("SEMANTIC_BACKEND", "azure")
+
+# Used when the primary backend fails or returns nothing ("" disables)
+SEMANTIC_FALLBACK = os.getenv("SEMANTIC_FALLBACK", "bm25")
+
+# Fail over instead of waiting on a slow Azure AI Search call
+AZURE_SEARCH_TIMEOUT_SECONDS = float(os.getenv("AZURE_SEARCH_TIMEOUT_SECONDS", "5"))
+
+# Resume prefix sent as the query text
+SEMANTIC_QUERY_CHARS = 1500
+
+# Filter fields the index cannot filter on are applied to the results
+# instead (against the job catalog), over-fetching by this factor
+AZURE_POST_FILTER_OVERFETCH = int(os.getenv("AZURE_POST_FILTER_OVERFETCH", "4"))
+AZURE_SEARCH_MAX_TOP = 1000
+
+
+class SemanticBackend:
+    """
+    Scores jobs against a resume text.
+    search() returns {job_id: score} for the top_k jobs, with scores
+    normalized against the best match (0-100).
+    """
+
+    name = "base"
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    async def astart(self):
+        """
+        Open async resources (called from the app lifespan).
+        """
+
+    async def astop(self):
+        pass
+
+    def search(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        filters: JobFilters | None = None,
+    ) -> dict[int, float]:
+        """
+        Only jobs passing `filters` are retrieved (and count towards top_k).
+        """
+        raise NotImplementedError
+
+    async def asearch(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        filters: JobFilters | None = None,
+    ) -> dict[int, float]:
+        """
+        Async search. In-process backends are CPU-bound, so by default
+        the sync search runs in the threadpool.
+        """
+        return await run_in_threadpool(self.search, query_text, top_k, filters)
+
+    def score_jobs(
+        self,
+        query_text: str,
+        job_ids: list[int],
+        filters: JobFilters | None = None,
+    ) -> tuple[dict[int, float], float]:
+        """
+        Exact scores for the given jobs, whatever their rank, plus the raw
+        normalization reference (best score over jobs passing `filters`).
+        Scores are on the same 0-100 scale as search().
+        """
+        raise NotImplementedError
+
+    async def ascore_jobs(
+        self,
+        query_text: str,
+        job_ids: list[int],
+        filters: JobFilters | None = None,
+    ) -> tuple[dict[int, float], float]:
+        return await run_in_threadpool(self.score_jobs, query_text, job_ids, filters)
+
+    def job_saved(self, job):
+        pass
+
+    def job_deleted(self, job_id: int):
+        pass
+
+
+def scale_scores(raw_scores: dict[int, float], reference: float) -> dict[int, float]:
+    """
+    Scale raw scores against a reference (best) raw score, to 0-100.
+    """
+    if not raw_scores or reference <= 0:
+        return {}
+
+    return {
+        job_id: round(min(max(raw_score, 0.0) / reference, 1.0) * 100, 2)
+        for job_id, raw_score in raw_scores.items()
+    }
+
+
+def normalize_scores(raw_scores: dict[int, float]) -> dict[int, float]:
+    """
+    Scale raw scores against the best one, to 0-100.
+    """
+    if not raw_scores:
+        return {}
+
+    return scale_scores(raw_scores, max(raw_scores.values()))
+
+
+def job_id_filter(job_ids: list[int]) -> str:
+    """
+    OData filter restricting a search to the given job ids.
+    """
+    return "search.in(job_id, '{}', ',')".format(",".join(str(int(j)) for j in job_ids))
+
+
+def odata_filter(filters: JobFilters | None = None, job_ids: list[int] | None = None) -> str | None:
+    clauses = []
+    if filters is not None and filters.conditions():
+        clauses.append(filters.odata())
+    if job_ids is not None:
+        clauses.append(job_id_filter(job_ids))
+    return " and ".join(clauses) or None
+
+
+def keep_within(raw_scores: dict[int, float], within: set | None, top_k: int) -> dict[int, float]:
+    """
+    The best `top_k` raw scores of jobs in `within` (all if None).
+    """
+    if within is None:
+        return raw_scores
+    kept = sorted(
+        ((job_id, score) for job_id, score in raw_scores.items() if job_id in within),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return dict(kept[:top_k])
+
+
+def score_window(
+    raw_scores: dict[int, float],
+    job_ids: list[int],
+    within: set | None,
+) -> tuple[dict[int, float], float]:
+    """
+    score_jobs from one over-fetched result window: the reference is the
+    best job in `within`; jobs outside the window count as not matching.
+    """
+    reference = max(keep_within(raw_scores, within, len(raw_scores)).values(), default=0.0)
+    targeted = {job_id: raw_scores[job_id] for job_id in job_ids if job_id in raw_scores}
+    return scale_scores(targeted, reference), reference
+
+
+def eligible_job_ids(filters: JobFilters | None):
+    """
+    Ids of jobs passing `filters`, from the job catalog snapshot
+    (None when unfiltered). Used by the in-process backends.
+    """
+    if filters is None:
+        return None
+
+    from app.services.job_catalog import get_job_catalog
+
+    db = SessionLocal()
+    try:
+        return get_job_catalog(db).eligible_job_ids(filters)
+    finally:
+        db.close()
+
+
+# --------------------------------------------------
+# Azure AI Search
+# --------------------------------------------------
+class AzureSearchBackend(SemanticBackend):
+    name = "azure"
+
+    def start(self):
+        # Imported lazily: the module raises if credentials are missing
+        from app.services.azure_search_client import (
+            async_search_connection,
+            filterable_fields,
+            search_client,
+        )
+
+        self.search_client = search_client
+        self.async_connection = async_search_connection
+
+        # An index created before job filtering may not filter on these
+        # fields (job_id: targeted scoring), and Azure rejects every query
+        # filtering on them
+        try:
+            self.filterable = filterable_fields()
+        except Exception:
+            logger.warning(
+                "Could not read the search index definition; job filters "
+                "are applied to search results instead",
+                exc_info=True,
+            )
+            self.filterable = set()
+
+        missing = sorted({"job_id", *JobFilters._fields} - self.filterable)
+        if missing:
+            logger.warning(
+                "Search index fields %s are not filterable; those filters "
+                "are applied to search results instead",
+                missing,
+            )
+
+    def _plan(self, filters: JobFilters | None, top_k: int) -> tuple[str | None, int, set | None]:
+        """
+        (OData filter, top, job ids results must be in): conditions on
+        non-filterable fields become a post-filter on eligible job ids,
+        with over-fetching. Blocking (catalog read).
+        """
+        if filters is None:
+            return None, top_k, None
+
+        pushed = JobFilters(**{
+            field: value if field in self.filterable else None
+            for field, value in filters._asdict().items()
+        })
+        if pushed == filters:
+            return odata_filter(filters), top_k, None
+
+        top = min(top_k * AZURE_POST_FILTER_OVERFETCH, AZURE_SEARCH_MAX_TOP)
+        return odata_filter(pushed), top, set(eligible_job_ids(filters).tolist())
+
+    def _window(self, filters: JobFilters | None) -> tuple[dict, set | None]:
+        """
+        Search kwargs for the best AZURE_SEARCH_MAX_TOP matches (pushable
+        filters only), plus the post-filter. Used instead of targeted
+        queries when job_id is not filterable. Blocking (catalog read).
+        """
+        odata, _, within = self._plan(filters, AZURE_SEARCH_MAX_TOP)
+        return self._search_kwargs(odata=odata, top=AZURE_SEARCH_MAX_TOP), within
+
+    async def astart(self):
+        await self.async_connection.open()
+
+    async def astop(self):
+        await self.async_connection.close()
+
+    def search(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        filters: JobFilters | None = None,
+    ) -> dict[int, float]:
+        odata, top, within = self._plan(filters, top_k)
+        results = self.search_client.search(
+            search_text=query_text,
+            top=top,
+            filter=odata,
+            include_total_count=False,
+            connection_timeout=AZURE_SEARCH_TIMEOUT_SECONDS,
+            read_timeout=AZURE_SEARCH_TIMEOUT_SECONDS,
+        )
+
+        return normalize_scores(keep_within(
+            {int(r["job_id"]): r["@search.score"] for r in results}, within, top_k
+        ))
+
+    async def asearch(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        filters: JobFilters | None = None,
+    ) -> dict[int, float]:
+        client = self.async_connection.client
+        if client is None:
+            # Not opened by the app lifespan (e.g. scripts)
+            return await super().asearch(query_text, top_k, filters)
+
+        odata, top, within = await run_in_threadpool(self._plan, filters, top_k)
+        results = await client.search(
+            search_text=query_text,
+            top=top,
+            filter=odata,
+            include_total_count=False,
+            connection_timeout=AZURE_SEARCH_TIMEOUT_SECONDS,
+            read_timeout=AZURE_SEARCH_TIMEOUT_SECONDS,
+        )
+
+        return normalize_scores(keep_within(
+            {int(r["job_id"]): r["@search.score"] async for r in results}, within, top_k
+        ))
+
+    def _search_kwargs(
+        self,
+        job_ids: list[int] | None = None,
+        odata: str | None = None,
+        top: int = 1,
+    ) -> dict:
+        """
+        Reference query (best `top` matches for the `odata` filter) when
+        job_ids is None, else the query targeting exactly those jobs.
+        """
+        kwargs = {
+            "include_total_count": False,
+            "select": ["job_id"],
+            "connection_timeout": AZURE_SEARCH_TIMEOUT_SECONDS,
+            "read_timeout": AZURE_SEARCH_TIMEOUT_SECONDS,
+        }
+        if job_ids is None:
+            kwargs["top"] = top
+            kwargs["filter"] = odata
+        else:
+            kwargs["top"] = len(job_ids)
+            kwargs["filter"] = odata_filter(job_ids=job_ids)
+        return kwargs
+
+    def score_jobs(
+        self,
+        query_text: str,
+        job_ids: list[int],
+        filters: JobFilters | None = None,
+    ) -> tuple[dict[int, float], float]:
+        if not job_ids:
+            return {}, 0.0
+
+        if "job_id" not in self.filterable:
+            kwargs, within = self._window(filters)
+            results = self.search_client.search(search_text=query_text, **kwargs)
+            return score_window(
+                {int(r["job_id"]): r["@search.score"] for r in results}, job_ids, within
+            )
+
+        # Filters do not change relevance scores, so the targeted scores
+        # compare directly with the best (filtered) match.
+        odata, top, within = self._plan(filters, 1)
+        best = self.search_client.search(search_text=query_text, **self._search_kwargs(odata=odata, top=top))
+        reference = max(
+            keep_within({int(r["job_id"]): r["@search.score"] for r in best}, within, 1).values(),
+            default=0.0,
+        )
+
+        targeted = self.search_client.search(search_text=query_text, **self._search_kwargs(job_ids))
+        raw_scores = {int(r["job_id"]): r["@search.score"] for r in targeted}
+
+        return scale_scores(raw_scores, reference), reference
+
+    async def ascore_jobs(
+        self,
+        query_text: str,
+        job_ids: list[int],
+        filters: JobFilters | None = None,
+    ) -> tuple[dict[int, float], float]:
+        client = self.async_connection.client
+        if client is None:
+            return await super().ascore_jobs(query_text, job_ids, filters)
+        if not job_ids:
+            return {}, 0.0
+
+        async def collect(**kwargs):
+            results = await client.search(search_text=query_text, **kwargs)
+            return [(int(r["job_id"]), r["@search.score"]) async for r in results]
+
+        if "job_id" not in self.filterable:
+            kwargs, within = await run_in_threadpool(self._window, filters)
+            return score_window(dict(await collect(**kwargs)), job_ids, within)
+
+        odata, top, within = await run_in_threadpool(self._plan, filters, 1)
+        best, targeted = await asyncio.gather(
+            collect(**self._search_kwargs(odata=odata, top=top)),
+            collect(**self._search_kwargs(job_ids)),
+        )
+        reference = max(keep_within(dict(best), within, 1).values(), default=0.0)
+
+        return scale_scores(dict(targeted), reference), reference
+
+
+# --------------------------------------------------
+# Local in-process vector index
+# --------------------------------------------------
+class LocalVectorBackend(SemanticBackend):
+    name = "local"
+
+    def start(self):
+        from app.services.local_vector_index import LocalVectorIndex
+
+        self.index = LocalVectorIndex()
+
+        if self.index.exists():
+            self.index.load()
+        else:
+            db = SessionLocal()
+            try:
+                self.index.build(db)
+            finally:
+                db.close()
+
+    def stop(self):
+        if self.index.dirty:
+            self.index.save()
+
+    def search(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        filters: JobFilters | None = None,
+    ) -> dict[int, float]:
+        return self.index.search(query_text, top_k=top_k, within=eligible_job_ids(filters))
+
+    def score_jobs(
+        self,
+        query_text: str,
+        job_ids: list[int],
+        filters: JobFilters | None = None,
+    ) -> tuple[dict[int, float], float]:
+        return self.index.score_jobs(query_text, job_ids, within=eligible_job_ids(filters))
+
+    def job_saved(self, job):
+        from app.services.local_vector_index import job_text
+
+        self.index.upsert(job.id, job_text(job.title, job.description))
+
+    def job_deleted(self, job_id: int):
+        self.index.remove(job_id)
+
+
+# --------------------------------------------------
+# Local BM25 inverted index
+# --------------------------------------------------
+class BM25Backend(SemanticBackend):
+    name = "bm25"
+
+    def start(self):
+        from app.services.bm25_index import BM25Index
+
+        self.index = BM25Index()
+
+        db = SessionLocal()
+        try:
+            self.index.build(db)
+        finally:
+            db.close()
+
+    def search(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        filters: JobFilters | None = None,
+    ) -> dict[int, float]:
+        return self.index.search(query_text, top_k=top_k, within=eligible_job_ids(filters))
+
+    def score_jobs(
+        self,
+        query_text: str,
+        job_ids: list[int],
+        filters: JobFilters | None = None,
+    ) -> tuple[dict[int, float], float]:
+        return self.index.score_jobs(query_text, job_ids, within=eligible_job_ids(filters))
+
+    def job_saved(self, job):
+        self.index.add(job.id, f"{job.title or ''}\n{job.description or ''}")
+
+    def job_deleted(self, job_id: int):
+        self.index.remove(job_id)
+
+
+SEMANTIC_BACKENDS = {
+    "azure": AzureSearchBackend,
+    "local": LocalVectorBackend,
+    "bm25": BM25Backend,
+}
+
+_backends: dict[str, SemanticBackend] = {}
+_backend_lock = threading.Lock()
+
+
+def get_semantic_backend(name: str | None = None) -> SemanticBackend:
+    """
+    The configured (or named) backend, started on first use.
+    """
+    name = name or SEMANTIC_BACKEND
+
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+
+    with _backend_lock:
+        backend = _backends.get(name)
+        if backend is not None:
+            return backend
+
+        if name not in SEMANTIC_BACKENDS:
+            raise RuntimeError(
+                f"Unknown semantic backend '{name}'. "
+                f"Expected one of {sorted(SEMANTIC_BACKENDS)}"
+            )
+        backend = SEMANTIC_BACKENDS[name]()
+        backend.start()
+        _backends[name] = backend
+
+    return backend
+
+
+def get_fallback_backend() -> SemanticBackend | None:
+    if not SEMANTIC_FALLBACK or SEMANTIC_FALLBACK == SEMANTIC_BACKEND:
+        return None
+    return get_semantic_backend(SEMANTIC_FALLBACK)
+
+
+def started_backends() -> list[SemanticBackend]:
+    return list(_backends.values())
+
+
+def log_fallback(fallback: SemanticBackend):
+    logger.warning(
+        "Semantic backend %s failed; using the %s fallback",
+        get_semantic_backend().name,
+        fallback.name,
+        exc_info=True,
+    )
+
+
+def search_with_fallback(
+    query_text: str,
+    top_k: int = 10,
+    filters: JobFilters | None = None,
+) -> dict[int, float]:
+    """
+    Search the primary backend; if it errors out (e.g. Azure AI Search
+    unreachable or timing out) or returns nothing, use the fallback.
+    """
+    fallback = get_fallback_backend()
+
+    try:
+        scores = get_semantic_backend().search(query_text, top_k=top_k, filters=filters)
+    except Exception:
+        if fallback is None:
+            raise
+        log_fallback(fallback)
+        scores = {}
+
+    if not scores and fallback is not None:
+        scores = fallback.search(query_text, top_k=top_k, filters=filters)
+
+    return scores
+
+
+async def search_with_fallback_async(
+    query_text: str,
+    top_k: int = 10,
+    filters: JobFilters | None = None,
+) -> dict[int, float]:
+    """
+    Async version of search_with_fallback.
+    """
+    fallback = get_fallback_backend()
+
+    try:
+        scores = await get_semantic_backend().asearch(query_text, top_k=top_k, filters=filters)
+    except Exception:
+        if fallback is None:
+            raise
+        log_fallback(fallback)
+        scores = {}
+
+    if not scores and fallback is not None:
+        scores = await fallback.asearch(query_text, top_k=top_k, filters=filters)
+
+    return scores
+
+
+def score_jobs_with_fallback(
+    query_text: str,
+    job_ids: list[int],
+    filters: JobFilters | None = None,
+) -> tuple[dict[int, float], float]:
+    """
+    Exact scores for specific jobs, with the same failover as search.
+    """
+    fallback = get_fallback_backend()
+
+    try:
+        return get_semantic_backend().score_jobs(query_text, job_ids, filters)
+    except Exception:
+        if fallback is None:
+            raise
+        log_fallback(fallback)
+        return fallback.score_jobs(query_text, job_ids, filters)
+
+
+async def score_jobs_with_fallback_async(
+    query_text: str,
+    job_ids: list[int],
+    filters: JobFilters | None = None,
+) -> tuple[dict[int, float], float]:
+    fallback = get_fallback_backend()
+
+    try:
+        return await get_semantic_backend().ascore_jobs(query_text, job_ids, filters)
+    except Exception:
+        if fallback is None:
+            raise
+        log_fallback(fallback)
+        return await fallback.ascore_jobs(query_text, job_ids, filters)
+
+
+async def open_semantic_backends():
+    """
+    Start the primary and fallback backends and their async resources.
+    """
+    get_semantic_backend()
+    get_fallback_backend()
+
+    for backend in started_backends():
+        await backend.astart()
+
+
+async def close_semantic_backends():
+    for backend in started_backends():
+        await backend.astop()
+    close_semantic_backend()
+
+
+def close_semantic_backend():
+    with _backend_lock:
+        for backend in _backends.values():
+            backend.stop()
+        _backends.clear()
@@ -1,8 +1,49 @@
+import os
 import re
-import spacy
+import threading
 from app.core.skill_ontology import SKILL_ONTOLOGY
+from app.services.skill_matcher import SkillMatcher
 
-nlp = spacy.load("en_core_web_lg")
+# "fast": ontology matching only (default, spaCy never loaded)
+# "nlp":  also match against spaCy lemmas (e.g. plural / inflected forms)
+SKILL_EXTRACTION_MODE = os.getenv("SKILL_EXTRACTION_MODE", "fast")
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_lg")
+
+EXTRACTION_MODES = ("fast", "nlp")
+
+# Pipes shipped with the en_core_web_* models
+SPACY_PIPES = ("tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter")
+
+# Only what lemmatization needs: no parser, no NER
+LEMMA_PIPES = ("tok2vec", "tagger", "attribute_ruler", "lemmatizer")
+
+_nlp_cache = {}
+_nlp_lock = threading.Lock()
+
+
+def get_nlp(pipes: tuple[str, ...] = ()):
+    """
+    Lazily load the spaCy model with only the requested pipes.
+    Pipes that are not requested are excluded, not just disabled,
+    so they are never loaded into memory.
+    `pipes=()` gives a tokenizer + word vectors only.
+    """
+    pipes = tuple(sorted(pipes))
+
+    nlp = _nlp_cache.get(pipes)
+    if nlp is not None:
+        return nlp
+
+    with _nlp_lock:
+        nlp = _nlp_cache.get(pipes)
+        if nlp is None:
+            import spacy
+
+            exclude = [p for p in SPACY_PIPES if p not in pipes]
+            nlp = spacy.load(SPACY_MODEL, exclude=exclude)
+            _nlp_cache[pipes] = nlp
+
+    return nlp
 
 
 def clean_text(text: str) -> str:
@@ -18,37 +59,28 @@ def is_short_skill(skill: str) -> bool:
     return len(skill) <= 2
 
 
-def extract_skills(resume_text: str) -> list[str]:
+# Compiled once: single pass over the text instead of one scan per variant.
+# Long variants match as substrings, short ones ('c', 'js', 'ml') need
+# word boundaries. Comma / bullet chunks equal to a variant are covered
+# by the same rules, so no separate chunk loop is needed.
+_matcher = SkillMatcher(SKILL_ONTOLOGY, short_max_len=2)
+
+
+def extract_skills(resume_text: str, mode: str | None = None) -> list[str]:
     if not resume_text:
         return []
 
+    mode = mode or SKILL_EXTRACTION_MODE
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown skill extraction mode: {mode}")
+
     cleaned_text = clean_text(resume_text)
-    doc = nlp(cleaned_text)
-
-    found_skills = set()
-
-    # 1️⃣ Substring matching (ONLY for non-short skills)
-    for canonical, variants in SKILL_ONTOLOGY.items():
-        for variant in variants:
-            if is_short_skill(variant):
-                continue  # handled separately
-            if variant in cleaned_text:
-                found_skills.add(canonical)
-
-    # 2️⃣ Strict word-boundary matching for short skills (like 'c')
-    for canonical, variants in SKILL_ONTOLOGY.items():
-        for variant in variants:
-            if is_short_skill(variant):
-                pattern = rf"\b{re.escape(variant)}\b"
-                if re.search(pattern, cleaned_text):
-                    found_skills.add(canonical)
-
-    # 3️⃣ Comma / bullet separated lists
-    chunks = re.split(r",|\n|•|-", cleaned_text)
-    for chunk in chunks:
-        chunk = chunk.strip()
-        for canonical, variants in SKILL_ONTOLOGY.items():
-            if chunk in variants:
-                found_skills.add(canonical)
+
+    found_skills = _matcher.find(cleaned_text)
+
+    if mode == "nlp":
+        doc = get_nlp(LEMMA_PIPES)(cleaned_text)
+        lemma_text = " ".join(token.lemma_ for token in doc)
+        found_skills |= _matcher.find(lemma_text)
 
     return sorted(found_skills)
@@ -0,0 +1,122 @@
+# app/services/skill_matcher.py
+import re
+
+
+def _is_word_char(ch: str) -> bool:
+    """
+    Same definition of a word character as `\\w` in `\\b...\\b` patterns.
+    """
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Character trie over every variant in a skill ontology, compiled once
+    into a single regex.
+
+    The regex finds every position where some variant may start in one
+    scan of the text (done by the C regex engine), and the trie is walked
+    from those positions only to collect all variants that start there:
+    - long variants match anywhere (plain substring semantics)
+    - short variants (<= short_max_len chars) must sit on word boundaries
+
+    Equivalent to checking `variant in text` for long variants and
+    `re.search(rf"\\b{variant}\\b", text)` for short ones, for every
+    variant, but the cost no longer grows with the ontology size.
+    """
+
+    def __init__(self, ontology: dict[str, list[str]], short_max_len: int = 2):
+        self.short_max_len = short_max_len
+
+        # Trie node: {char: child, "": (needs_boundary, canonicals)}
+        self._trie: dict = {}
+
+        for canonical, variants in ontology.items():
+            for variant in variants:
+                if variant:
+                    self._add(variant, canonical)
+
+        # One alternative per first character, so the regex engine can
+        # skip straight to positions where a variant may start.
+        alternatives = [
+            re.escape(ch) + "(?=" + self._pattern(child) + ")"
+            for ch, child in sorted(self._trie.items())
+        ]
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    # --------------------------------------------------
+    # Construction
+    # --------------------------------------------------
+    def _add(self, variant: str, canonical: str):
+        node = self._trie
+        for ch in variant:
+            node = node.setdefault(ch, {})
+
+        needs_boundary = len(variant) <= self.short_max_len
+        terminal = node.setdefault("", (needs_boundary, set()))
+        terminal[1].add(canonical)
+
+    def _pattern(self, node: dict) -> str:
+        alternatives = [
+            re.escape(ch) + self._pattern(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+
+        terminal = node.get("")
+        if terminal is not None:
+            needs_boundary, _ = terminal
+            if not needs_boundary:
+                return ""  # a long variant ends here → always a candidate
+            alternatives.append(r"\b")
+
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    # --------------------------------------------------
+    # Matching
+    # --------------------------------------------------
+    def find(self, text: str) -> set[str]:
+        """
+        Return the canonical skills whose variants occur in `text`.
+        """
+        found = set()
+        if self._regex is None:
+            return found
+
+        text_len = len(text)
+
+        for candidate in self._regex.finditer(text):
+            start = candidate.start()
+            node = self._trie
+            end = start
+
+            while end < text_len:
+                node = node.get(text[end])
+                if node is None:
+                    break
+                end += 1
+
+                terminal = node.get("")
+                if terminal is None:
+                    continue
+
+                needs_boundary, canonicals = terminal
+                if needs_boundary and not _on_boundaries(text, start, end, text_len):
+                    continue
+                found |= canonicals
+
+        return found
+
+
+def _on_boundaries(text: str, start: int, end: int, text_len: int) -> bool:
+    """
+    Equivalent of wrapping text[start:end] in `\\b...\\b`.
+    """
+    before = start > 0 and _is_word_char(text[start - 1])
+    if before == _is_word_char(text[start]):
+        return False
+
+    after = end < text_len and _is_word_char(text[end])
+    return _is_word_char(text[end - 1]) != after
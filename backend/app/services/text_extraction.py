@@ -1,30 +1,281 @@
 # app/services/text_extraction.py
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
 import pdfplumber
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 import pytesseract
-from PIL import Image
-import tempfile
-import os
 
 from fastapi import UploadFile
 
+logger = logging.getLogger(__name__)
+
+# "pdfium" (per-page hybrid) or "pdfplumber" (previous whole-document
+# behaviour, kept for comparison)
+PDF_TEXT_ENGINE = os.getenv("PDF_TEXT_ENGINE", "pdfium")
+
+# Pages with less text than this (and an image) are OCR'd
+OCR_MIN_PAGE_CHARS = int(os.getenv("OCR_MIN_PAGE_CHARS", "20"))
+
+# OCR fallback: pages are rendered and recognized in parallel worker
+# processes (tesseract is CPU-bound), within a per-document time budget.
+# OCR_WORKERS=1 recognizes pages in the calling process instead.
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(min(4, os.cpu_count() or 1))))
+OCR_DPI = int(os.getenv("OCR_DPI", "300"))
+OCR_TIME_BUDGET_SECONDS = float(os.getenv("OCR_TIME_BUDGET_SECONDS", "60"))
+
+_ocr_pool: ProcessPoolExecutor | None = None
+_ocr_pool_lock = threading.Lock()
+
+# pdfium is not thread-safe; API threads share one lock (OCR workers are
+# separate processes)
+_pdfium_lock = threading.Lock()
+
+
+# --------------------------------------------------
+# OCR worker pool
+# --------------------------------------------------
+def _get_ocr_pool() -> ProcessPoolExecutor:
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _ocr_pool_lock:
+            if _ocr_pool is None:
+                # spawn: the API process runs threads, which fork does not copy safely
+                _ocr_pool = ProcessPoolExecutor(
+                    max_workers=OCR_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _ocr_pool
+
 
-def extract_text(file: UploadFile) -> str:
+def close_ocr_pool():
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown(wait=False, cancel_futures=True)
+            _ocr_pool = None
+
+
+def _ocr_page(pdf_bytes: bytes, page_number: int, dpi: int, deadline: float) -> str | None:
     """
-    Robust resume text extraction:
-    1. Try text-based PDF extraction
-    2. Fallback to OCR for scanned PDFs
+    Worker: render one page in memory and OCR it. None if the
+    document's deadline (wall clock) passes first.
+
+    Failures are re-raised as RuntimeError: the exception is pickled back
+    to the parent, and some (e.g. pytesseract.TesseractNotFoundError)
+    cannot be unpickled, which would break the whole pool.
     """
+    try:
+        return _render_and_ocr(pdf_bytes, page_number, dpi, deadline)
+    except Exception as e:
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
 
-    filename = file.filename.lower()
 
-    if not filename.endswith(".pdf"):
-        raise ValueError("Only PDF files are supported")
+def _render_and_ocr(pdf_bytes: bytes, page_number: int, dpi: int, deadline: float) -> str | None:
+    if deadline - time.time() <= 0:
+        return None
+
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        image = pdf[page_number].render(scale=dpi / 72).to_pil()
+    finally:
+        pdf.close()
+
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        return None
+
+    try:
+        return pytesseract.image_to_string(image, timeout=remaining)
+    except RuntimeError as e:
+        if "timeout" not in str(e).lower():
+            raise
+        # pytesseract kills tesseract and raises on timeout
+        return None
+
+
+def _ocr_pages_in_process(
+    pdf_bytes: bytes,
+    page_numbers: list[int],
+    dpi: int,
+    deadline: float,
+) -> dict[int, str]:
+    """
+    OCR_WORKERS=1: pages one after another in this process, for callers
+    that are already worker processes (e.g. bulk ingestion).
+    """
+    texts = {}
+    for page_number in page_numbers:
+        try:
+            with _pdfium_lock:
+                text = _ocr_page(pdf_bytes, page_number, dpi, deadline)
+        except RuntimeError as e:
+            logger.warning("OCR failed on page %d: %s", page_number + 1, e)
+            continue
+        if text is not None:
+            texts[page_number] = text
+    return texts
+
+
+def _ocr_pages_in_pool(
+    pdf_bytes: bytes,
+    page_numbers: list[int],
+    dpi: int,
+    deadline: float,
+) -> dict[int, str]:
+    pool = _get_ocr_pool()
+
+    try:
+        futures = {
+            page_number: pool.submit(_ocr_page, pdf_bytes, page_number, dpi, deadline)
+            for page_number in page_numbers
+        }
+    except BrokenProcessPool:
+        close_ocr_pool()
+        raise
+
+    # Small grace period: workers stop tesseract themselves at the deadline
+    done, pending = wait(futures.values(), timeout=max(deadline - time.time(), 0) + 1)
+    for future in pending:
+        future.cancel()
+
+    texts = {}
+    for page_number, future in futures.items():
+        if future not in done:
+            continue
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            close_ocr_pool()
+            raise error
+        if error is not None:
+            logger.warning("OCR failed on page %d: %s", page_number + 1, error)
+        elif future.result() is not None:
+            texts[page_number] = future.result()
+
+    return texts
+
+
+def ocr_pages(
+    pdf_bytes: bytes,
+    page_numbers: list[int],
+    dpi: int = OCR_DPI,
+    time_budget: float = OCR_TIME_BUDGET_SECONDS,
+) -> dict[int, str]:
+    """
+    {page_number: OCR text} for the given pages. Pages not recognized
+    within `time_budget` seconds are left out.
+
+    With OCR_WORKERS=1 pages are recognized in the calling process
+    (no worker pool).
+    """
+    if not page_numbers:
+        return {}
+
+    deadline = time.time() + time_budget
+
+    if OCR_WORKERS <= 1:
+        texts = _ocr_pages_in_process(pdf_bytes, page_numbers, dpi, deadline)
+    else:
+        texts = _ocr_pages_in_pool(pdf_bytes, page_numbers, dpi, deadline)
+
+    if len(texts) < len(page_numbers):
+        logger.warning(
+            "OCR recognized %d of %d pages within %.0fs",
+            len(texts), len(page_numbers), time_budget,
+        )
+
+    return texts
+
+
+def ocr_pdf(
+    pdf_bytes: bytes,
+    dpi: int = OCR_DPI,
+    time_budget: float = OCR_TIME_BUDGET_SECONDS,
+) -> str:
+    """
+    OCR text of a scanned PDF (every page), pages in order.
+    """
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        page_count = len(pdf)
+        pdf.close()
+
+    texts = ocr_pages(pdf_bytes, list(range(page_count)), dpi, time_budget)
+    return "".join(texts[page_number] for page_number in sorted(texts))
+
+
+# --------------------------------------------------
+# Text layer
+# --------------------------------------------------
+def _page_needs_ocr(page: pdfium.PdfPage, text: str) -> bool:
+    """
+    Too little text and some image on the page: likely a scan.
+    (Blank pages have neither and are skipped.)
+    """
+    if len(text.strip()) >= OCR_MIN_PAGE_CHARS:
+        return False
+    return next(page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)), None) is not None
+
+
+def pdfium_page_texts(pdf_bytes: bytes) -> tuple[list[str], list[int]]:
+    """
+    Text layer of every page (pypdfium2), and the pages that need OCR.
+    """
+    texts, needs_ocr = [], []
+
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            for page_number in range(len(pdf)):
+                page = pdf[page_number]
+                textpage = page.get_textpage()
+                text = textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+
+                if _page_needs_ocr(page, text):
+                    needs_ocr.append(page_number)
+                texts.append(text)
+                page.close()
+        finally:
+            pdf.close()
+
+    return texts, needs_ocr
+
+
+def extract_text_pdfium(pdf_bytes: bytes) -> str:
+    """
+    Per-page hybrid: the text layer where there is one, OCR for
+    scanned pages only.
+    """
+    texts, needs_ocr = pdfium_page_texts(pdf_bytes)
 
-    # --------------------------------------------------
-    # Step 1: Try text-based extraction
-    # --------------------------------------------------
     try:
-        with pdfplumber.open(file.file) as pdf:
+        ocr_texts = ocr_pages(pdf_bytes, needs_ocr)
+    except Exception:
+        # Keep the text layer of the other pages
+        logger.exception("OCR failed for %d scanned page(s)", len(needs_ocr))
+        ocr_texts = {}
+
+    for page_number, text in ocr_texts.items():
+        texts[page_number] = text
+
+    return "".join(text + "\n" for text in texts if text.strip())
+
+
+def extract_text_pdfplumber(pdf_bytes: bytes) -> str:
+    """
+    Whole-document fallback: the pdfplumber text layer if any page has
+    text, OCR of every page otherwise.
+    """
+    try:
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
             text = ""
             for page in pdf.pages:
                 page_text = page.extract_text()
@@ -32,41 +283,48 @@ def extract_text(file: UploadFile) -> str:
                     text += page_text + "\n"
 
         if text.strip():
-            file.file.seek(0)  # reset pointer
             return text
 
     except Exception:
         pass  # fallback to OCR
 
-    # --------------------------------------------------
-    # Step 2: OCR fallback (scanned PDFs)
-    # --------------------------------------------------
-    try:
-        file.file.seek(0)
+    return ocr_pdf(pdf_bytes)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            images = []
 
-            with pdfplumber.open(file.file) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    image = page.to_image(resolution=300).original
-                    image_path = os.path.join(temp_dir, f"page_{i}.png")
-                    image.save(image_path)
-                    images.append(image_path)
+EXTRACTION_ENGINES = {
+    "pdfium": extract_text_pdfium,
+    "pdfplumber": extract_text_pdfplumber,
+}
 
-            ocr_text = ""
-            for img_path in images:
-                ocr_text += pytesseract.image_to_string(Image.open(img_path))
 
-            if ocr_text.strip():
-                file.file.seek(0)
-                return ocr_text
+def extract_text(file: UploadFile, engine: str | None = None) -> str:
+    """
+    Robust resume text extraction with the PDF_TEXT_ENGINE engine:
+    - pdfium: per page, text layer or OCR for scanned pages
+    - pdfplumber: text layer, or OCR of every page if there is none
+    """
+    file.file.seek(0)
+    text = extract_text_from_bytes(file.file.read(), file.filename, engine)
+    file.file.seek(0)  # reset pointer
+    return text
+
+
+def extract_text_from_bytes(pdf_bytes: bytes, filename: str, engine: str | None = None) -> str:
+    if not filename.lower().endswith(".pdf"):
+        raise ValueError("Only PDF files are supported")
+
+    extract = EXTRACTION_ENGINES[engine or PDF_TEXT_ENGINE]
+
+    try:
+        text = extract(pdf_bytes)
+        if text.strip():
+            return text
 
     except Exception:
-        pass
+        logger.exception("Text extraction failed for %s", filename)
 
     # --------------------------------------------------
-    # Step 3: Fail gracefully
+    # Fail gracefully
     # --------------------------------------------------
     raise ValueError(
         "Unable to extract text from this PDF. "
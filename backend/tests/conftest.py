@@ -0,0 +1,80 @@
+import io
+import os
+
+# Services import the DB session module, which requires a URL
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pypdfium2 as pdfium
+import pytest
+from PIL import Image, ImageDraw
+
+RESUME_LINES = [
+    "Senior Python developer with FastAPI and PostgreSQL experience",
+    "Built data pipelines on Azure with Docker and Kubernetes",
+]
+
+
+def text_pdf() -> bytes:
+    """
+    One page with a Helvetica text layer.
+    """
+    stream = ("BT /F1 10 Tf 14 TL 50 760 Td " + " ".join(f"({line}) Tj T*" for line in RESUME_LINES) + " ET").encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [5 0 R] /Count 1 >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 3 0 R >> >> /Contents 4 0 R >>",
+    ]
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def scanned_pdf() -> bytes:
+    """
+    One image-only page (no text layer).
+    """
+    image = Image.new("RGB", (850, 1100), "white")
+    draw = ImageDraw.Draw(image)
+    for row, line in enumerate(RESUME_LINES):
+        draw.text((60, 60 + row * 20), line, fill="black")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PDF", resolution=100)
+    return buffer.getvalue()
+
+
+def merge_pdfs(*documents: bytes) -> bytes:
+    pdf = pdfium.PdfDocument.new()
+    for document in documents:
+        pdf.import_pages(pdfium.PdfDocument(document))
+
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mixed_pdf() -> bytes:
+    """
+    Page 1 with a text layer, page 2 scanned.
+    """
+    return merge_pdfs(text_pdf(), scanned_pdf())
+
+
+@pytest.fixture
+def scanned_only_pdf() -> bytes:
+    return scanned_pdf()
@@ -0,0 +1,38 @@
+import pytest
+
+from app.services import chunked_search
+from app.services.semantic_search import normalize_scores, scale_scores
+
+# Raw relevance of each job to each chunk
+RAW = {
+    "first": {1: 8.0, 2: 2.0, 3: 6.0},
+    "second": {1: 3.0, 2: 9.0, 3: 1.0},
+}
+
+
+def fake_search(query_text, top_k, filters):
+    raw = RAW[query_text]
+    best = sorted(raw, key=raw.get, reverse=True)[:top_k]
+    return normalize_scores({job_id: raw[job_id] for job_id in best})
+
+
+def fake_score_jobs(query_text, job_ids, filters):
+    raw = RAW[query_text]
+    reference = max(raw.values())
+    return scale_scores({job_id: raw[job_id] for job_id in job_ids}, reference), reference
+
+
+@pytest.fixture
+def two_chunks(monkeypatch):
+    monkeypatch.setattr(chunked_search, "chunk_text", lambda text: ["first", "second"])
+    monkeypatch.setattr(chunked_search, "search_with_fallback", fake_search)
+    monkeypatch.setattr(chunked_search, "score_jobs_with_fallback", fake_score_jobs)
+
+
+def test_search_and_exact_scores_agree(two_chunks):
+    searched = chunked_search.chunked_search("resume", top_k=3)
+    exact, reference = chunked_search.chunked_score_jobs("resume", [1, 2, 3])
+
+    assert searched == exact
+    assert max(searched.values()) == 100.0
+    assert reference == 9.0
@@ -0,0 +1,69 @@
+import pickle
+
+import pytest
+
+from app.services import text_extraction
+
+
+@pytest.fixture
+def no_tesseract(tmp_path, monkeypatch):
+    """
+    OCR workers (spawned, so they inherit the environment) without a
+    tesseract binary on PATH: pytesseract raises TesseractNotFoundError,
+    which cannot be unpickled.
+    """
+    monkeypatch.setenv("PATH", str(tmp_path))
+    text_extraction.close_ocr_pool()
+    yield
+    text_extraction.close_ocr_pool()
+
+
+def test_ocr_worker_errors_are_picklable(scanned_only_pdf, monkeypatch):
+    monkeypatch.setenv("PATH", "")
+
+    with pytest.raises(RuntimeError) as error:
+        text_extraction._ocr_page(scanned_only_pdf, 0, 72, deadline=float("inf"))
+
+    assert "TesseractNotFoundError" in str(error.value)
+    assert str(pickle.loads(pickle.dumps(error.value))) == str(error.value)
+
+
+def test_ocr_worker_failure_does_not_break_pool(scanned_only_pdf, no_tesseract):
+    assert text_extraction.ocr_pages(scanned_only_pdf, [0], dpi=72, time_budget=30) == {}
+
+    pool = text_extraction._get_ocr_pool()
+    assert text_extraction.ocr_pages(scanned_only_pdf, [0], dpi=72, time_budget=30) == {}
+    assert text_extraction._get_ocr_pool() is pool
+
+
+def test_pdfium_keeps_text_layer_when_ocr_fails(mixed_pdf, monkeypatch):
+    def broken_ocr(*args, **kwargs):
+        raise text_extraction.BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(text_extraction, "ocr_pages", broken_ocr)
+
+    text = text_extraction.extract_text_from_bytes(mixed_pdf, "resume.pdf", engine="pdfium")
+    assert "Senior Python developer" in text
+
+
+def test_pdfium_fails_when_no_page_has_text(scanned_only_pdf, monkeypatch):
+    def broken_ocr(*args, **kwargs):
+        raise text_extraction.BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(text_extraction, "ocr_pages", broken_ocr)
+
+    with pytest.raises(ValueError, match="Unable to extract text"):
+        text_extraction.extract_text_from_bytes(scanned_only_pdf, "resume.pdf", engine="pdfium")
+
+
+def test_single_ocr_worker_runs_in_process(mixed_pdf, monkeypatch):
+    def no_pool():
+        raise AssertionError("OCR_WORKERS=1 must not start a worker pool")
+
+    monkeypatch.setattr(text_extraction, "OCR_WORKERS", 1)
+    monkeypatch.setattr(text_extraction, "_get_ocr_pool", no_pool)
+    monkeypatch.setattr(text_extraction.pytesseract, "image_to_string", lambda image, timeout: "Scanned cover page")
+
+    text = text_extraction.extract_text_from_bytes(mixed_pdf, "resume.pdf", engine="pdfium")
+    assert "Senior Python developer" in text
+    assert "Scanned cover page" in text
@@ -0,0 +1,134 @@
+"""
+Throughput of the sync vs async Azure AI Search backends under
+concurrent load, against a local stub search server.
+
+The stub (own process) answers the SDK's search call after a fixed
+latency. The sync path runs each search in a threadpool capped like
+FastAPI's (40 threads); the async path awaits the shared,
+connection-pooled aio client.
+
+Run from the repo root:
+    python experiments/benchmark_async_search.py
+"""
+import asyncio
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+# ================= CONFIG =================
+STUB_LATENCY_S = 0.05
+REQUESTS = 1_000
+CONCURRENCY = [10, 100, 500]
+THREADPOOL_SIZE = 40  # anyio / FastAPI default
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+PORT = free_port()
+os.environ.update({
+    "AZURE_SEARCH_ENDPOINT": f"http://127.0.0.1:{PORT}",
+    "AZURE_SEARCH_API_KEY": "stub",
+    "AZURE_SEARCH_INDEX": "jobs",
+    "DATABASE_URL": os.getenv("DATABASE_URL", "sqlite://"),
+})
+
+import anyio  # noqa: E402
+import uvicorn  # noqa: E402
+from starlette.applications import Starlette  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from app.services.semantic_search import AzureSearchBackend  # noqa: E402
+
+
+# ================= STUB SEARCH SERVER =================
+async def stub_search(request):
+    await asyncio.sleep(STUB_LATENCY_S)
+    return JSONResponse({
+        "value": [
+            {"@search.score": 10.0 - i * 0.1, "job_id": str(i + 1)}
+            for i in range(50)
+        ]
+    })
+
+
+stub_app = Starlette(routes=[
+    Route("/indexes('jobs')/docs/search.post.search", stub_search, methods=["POST"]),
+])
+
+
+def run_stub():
+    uvicorn.run(stub_app, port=PORT, log_level="warning")
+
+
+def wait_for_stub():
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", PORT), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+
+
+# ================= LOAD =================
+async def run_sync(backend, concurrency):
+    limiter = asyncio.Semaphore(concurrency)
+    threads = anyio.CapacityLimiter(THREADPOOL_SIZE)
+
+    async def one():
+        async with limiter:
+            await anyio.to_thread.run_sync(
+                backend.search, "python fastapi", 50, limiter=threads
+            )
+
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+
+
+async def run_async(backend, concurrency):
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with limiter:
+            await backend.asearch("python fastapi", 50)
+
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+
+
+async def main():
+    backend = AzureSearchBackend()
+    backend.start()
+    await backend.astart()
+
+    assert backend.search("x", 50) == await backend.asearch("x", 50)
+
+    print(f"stub latency {STUB_LATENCY_S * 1000:.0f} ms, {REQUESTS} requests")
+    print(f"{'concurrency':>12} {'sync req/s':>11} {'async req/s':>12}")
+
+    for concurrency in CONCURRENCY:
+        results = []
+        for runner in (run_sync, run_async):
+            start = time.perf_counter()
+            await runner(backend, concurrency)
+            results.append(REQUESTS / (time.perf_counter() - start))
+        print(f"{concurrency:>12} {results[0]:>11.0f} {results[1]:>12.0f}")
+
+    await backend.astop()
+
+
+if __name__ == "__main__":
+    stub = multiprocessing.Process(target=run_stub, daemon=True)
+    stub.start()
+    wait_for_stub()
+    try:
+        asyncio.run(main())
+    finally:
+        stub.terminate()
@@ -0,0 +1,85 @@
+"""
+Benchmark: BM25Index build time, postings size and query latency
+for a 1500-char resume query, at 10k and 1M synthetic jobs.
+
+Run from the repo root:
+    python experiments/benchmark_bm25.py            # 10k and 1M
+    python experiments/benchmark_bm25.py 10000      # custom sizes
+"""
+import csv
+import os
+import random
+import string
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASETS_DIR = os.path.join(BASE_DIR, "datasets")
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+import numpy as np  # noqa: E402
+
+from app.services.bm25_index import BM25Index  # noqa: E402
+
+# ================= CONFIG =================
+JOB_COUNTS = [int(n) for n in sys.argv[1:]] or [10_000, 1_000_000]
+VOCABULARY_SIZE = 50_000
+EXTRA_WORDS_PER_JOB = 40
+QUERIES = 50
+
+random.seed(42)
+
+with open(os.path.join(DATASETS_DIR, "jobs.csv"), encoding="utf-8") as f:
+    TEMPLATES = sorted({(row["title"], row["description"]) for row in csv.DictReader(f)})
+
+VOCABULARY = [
+    "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 10)))
+    for _ in range(VOCABULARY_SIZE)
+]
+# Zipf-like word frequencies, as in real text
+WEIGHTS = 1 / np.arange(1, VOCABULARY_SIZE + 1)
+WEIGHTS = (WEIGHTS / WEIGHTS.sum()).cumsum()
+
+
+def random_words(k):
+    picks = np.searchsorted(WEIGHTS, np.random.random(k))
+    return " ".join(VOCABULARY[min(i, VOCABULARY_SIZE - 1)] for i in picks)
+
+
+def job_text():
+    title, description = random.choice(TEMPLATES)
+    return f"{title}\n{description} {random_words(EXTRA_WORDS_PER_JOB)}"
+
+
+def resume_query():
+    title, description = random.choice(TEMPLATES)
+    return (description + " " + random_words(300))[:1500]
+
+
+print(f"{'jobs':>10} {'build s':>9} {'postings MB':>12} {'p50 ms':>8} {'p95 ms':>8}")
+
+for n_jobs in JOB_COUNTS:
+    np.random.seed(42)
+    index = BM25Index()
+
+    start = time.perf_counter()
+    for job_id in range(1, n_jobs + 1):
+        index.add(job_id, job_text())
+    build_s = time.perf_counter() - start
+
+    postings_mb = sum(
+        d.buffer_info()[1] * d.itemsize + t.buffer_info()[1] * t.itemsize
+        for d, t in zip(index._doc_postings, index._tf_postings)
+    ) / 1e6
+
+    latencies = []
+    for _ in range(QUERIES):
+        query = resume_query()
+        start = time.perf_counter()
+        index.search(query, top_k=50)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{n_jobs:>10} {build_s:>9.1f} {postings_mb:>12.1f} "
+        f"{np.percentile(latencies, 50):>8.2f} {np.percentile(latencies, 95):>8.2f}"
+    )
@@ -0,0 +1,76 @@
+"""
+Benchmark: wall-clock time of chunked multi-query semantic search vs a
+single prefix query, against a stub backend with a fixed per-query
+latency (stands in for an Azure AI Search round trip).
+
+Run from the repo root:
+    python experiments/benchmark_chunked_search.py
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import app.services.chunked_search as chunked  # noqa: E402
+import app.services.semantic_search as semantic  # noqa: E402
+
+# ================= CONFIG =================
+STUB_LATENCY_S = 0.05
+RESUME_CHARS = 10_000
+CONCURRENCY = [1, 2, 4, 8]
+REPEATS = 5
+
+random.seed(42)
+
+
+class StubBackend(semantic.SemanticBackend):
+    name = "stub"
+
+    def search(self, query_text, top_k=10):
+        time.sleep(STUB_LATENCY_S)
+        return self._results(query_text, top_k)
+
+    async def asearch(self, query_text, top_k=10):
+        await asyncio.sleep(STUB_LATENCY_S)
+        return self._results(query_text, top_k)
+
+    def _results(self, query_text, top_k):
+        rng = random.Random(hash(query_text))
+        return semantic.normalize_scores({
+            rng.randint(1, 1000): rng.random() for _ in range(top_k)
+        })
+
+
+semantic.SEMANTIC_BACKENDS["stub"] = StubBackend
+semantic.SEMANTIC_BACKEND = "stub"
+semantic.SEMANTIC_FALLBACK = ""
+
+words = ["python", "sql", "docker", "led", "team", "built", "services", "aws", "react"]
+resume = " ".join(random.choice(words) for _ in range(RESUME_CHARS // 6))[:RESUME_CHARS]
+n_chunks = len(chunked.chunk_text(resume))
+
+
+def timed_ms(fn):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+prefix_ms = timed_ms(lambda: semantic.search_with_fallback(resume[:1500], top_k=50))
+print(f"stub latency {STUB_LATENCY_S * 1000:.0f} ms, {RESUME_CHARS} chars -> {n_chunks} chunks")
+print(f"single prefix query: {prefix_ms:.1f} ms")
+print(f"{'concurrency':>12} {'sync ms':>9} {'async ms':>9}")
+
+for concurrency in CONCURRENCY:
+    chunked.SEMANTIC_CHUNK_CONCURRENCY = concurrency
+    chunked.close_chunk_executor()
+
+    sync_ms = timed_ms(lambda: chunked.chunked_search(resume, top_k=50))
+    async_ms = timed_ms(lambda: asyncio.run(chunked.chunked_search_async(resume, top_k=50)))
+    print(f"{concurrency:>12} {sync_ms:>9.1f} {async_ms:>9.1f}")
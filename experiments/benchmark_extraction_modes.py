@@ -0,0 +1,100 @@
+"""
+Memory / latency report for skill extraction modes.
+
+Each scenario runs in a fresh subprocess so resident memory and
+startup time are measured independently:
+- legacy: spaCy model loaded with every pipe, full pass on each call
+          (what extract_skills did before SKILL_EXTRACTION_MODE existed)
+- fast:   ontology matching only, spaCy never imported
+- nlp:    lazy spaCy load with lemmatizer pipes only
+
+Run from the repo root (needs spaCy and the model from requirements):
+    python experiments/benchmark_extraction_modes.py
+"""
+import csv
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(BASE_DIR, "backend")
+DATASETS_DIR = os.path.join(BASE_DIR, "datasets")
+
+# ================= CONFIG =================
+SCENARIOS = ["legacy", "fast", "nlp"]
+CALLS = 50
+
+
+def sample_texts():
+    with open(os.path.join(DATASETS_DIR, "jobs.csv"), encoding="utf-8") as f:
+        descriptions = [row["description"] for row in csv.DictReader(f)]
+    # Roughly resume-sized documents (~3-4k chars)
+    return [" ".join(descriptions[i:i + 20]) for i in range(0, len(descriptions), 20)]
+
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_scenario(name: str):
+    sys.path.insert(0, BACKEND_DIR)
+    texts = sample_texts()
+    base_rss = rss_mb()
+    start = time.perf_counter()
+
+    if name == "legacy":
+        import spacy
+        from app.services.skill_extraction import SPACY_MODEL, clean_text, _matcher
+
+        nlp = spacy.load(SPACY_MODEL)
+
+        def extract(text):
+            cleaned = clean_text(text)
+            nlp(cleaned)
+            return sorted(_matcher.find(cleaned))
+    else:
+        from app.services.skill_extraction import extract_skills
+
+        def extract(text):
+            return extract_skills(text, mode=name)
+
+    extract(texts[0])
+    startup_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(CALLS):
+        extract(texts[i % len(texts)])
+    per_call_ms = (time.perf_counter() - start) / CALLS * 1000
+
+    print(json.dumps({
+        "scenario": name,
+        "startup_s": round(startup_s, 3),
+        "per_call_ms": round(per_call_ms, 3),
+        "rss_mb": round(rss_mb() - base_rss, 1),
+        "spacy_loaded": "spacy" in sys.modules,
+    }))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        run_scenario(sys.argv[1])
+        sys.exit(0)
+
+    print(f"{'mode':>8} {'startup s':>10} {'per call ms':>12} {'extra RSS MB':>13}  spacy")
+    for scenario in SCENARIOS:
+        proc = subprocess.run(
+            [sys.executable, __file__, scenario],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{scenario:>8}  failed: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{r['scenario']:>8} {r['startup_s']:>10} {r['per_call_ms']:>12} "
+            f"{r['rss_mb']:>13}  {r['spacy_loaded']}"
+        )
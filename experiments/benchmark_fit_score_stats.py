@@ -0,0 +1,93 @@
+"""
+Benchmark: recruiter fit-score distribution computed by loading every
+application row (previous implementation) vs the application_counts
+rollup (application_stats.fit_score_bands / fit_score_histogram with
+whole edges) vs one aggregating query (histogram with other edges).
+
+Uses an in-memory SQLite database; Postgres behaves alike (rollup reads
+touch ~100 rows whatever the table size; the aggregate is a single scan,
+no rows cross the wire).
+
+Run from the repo root:
+    python experiments/benchmark_fit_score_stats.py
+"""
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db.models import Application, ApplicationCount, Base  # noqa: E402
+from app.services.application_stats import (  # noqa: E402
+    HISTOGRAM_DEFAULT_EDGES,
+    fit_score_bands,
+    fit_score_histogram,
+    rebuild_application_counts,
+)
+
+# ================= CONFIG =================
+APPLICATION_COUNTS = [10_000, 100_000, 500_000]
+REPEATS = 3
+SCAN_EDGES = [0, 12.5, 25, 37.5, 50, 62.5, 75, 87.5, 100]  # not whole: aggregate query
+
+random.seed(42)
+
+
+def python_bands(db):
+    strong = good = average = 0
+    for app in db.query(Application).all():
+        if app.fit_score >= 80:
+            strong += 1
+        elif app.fit_score >= 60:
+            good += 1
+        else:
+            average += 1
+    return strong, good, average
+
+
+def best_ms(fn):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+print(
+    f"{'applications':>12} {'python ms':>10} {'rollup bands ms':>16} "
+    f"{'rollup hist ms':>15} {'scan hist ms':>13}"
+)
+
+for size in APPLICATION_COUNTS:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Application.__table__, ApplicationCount.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Application), [
+            {
+                "user_id": 1,
+                "job_id": random.randint(1, 500),
+                "fit_score": round(random.uniform(0, 100), 2),
+                "skill_score": 0.0,
+                "semantic_score": 0.0,
+            }
+            for _ in range(size)
+        ])
+
+    db = sessionmaker(bind=engine)()
+    rebuild_application_counts(db)
+
+    python_ms = best_ms(lambda: (db.expunge_all(), python_bands(db)))
+    bands_ms = best_ms(lambda: fit_score_bands(db))
+    hist_ms = best_ms(lambda: fit_score_histogram(db, HISTOGRAM_DEFAULT_EDGES))
+    scan_ms = best_ms(lambda: fit_score_histogram(db, SCAN_EDGES))
+
+    print(f"{size:>12} {python_ms:>10.1f} {bands_ms:>16.1f} {hist_ms:>15.1f} {scan_ms:>13.1f}")
+
+    db.close()
+    engine.dispose()
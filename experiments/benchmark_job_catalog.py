@@ -0,0 +1,80 @@
+"""
+Benchmark: batch skill scoring over the in-memory job catalog snapshot
+vs the per-job Python loop (set intersections over ORM-like rows).
+
+Run from the repo root:
+    python experiments/benchmark_job_catalog.py
+"""
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+import numpy as np  # noqa: E402
+
+from app.core.skill_ontology import SKILL_ONTOLOGY  # noqa: E402
+from app.services.job_catalog import JobCatalogSnapshot  # noqa: E402
+
+# ================= CONFIG =================
+CATALOG_SIZES = [1_000, 10_000, 100_000]
+REPEATS = 10
+
+random.seed(42)
+SKILLS = list(SKILL_ONTOLOGY)
+
+
+def random_skills():
+    return random.sample(SKILLS, random.randint(2, 10))
+
+
+def loop_score(jobs, resume_skills):
+    results = []
+    for job_id, job_skills in jobs:
+        matched = resume_skills & job_skills
+        skill_score = len(matched) / len(job_skills) * 100 if job_skills else 0.0
+        results.append({
+            "job_id": job_id,
+            "skill_score": round(skill_score, 2),
+            "matched_skills": sorted(matched),
+        })
+    results.sort(key=lambda r: r["skill_score"], reverse=True)
+    return results
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn(*args)
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+print(f"{'jobs':>8} {'build ms':>10} {'loop ms':>10} {'batch ms':>10} {'speedup':>8}")
+
+for size in CATALOG_SIZES:
+    jobs = [(job_id, set(random_skills())) for job_id in range(1, size + 1)]
+    resume_skills = set(random_skills())
+
+    start = time.perf_counter()
+    catalog = JobCatalogSnapshot()
+    for job_id, skills in jobs:
+        catalog.upsert(job_id, skills, "active", "Full-time", "Remote")
+    build_ms = (time.perf_counter() - start) * 1000
+
+    def batch_score():
+        scored = catalog.score(resume_skills)
+        return np.argsort(-scored["skill_scores"], kind="stable")
+
+    scored = catalog.score(resume_skills)
+    expected = {r["job_id"]: r["skill_score"] for r in loop_score(jobs, resume_skills)}
+    assert all(
+        abs(expected[int(j)] - round(float(s), 2)) < 1e-9
+        for j, s in zip(scored["job_ids"], scored["skill_scores"])
+    )
+
+    loop_ms = timed(loop_score, jobs, resume_skills)
+    batch_ms = timed(batch_score)
+
+    print(f"{size:>8} {build_ms:>10.1f} {loop_ms:>10.2f} {batch_ms:>10.2f} {loop_ms / batch_ms:>7.1f}x")
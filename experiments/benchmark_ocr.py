@@ -0,0 +1,91 @@
+"""
+Benchmark: OCR fallback on a 10-page scanned resume.
+
+- legacy:   render every page to a PNG in a temp dir, reopen them and
+            OCR one page at a time (what extract_text did before)
+- parallel: text_extraction.ocr_pdf (in-memory pages on the OCR
+            process pool, OCR_WORKERS processes)
+
+The scanned PDF is generated: each page is an image of resume text, so
+there is no text layer and extract_text has to fall back to OCR.
+
+Run from the repo root (needs the tesseract binary):
+    python experiments/benchmark_ocr.py
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+import pdfplumber  # noqa: E402
+import pytesseract  # noqa: E402
+from PIL import Image, ImageDraw  # noqa: E402
+
+from app.services.text_extraction import OCR_WORKERS, close_ocr_pool, ocr_pdf  # noqa: E402
+
+# ================= CONFIG =================
+PAGES = 10
+REPEATS = 3
+
+LINES = [
+    "Senior Software Engineer - Python, FastAPI, PostgreSQL, Docker",
+    "Built data pipelines on Azure with Kubernetes and Terraform",
+    "Led a team of five engineers delivering machine learning services",
+    "Skills: Python, SQL, AWS, React, TypeScript, Git, CI/CD, Linux",
+]
+
+
+def scanned_pdf(pages: int) -> bytes:
+    images = []
+    for page in range(pages):
+        image = Image.new("RGB", (1700, 2200), "white")  # letter @ 200 DPI
+        draw = ImageDraw.Draw(image)
+        for row in range(60):
+            draw.text((120, 120 + row * 32), f"{page + 1}.{row + 1} {LINES[row % len(LINES)]}", fill="black")
+        images.append(image)
+
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="PDF", save_all=True, append_images=images[1:], resolution=200)
+    return buffer.getvalue()
+
+
+def legacy_ocr(pdf_bytes: bytes) -> str:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            for i, page in enumerate(pdf.pages):
+                path = os.path.join(temp_dir, f"page_{i}.png")
+                page.to_image(resolution=300).original.save(path)
+                paths.append(path)
+
+        return "".join(pytesseract.image_to_string(Image.open(path)) for path in paths)
+
+
+def best_s(fn) -> tuple[float, str]:
+    timings, result = [], ""
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+if __name__ == "__main__":
+    pdf_bytes = scanned_pdf(PAGES)
+
+    # Warm the pool (process start-up is paid once per API process)
+    ocr_pdf(scanned_pdf(1))
+
+    legacy_s, legacy_text = best_s(lambda: legacy_ocr(pdf_bytes))
+    parallel_s, parallel_text = best_s(lambda: ocr_pdf(pdf_bytes))
+    close_ocr_pool()
+
+    print(f"pages={PAGES} workers={OCR_WORKERS} cpus={os.cpu_count()}")
+    print(f"{'mode':>9} {'wall s':>8}")
+    print(f"{'legacy':>9} {legacy_s:>8.2f}")
+    print(f"{'parallel':>9} {parallel_s:>8.2f}")
+    print(f"speed-up x{legacy_s / parallel_s:.1f}; same text: {legacy_text == parallel_text}")
@@ -0,0 +1,116 @@
+"""
+Benchmark: PDF text extraction engines (text_extraction.PDF_TEXT_ENGINE).
+
+- pdfplumber: text layer of the whole document, OCR of every page only
+              if no page has text (previous behaviour)
+- pdfium:     pypdfium2 text layer per page, OCR only for pages without
+              one
+
+Documents:
+- text:  8-page digital resume (text layer only)
+- mixed: the same resume behind a scanned cover page. pdfplumber
+         finds text, so it skips OCR and silently drops the cover page;
+         pdfium OCRs that single page.
+
+Run from the repo root (OCR needs the tesseract binary):
+    python experiments/benchmark_pdf_engines.py
+"""
+import io
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+import pypdfium2 as pdfium  # noqa: E402
+
+from app.services.text_extraction import (  # noqa: E402
+    EXTRACTION_ENGINES,
+    close_ocr_pool,
+    pdfium_page_texts,
+)
+from benchmark_ocr import LINES, scanned_pdf  # noqa: E402
+
+# ================= CONFIG =================
+TEXT_PAGES = 8
+REPEATS = 5
+
+
+def text_pdf(pages: int) -> bytes:
+    """
+    Minimal PDF with a Helvetica text layer (no PDF library needed).
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+
+    for page in range(pages):
+        lines = [
+            f"({page + 1}.{row + 1} {LINES[row % len(LINES)]}) Tj T*"
+            for row in range(50)
+        ]
+        stream = ("BT /F1 10 Tf 14 TL 50 760 Td " + " ".join(lines) + " ET").encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def with_scanned_cover(pdf_bytes: bytes) -> bytes:
+    pdf = pdfium.PdfDocument(scanned_pdf(1))
+    pdf.import_pages(pdfium.PdfDocument(pdf_bytes))
+    out = io.BytesIO()
+    pdf.save(out)
+    return out.getvalue()
+
+
+def best_ms(fn) -> tuple[float, str]:
+    timings, result = [], ""
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), result
+
+
+if __name__ == "__main__":
+    documents = {"text": text_pdf(TEXT_PAGES)}
+    documents["mixed"] = with_scanned_cover(documents["text"])
+
+    print(f"{'document':>9} {'engine':>11} {'ms':>9} {'chars':>7} {'ocr pages':>10}")
+
+    for name, pdf_bytes in documents.items():
+        _, needs_ocr = pdfium_page_texts(pdf_bytes)
+
+        for engine, extract in EXTRACTION_ENGINES.items():
+            ms, text = best_ms(lambda: extract(pdf_bytes))
+            if engine == "pdfium":
+                ocr_count = len(needs_ocr)
+            else:
+                ocr_count = 0 if text.strip() else len(pdfium.PdfDocument(pdf_bytes))
+            print(f"{name:>9} {engine:>11} {ms:>9.1f} {len(text):>7} {ocr_count:>10}")
+
+    close_ocr_pool()
@@ -0,0 +1,119 @@
+"""
+Micro-benchmark: compiled SkillMatcher vs the original triple-loop
+extract_skills, at 50, 1k and 10k ontology entries.
+
+Run from the repo root:
+    python experiments/benchmark_skill_matcher.py
+"""
+import os
+import random
+import re
+import string
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+from app.core.skill_ontology import SKILL_ONTOLOGY  # noqa: E402
+from app.services.skill_matcher import SkillMatcher  # noqa: E402
+
+# ================= CONFIG =================
+ONTOLOGY_SIZES = [50, 1_000, 10_000]
+RESUME_WORDS = 800
+REPEATS = 20
+
+random.seed(42)
+
+
+# ================= ORIGINAL IMPLEMENTATION =================
+def clean_text(text: str) -> str:
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9+,\s]", " ", text)
+    return text
+
+
+def legacy_extract(cleaned_text: str, ontology: dict) -> set:
+    found_skills = set()
+
+    for canonical, variants in ontology.items():
+        for variant in variants:
+            if len(variant) <= 2:
+                continue
+            if variant in cleaned_text:
+                found_skills.add(canonical)
+
+    for canonical, variants in ontology.items():
+        for variant in variants:
+            if len(variant) <= 2:
+                pattern = rf"\b{re.escape(variant)}\b"
+                if re.search(pattern, cleaned_text):
+                    found_skills.add(canonical)
+
+    chunks = re.split(r",|\n|•|-", cleaned_text)
+    for chunk in chunks:
+        chunk = chunk.strip()
+        for canonical, variants in ontology.items():
+            if chunk in variants:
+                found_skills.add(canonical)
+
+    return found_skills
+
+
+# ================= HELPERS =================
+def random_word(min_len=2, max_len=10):
+    return "".join(
+        random.choices(string.ascii_lowercase, k=random.randint(min_len, max_len))
+    )
+
+
+def build_ontology(size: int) -> dict:
+    ontology = dict(list(SKILL_ONTOLOGY.items())[:size])
+    while len(ontology) < size:
+        words = [random_word() for _ in range(random.randint(1, 3))]
+        canonical = " ".join(words)
+        variants = [canonical]
+        if random.random() < 0.3:
+            variants.append(random_word(1, 2))
+        ontology[canonical] = variants
+    return ontology
+
+
+def build_resume(ontology: dict) -> str:
+    variants = [v for vs in ontology.values() for v in vs]
+    words = []
+    for _ in range(RESUME_WORDS):
+        if random.random() < 0.08:
+            words.append(random.choice(variants))
+        else:
+            words.append(random_word())
+        if random.random() < 0.1:
+            words.append(random.choice([",", "\n", "•", "-"]))
+    return " ".join(words)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = fn(*args)
+    return result, (time.perf_counter() - start) / REPEATS * 1000
+
+
+# ================= RUN =================
+print(f"{'entries':>8} {'build ms':>10} {'legacy ms':>10} {'matcher ms':>11} {'speedup':>8}  same")
+
+for size in ONTOLOGY_SIZES:
+    ontology = build_ontology(size)
+    cleaned = clean_text(build_resume(ontology))
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(ontology)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    legacy_result, legacy_ms = timed(legacy_extract, cleaned, ontology)
+    matcher_result, matcher_ms = timed(matcher.find, cleaned)
+
+    print(
+        f"{size:>8} {build_ms:>10.2f} {legacy_ms:>10.2f} {matcher_ms:>11.2f} "
+        f"{legacy_ms / matcher_ms:>7.1f}x  {legacy_result == matcher_result}"
+    )
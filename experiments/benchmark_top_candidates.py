@@ -0,0 +1,55 @@
+"""
+Benchmark: recruiter-side skill pass (ResumeCatalogSnapshot.top_for_job)
+over growing resume tables. The semantic stage that follows only sees
+the fixed-size pool, so this pass is the part that scales with resumes.
+
+Run from the repo root:
+    python experiments/benchmark_top_candidates.py
+"""
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+import numpy as np  # noqa: E402
+
+from app.core.skill_ontology import SKILL_ONTOLOGY  # noqa: E402
+from app.services.resume_catalog import ResumeCatalogSnapshot  # noqa: E402
+
+# ================= CONFIG =================
+RESUME_COUNTS = [10_000, 100_000, 500_000]
+POOL = 50
+QUERIES = 50
+
+random.seed(42)
+SKILLS = list(SKILL_ONTOLOGY)
+
+
+def random_skills():
+    return random.sample(SKILLS, random.randint(2, 12))
+
+
+print(f"{'resumes':>9} {'build s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+
+for size in RESUME_COUNTS:
+    catalog = ResumeCatalogSnapshot()
+
+    start = time.perf_counter()
+    for resume_id in range(1, size + 1):
+        catalog.upsert(resume_id, random.randint(1, size // 2), random_skills())
+    build_s = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(QUERIES):
+        job_skills = random_skills()
+        start = time.perf_counter()
+        catalog.top_for_job(job_skills, POOL)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{size:>9} {build_s:>8.1f} "
+        f"{np.percentile(latencies, 50):>8.2f} {np.percentile(latencies, 95):>8.2f}"
+    )
@@ -0,0 +1,83 @@
+"""
+Benchmark: skill candidate generation from the job catalog's inverted
+index vs a full-catalog skill scoring pass, and how many of the best
+skill matches the semantic top-50 alone would have missed.
+
+Semantic results are simulated as 50 random active jobs, i.e. wording
+unrelated to skills, which is the case two-stage retrieval targets.
+Recall compares score levels, since many jobs tie on skill coverage.
+
+Run from the repo root:
+    python experiments/benchmark_two_stage.py
+"""
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "backend"))
+
+import numpy as np  # noqa: E402
+
+from app.core.skill_ontology import SKILL_ONTOLOGY  # noqa: E402
+from app.services.job_catalog import JobCatalogSnapshot  # noqa: E402
+
+# ================= CONFIG =================
+CATALOG_SIZES = [10_000, 100_000]
+CANDIDATES = [50, 200, 1000]
+SEMANTIC_TOP_K = 50
+QUERIES = 50
+
+random.seed(42)
+SKILLS = list(SKILL_ONTOLOGY)
+
+
+def random_skills():
+    return random.sample(SKILLS, random.randint(2, 10))
+
+
+def recall(best, job_ids, skill_by_id):
+    """
+    Share of the catalog's top-10 skill scores reached by the best 10
+    jobs in `job_ids` (ties count as hits).
+    """
+    found = np.sort([skill_by_id[j] for j in job_ids])[::-1][:10]
+    found = np.pad(found, (0, len(best) - len(found)))
+    return float(np.mean(found >= best - 1e-9))
+
+
+def timed_ms(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+print(f"{'jobs':>8} {'cands':>6} {'full ms':>9} {'index ms':>9} {'top-10 skill recall':>20}")
+
+for size in CATALOG_SIZES:
+    catalog = JobCatalogSnapshot()
+    for job_id in range(1, size + 1):
+        catalog.upsert(job_id, random_skills(), "active", "Full-time", "Remote")
+
+    queries = [set(random_skills()) for _ in range(QUERIES)]
+    for n_candidates in CANDIDATES:
+        full_ms, index_ms, semantic_recall, two_stage_recall = [], [], [], []
+
+        for resume_skills in queries:
+            scored, ms = timed_ms(lambda: catalog.score(resume_skills))
+            full_ms.append(ms)
+            skill_by_id = dict(zip(scored["job_ids"].tolist(), scored["skill_scores"].tolist()))
+            best = np.sort(scored["skill_scores"])[::-1][:10]
+
+            candidates, ms = timed_ms(lambda: catalog.candidates(resume_skills, n_candidates))
+            index_ms.append(ms)
+
+            semantic = set(random.sample(range(1, size + 1), SEMANTIC_TOP_K))
+            semantic_recall.append(recall(best, semantic, skill_by_id))
+            two_stage_recall.append(recall(best, semantic | set(candidates.tolist()), skill_by_id))
+
+        print(
+            f"{size:>8} {n_candidates:>6} {np.median(full_ms):>9.2f} {np.median(index_ms):>9.2f} "
+            f"{np.mean(semantic_recall):>9.2f} -> {np.mean(two_stage_recall):.2f}"
+        )
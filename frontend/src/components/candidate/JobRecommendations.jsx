@@ -68,12 +68,10 @@ const JobRecommendations = () => {
     try {
       const userData = JSON.parse(localStorage.getItem('user') || '{}');
       const userId = userData.id || userData.user_id || 1;
-      const response = await candidateAPI.getApplications(userId);
-      const applications = response.data.applications || [];
+      // Applications are per user and job (not per resume)
+      const applications = await candidateAPI.getAllAppliedJobs(userId);
       const appliedJobIds = new Set(
-        applications
-          .filter(app => app.resume_id === selectedResumeId)
-          .map(app => `${app.job_id}-${app.resume_id}`)
+        applications.map(app => `${app.job_id}-${selectedResumeId}`)
       );
       setAppliedJobs(appliedJobIds);
     } catch (err) {
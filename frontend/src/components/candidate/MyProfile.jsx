@@ -61,8 +61,7 @@ const MyProfile = ({ onDeleteResume }) => {
       const userId = userData.id || userData.user_id || 1;
 
       console.log('Fetching applications for user:', userId);
-      const response = await candidateAPI.getAppliedJobs(userId);
-      const applicationsData = response.data || [];
+      const applicationsData = await candidateAPI.getAllAppliedJobs(userId);
       
       console.log('Applications data:', applicationsData);
 
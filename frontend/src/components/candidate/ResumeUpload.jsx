@@ -2,6 +2,10 @@ import React, { useState } from 'react';
 import { Upload, FileText, Award, Zap, AlertCircle, Image } from 'lucide-react';
 import { resumeAPI } from '../../services/api';
 
+// Status polling: every second, for at most 2 minutes
+const STATUS_POLL_INTERVAL_MS = 1000;
+const MAX_STATUS_POLLS = 120;
+
 const ResumeUpload = ({ onResumeUploaded, onNavigateToJobs }) => {
   const [resumeFile, setResumeFile] = useState(null);
   const [uploading, setUploading] = useState(false);
@@ -94,8 +98,18 @@ const ResumeUpload = ({ onResumeUploaded, onNavigateToJobs }) => {
       setUploadSteps(s => ({ ...s, processing: 'processing' }));
       setUploadProgress(45);
 
-      // Simulate processing time
-      await new Promise(resolve => setTimeout(resolve, 1000));
+      // Parsing runs in the background: poll until it finishes (or give up)
+      let status = (await resumeAPI.getResumeStatus(response.data.resume_id, userId)).data;
+      for (let polls = 0; status.status === 'processing'; polls++) {
+        if (polls >= MAX_STATUS_POLLS) {
+          throw new Error('Resume processing is taking longer than expected. Please check your resumes again in a few minutes.');
+        }
+        await new Promise(resolve => setTimeout(resolve, STATUS_POLL_INTERVAL_MS));
+        status = (await resumeAPI.getResumeStatus(response.data.resume_id, userId)).data;
+      }
+      if (status.status === 'failed') {
+        throw new Error(status.error || 'Resume processing failed.');
+      }
       
       setUploadProgress(60);
       setUploadSteps(s => ({ ...s, processing: 'complete' }));
@@ -114,10 +128,10 @@ const ResumeUpload = ({ onResumeUploaded, onNavigateToJobs }) => {
       const newResume = {
         id: response.data.resume_id,
         fileName: response.data.filename,
-        uploadDate: response.data.uploaded_at || new Date().toISOString(),
+        uploadDate: status.uploaded_at || new Date().toISOString(),
         fileUrl: response.data.file_url,
-        skills: response.data.skills || [],
-        totalSkills: response.data.total_skills_found || 0
+        skills: status.skills || [],
+        totalSkills: status.total_skills_found || 0
       };
 
       // Call parent callback to refresh resume count
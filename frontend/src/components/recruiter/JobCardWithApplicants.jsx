@@ -24,8 +24,7 @@ const JobApplicantsView = ({ job, onBack }) => {
     setLoading(true);
     setError(null);
     try {
-      const response = await applicationAPI.getApplicationsForJob(job.id);
-      setApplicants(response.data.applications || []);
+      setApplicants(await applicationAPI.getAllApplicationsForJob(job.id));
     } catch (err) {
       console.error('Error fetching applicants:', err);
       setError('Failed to load applicants. Please try again.');
@@ -73,6 +73,9 @@ export const resumeAPI = {
     });
   },
 
+  getResumeStatus: (resumeId, userId) =>
+    api.get(`/candidate/resume/${resumeId}/status`, { params: { user_id: userId } }),
+
   getAllResumes: (userId) =>
     api.get('/candidate/resumes', { params: { user_id: userId } }),
 
@@ -97,6 +100,22 @@ export const resumeAPI = {
   },
 };
 
+/* -------------------- CURSOR PAGINATION -------------------- */
+// Paginated list endpoints return { [key]: [...], next_cursor }.
+// Follows next_cursor until the last page and returns every item.
+const PAGE_SIZE = 100;
+
+export const fetchAllPages = async (fetchPage, key) => {
+  const items = [];
+  let cursor = null;
+  do {
+    const response = await fetchPage(cursor);
+    items.push(...(response.data[key] || []));
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return items;
+};
+
 /* ==================== CANDIDATE APIs ==================== */
 export const candidateAPI = {
   getRecommendedJobs: (userId, resumeId, limit = 5) =>
@@ -119,11 +138,14 @@ export const candidateAPI = {
       params: { difficulty: difficulty.toLowerCase() },
     }),
 
-  getAppliedJobs: (userId) =>
+  getAppliedJobs: (userId, cursor = null) =>
     api.get('/candidate/applications', {
-      params: { user_id: userId },
+      params: { user_id: userId, limit: PAGE_SIZE, ...(cursor && { cursor }) },
     }),
 
+  getAllAppliedJobs: (userId) =>
+    fetchAllPages((cursor) => candidateAPI.getAppliedJobs(userId, cursor), 'applications'),
+
   withdrawApplication: (applicationId) =>
     api.delete(`/candidate/${applicationId}/hard`),
 };
@@ -141,8 +163,13 @@ export const applicationAPI = {
   getFitScoreDistribution: (jobId) =>
     api.get(`/analytics/${jobId}/fit-score-distribution`),
 
-  getApplicationsForJob: (jobId) =>
-    api.get(`/analytics/${jobId}/applications`),
+  getApplicationsForJob: (jobId, cursor = null) =>
+    api.get(`/analytics/${jobId}/applications`, {
+      params: { limit: PAGE_SIZE, ...(cursor && { cursor }) },
+    }),
+
+  getAllApplicationsForJob: (jobId) =>
+    fetchAllPages((cursor) => applicationAPI.getApplicationsForJob(jobId, cursor), 'applications'),
 
   updateApplicationStatus: (applicationId, status) =>
     api.put(`/analytics/${applicationId}/status`, null, {